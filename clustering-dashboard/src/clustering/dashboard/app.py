@@ -17,7 +17,8 @@ from plotly.subplots import make_subplots
 import base64
 
 from clustering.dashboard.components.pygwalker_view import get_pyg_renderer
-from clustering.shared.utils.io.readers import SnowflakeReader
+from clustering.shared.io import QueryCache
+from clustering.shared.io.readers import SnowflakeReader
 
 
 @st.cache_data
@@ -61,10 +62,13 @@ def load_data(file_path: Path | str, file_type: str | None = None) -> pd.DataFra
         return pd.DataFrame()
 
 
-@st.cache_data
 def load_snowflake_data(query: str, use_cache: bool = True) -> pd.DataFrame:
     """Load data from Snowflake with caching.
 
+    Results are cached by the SnowflakeReader in the query cache shared with
+    the pipeline, which expires and evicts entries, so they are not memoized
+    again in the Streamlit process.
+
     Args:
         query: SQL query to execute against Snowflake
         use_cache: Whether to use local caching for the query
@@ -1080,6 +1084,11 @@ def main():
                     st.success(
                         f"✅ Successfully loaded {len(st.session_state.data):,} rows from Snowflake"
                     )
+                    stats = QueryCache().stats()
+                    st.caption(
+                        f"Query cache: {stats['hits']:,} hits, {stats['misses']:,} misses, "
+                        f"{stats['entries']:,} entries ({stats['size_bytes'] / 1024**2:,.1f} MB)"
+                    )
                 else:
                     st.error("❌ No data returned from Snowflake query")
 
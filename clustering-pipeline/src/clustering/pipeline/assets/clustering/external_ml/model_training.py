@@ -382,6 +382,7 @@ def external_save_clustering_models(
 
 @dg.asset(
     name="external_assign_clusters",
+    io_manager_key="columnar_io_manager",
     description="Assigns clusters to external data points using trained models",
     group_name="cluster_assignment",
     compute_kind="external_cluster_assignment",
@@ -385,6 +385,7 @@ def internal_save_clustering_models(
 
 @dg.asset(
     name="internal_assign_clusters",
+    io_manager_key="columnar_io_manager",
     description="Assigns clusters to data points using trained models",
     group_name="cluster_assignment",
     compute_kind="internal_cluster_assignment",
@@ -530,8 +531,8 @@ def internal_save_cluster_assignments(
         combined_data.append(category_df)
 
     if combined_data:
-        # Combine all dataframes
-        all_assignments = pl.concat(combined_data)
+        # Combine all dataframes; categories carry different need-state feature columns
+        all_assignments = pl.concat(combined_data, how="diagonal")
 
         # Write the combined data
         context.log.info(f"Saving combined assignments with {len(all_assignments)} records")
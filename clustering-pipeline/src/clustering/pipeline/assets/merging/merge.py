@@ -1,110 +1,55 @@
 """Cluster merging assets for the clustering pipeline."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import dagster as dg
 import numpy as np
 import polars as pl
-from sklearn.metrics import pairwise_distances
+import pyarrow as pa
 
-from clustering.shared.io.readers.pickle_reader import PickleReader
+from clustering.pipeline.assets.merging.rebalance import (
+    feature_columns,
+    rebalance_clusters,
+    standardize_features,
+)
+
+# Bits reserved for the external cluster code in a packed merged cluster id
+EXTERNAL_CODE_BITS = 32
 
 
 @dg.asset(
-    io_manager_key="io_manager",
+    io_manager_key="columnar_io_manager",
     compute_kind="merging",
     group_name="merging",
-    deps=["internal_save_cluster_assignments", "external_save_cluster_assignments"],
-    required_resource_keys={"internal_cluster_assignments", "external_cluster_assignments"},
+    required_resource_keys={"job_params"},
 )
 def merged_clusters(
     context: dg.AssetExecutionContext,
+    internal_assign_clusters: dict[str, pl.DataFrame],
+    external_assign_clusters: pl.DataFrame,
 ) -> pl.DataFrame:
-    """Load and merge internal and external cluster assignments.
+    """Merge internal and external cluster assignments.
+
+    Every internal category is joined with the shared external assignments on a
+    worker pool, and the per-category results are stacked with a category column.
+    Both inputs are handed over by the columnar IO manager, so no pickle files
+    are re-read here.
 
     Args:
         context: Asset execution context
+        internal_assign_clusters: Internal cluster assignments keyed by category
+        external_assign_clusters: External cluster assignments
 
     Returns:
-        DataFrame containing merged cluster assignments
+        DataFrame containing merged cluster assignments for all categories
     """
-    context.log.info("Loading internal and external cluster assignments")
-
-    # Get the paths from the writer resources
-    internal_path = context.resources.internal_cluster_assignments.path
-    external_path = context.resources.external_cluster_assignments.path
-
-    # Create readers using the same paths as the writers
-    internal_reader = PickleReader(path=internal_path)
-    external_reader = PickleReader(path=external_path)
-
-    # Load internal and external cluster assignments
-    try:
-        internal_clusters = internal_reader.read()
-    except FileNotFoundError:
-        context.log.error(f"Internal clusters file not found: {internal_path}")
-
-        # Check for alternative internal data paths for testing
-        alternative_paths = [
-            internal_path.replace("cluster_assignments.pkl", "test_clusters.pkl"),
-            "/workspaces/testing-dagster/data/internal/test_data.pkl",
-        ]
-
-        for alt_path in alternative_paths:
-            if os.path.exists(alt_path):
-                context.log.warning(f"Attempting to use alternative internal file: {alt_path}")
-                try:
-                    internal_reader = PickleReader(path=alt_path)
-                    internal_clusters = internal_reader.read()
-                    context.log.info(f"Successfully loaded alternative internal file: {alt_path}")
-                    break
-                except Exception as e:
-                    context.log.error(f"Error loading alternative file {alt_path}: {str(e)}")
-        else:  # No alternative found
-            raise ValueError(
-                f"Internal clusters file not found at {internal_path} and no valid alternatives found. "
-                f"You may need to run the upstream assets that generate these files first."
-            )
-    except Exception as e:
-        context.log.error(f"Error reading internal cluster assignments: {str(e)}")
-        raise ValueError(f"Could not read internal cluster assignments: {str(e)}") from e
-
-    try:
-        external_clusters = external_reader.read()
-    except FileNotFoundError:
-        context.log.error(f"External clusters file not found: {external_path}")
-
-        # Check for alternative external data paths for testing
-        alternative_paths = [
-            external_path.replace("cluster_assignments.pkl", "external_data.pkl"),
-            "/workspaces/testing-dagster/data/external/test_data.pkl",
-        ]
-
-        for alt_path in alternative_paths:
-            if os.path.exists(alt_path):
-                context.log.warning(f"Attempting to use alternative external file: {alt_path}")
-                try:
-                    external_reader = PickleReader(path=alt_path)
-                    external_clusters = external_reader.read()
-                    context.log.info(f"Successfully loaded alternative external file: {alt_path}")
-                    break
-                except Exception as e:
-                    context.log.error(f"Error loading alternative file {alt_path}: {str(e)}")
-        else:  # No alternative found
-            raise ValueError(
-                f"External clusters file not found at {external_path} and no valid alternatives found. "
-                f"You may need to run the upstream assets that generate these files first."
-            )
-    except Exception as e:
-        context.log.error(f"Error reading external cluster assignments: {str(e)}")
-        raise ValueError(f"Could not read external cluster assignments: {str(e)}") from e
+    internal_clusters = internal_assign_clusters
+    external_clusters = external_assign_clusters
 
-    # If reading returned dictionaries (multiple categories), merge them
-    if isinstance(internal_clusters, dict):
-        # Use the first category if multiple exist
-        internal_category = next(iter(internal_clusters.keys()))
-        context.log.info(f"Using internal category: {internal_category}")
-        internal_clusters = internal_clusters[internal_category]
+    # Split internal assignments into one frame per category
+    internal_by_category = _split_by_category(internal_clusters)
+    context.log.info(f"Merging {len(internal_by_category)} internal categories")
 
     if isinstance(external_clusters, dict):
         # Use the default category for external data
@@ -114,6 +59,129 @@ def merged_clusters(
         context.log.info(f"Using external category: {external_category}")
         external_clusters = external_clusters[external_category]
 
+    # External clusters are shared by every internal category
+    external_category_col = _find_column(external_clusters, "category")
+    if external_category_col:
+        external_clusters = external_clusters.drop(external_category_col)
+
+    # Merge every category on a worker pool and stack the results
+    max_workers = getattr(context.resources.job_params, "merge_max_workers", None)
+    # A shared string cache keeps the per-category label dictionaries compatible
+    with pl.StringCache(), ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_merge_category, context, category, frame, external_clusters)
+            for category, frame in internal_by_category.items()
+        ]
+        merged = pl.concat([future.result() for future in futures], how="diagonal")
+
+    context.log.info(
+        f"Created {merged.select(pl.struct('category', 'merged_cluster').n_unique()).item()} "
+        f"merged clusters across {len(internal_by_category)} categories"
+    )
+
+    return merged
+
+
+def pack_cluster_ids(internal_column: str, external_column: str) -> pl.Expr:
+    """Pack internal and external cluster labels into a single integer id.
+
+    Each label is replaced by its dense zero-based rank, the internal code fills
+    the high bits and the external code the low ``EXTERNAL_CODE_BITS`` bits.
+
+    Args:
+        internal_column: Internal cluster label column
+        external_column: External cluster label column
+
+    Returns:
+        Int64 expression with the packed merged cluster id
+    """
+    internal_code = (pl.col(internal_column).rank("dense") - 1).cast(pl.Int64)
+    external_code = (pl.col(external_column).rank("dense") - 1).cast(pl.Int64)
+    return internal_code * (1 << EXTERNAL_CODE_BITS) + external_code
+
+
+def unpack_cluster_ids(merged_column: str) -> tuple[pl.Expr, pl.Expr]:
+    """Split packed merged cluster ids back into internal and external codes.
+
+    Args:
+        merged_column: Packed merged cluster id column
+
+    Returns:
+        Tuple of internal code and external code expressions
+    """
+    return (
+        pl.col(merged_column) // (1 << EXTERNAL_CODE_BITS),
+        pl.col(merged_column) % (1 << EXTERNAL_CODE_BITS),
+    )
+
+
+def _find_column(data: pl.DataFrame, name: str) -> str | None:
+    """Find a column by case-insensitive name.
+
+    Args:
+        data: DataFrame to search
+        name: Column name to look for
+
+    Returns:
+        The matching column name, or None if absent
+    """
+    return next((col for col in data.columns if col.upper() == name.upper()), None)
+
+
+def _split_by_category(
+    clusters: pl.DataFrame | dict[str, pl.DataFrame],
+) -> dict[str, pl.DataFrame]:
+    """Split cluster assignments into one DataFrame per category.
+
+    Args:
+        clusters: Assignments keyed by category, or one frame with a category column
+
+    Returns:
+        Dictionary of category names to their assignments, without the category
+        column and without feature columns that belong only to other categories
+    """
+    if isinstance(clusters, dict):
+        frames = dict(clusters)
+    else:
+        category_col = _find_column(clusters, "category")
+        if category_col is None:
+            return {"default": clusters}
+        frames = {
+            str(key[0]): frame
+            for key, frame in clusters.partition_by(category_col, as_dict=True).items()
+        }
+
+    result = {}
+    for category, frame in frames.items():
+        category_col = _find_column(frame, "category")
+        if category_col:
+            frame = frame.drop(category_col)
+        # Diagonal concatenation upstream leaves other categories' columns as nulls
+        result[category] = frame.select(
+            [col for col in frame.columns if frame[col].null_count() < frame.height]
+        )
+    return result
+
+
+def _merge_category(
+    context: dg.AssetExecutionContext,
+    category: str,
+    internal_clusters: pl.DataFrame,
+    external_clusters: pl.DataFrame,
+) -> pl.DataFrame:
+    """Join one category's internal clusters with the external clusters.
+
+    Args:
+        context: Asset execution context
+        category: Category being merged
+        internal_clusters: Internal cluster assignments for the category
+        external_clusters: External cluster assignments
+
+    Returns:
+        DataFrame of merged assignments with a category column
+    """
+    context.log.info(f"Merging clusters for category: {category}")
+
     # Handle case-insensitive column matching for STORE_NBR
     internal_store_col = next(
         (col for col in internal_clusters.columns if col.upper() == "STORE_NBR"), None
@@ -295,17 +363,34 @@ def merged_clusters(
         f"Using cluster columns: internal='{internal_cluster_col}', external='{external_cluster_col}'"
     )
 
-    # Create merged cluster identifier
+    # The external cluster column picks up the join suffix when names collide
+    if external_cluster_col in internal_clusters.columns and external_cluster_col != "STORE_NBR":
+        external_cluster_col = f"{external_cluster_col}_external"
+
+    # Pack both cluster codes into one integer id
     merged = merged.with_columns(
-        (
-            pl.col(internal_cluster_col).cast(pl.Utf8)
-            + "_"
-            + pl.col(external_cluster_col).cast(pl.Utf8)
-        ).alias("merged_cluster")
+        pack_cluster_ids(internal_cluster_col, external_cluster_col).alias("merged_cluster"),
+        pl.lit(category).alias("category"),
+    )
+
+    # Display labels are built once per merged cluster, not once per store
+    labels = (
+        merged.select("merged_cluster", internal_cluster_col, external_cluster_col)
+        .unique(subset="merged_cluster")
+        .select(
+            "merged_cluster",
+            pl.concat_str(
+                [pl.col(internal_cluster_col), pl.col(external_cluster_col)], separator="_"
+            )
+            .cast(pl.Categorical)
+            .alias("merged_cluster_label"),
+        )
     )
+    merged = merged.join(labels, on="merged_cluster", how="left", maintain_order="left")
 
     context.log.info(
-        f"Created {merged.select(pl.col('merged_cluster').n_unique())} merged clusters"
+        f"Created {merged.select(pl.col('merged_cluster').n_unique()).item()} merged clusters "
+        f"for category {category}"
     )
 
     return merged
@@ -320,7 +405,7 @@ def merged_clusters(
 def merged_cluster_assignments(
     context: dg.AssetExecutionContext,
     merged_clusters: pl.DataFrame,
-) -> dict[str, dict]:
+) -> dict[str, pa.Table]:
     """Create a mapping of merged cluster assignments with counts.
 
     Args:
@@ -328,30 +413,30 @@ def merged_cluster_assignments(
         merged_clusters: Merged cluster assignments
 
     Returns:
-        Dictionary with merged cluster mappings and counts
+        Dictionary with Arrow tables of cluster counts and store mappings
     """
     context.log.info("Calculating merged cluster statistics")
 
-    # Count occurrences of each merged cluster
+    # Count occurrences of each merged cluster within its category
     cluster_counts = (
-        merged_clusters.group_by("merged_cluster")
-        .agg(pl.count().alias("count"))
-        .sort("count", descending=True)
+        merged_clusters.group_by(["category", "merged_cluster"])
+        .agg(pl.first("merged_cluster_label"), pl.len().alias("count"))
+        .sort(["category", "count"], descending=[False, True])
     )
 
-    # Convert to dictionary for easier access
+    # Keep both tables columnar so ids and label dictionaries stay encoded
     cluster_map = {
-        "clusters": cluster_counts.to_dict(as_series=False),
-        "store_mappings": merged_clusters.select(["STORE_NBR", "merged_cluster"]).to_dict(
-            as_series=False
-        ),
+        "clusters": cluster_counts.to_arrow(),
+        "store_mappings": merged_clusters.select(
+            ["STORE_NBR", "category", "merged_cluster", "merged_cluster_label"]
+        ).to_arrow(),
     }
 
     return cluster_map
 
 
 @dg.asset(
-    io_manager_key="io_manager",
+    io_manager_key="columnar_io_manager",
     deps=["merged_clusters", "merged_cluster_assignments"],
     compute_kind="merging",
     group_name="merging",
@@ -360,7 +445,7 @@ def merged_cluster_assignments(
 def optimized_merged_clusters(
     context: dg.AssetExecutionContext,
     merged_clusters: pl.DataFrame,
-    merged_cluster_assignments: dict[str, dict],
+    merged_cluster_assignments: dict[str, pa.Table],
 ) -> dict[str, pl.DataFrame]:
     """Identify small clusters that need reassignment.
 
@@ -382,7 +467,7 @@ def optimized_merged_clusters(
     context.log.info(f"Identifying clusters smaller than {min_cluster_size}")
 
     # Extract cluster counts
-    cluster_counts = pl.DataFrame(merged_cluster_assignments["clusters"])
+    cluster_counts = pl.from_arrow(merged_cluster_assignments["clusters"])
 
     # Separate small and large clusters
     small_clusters = cluster_counts.filter(pl.col("count") < min_cluster_size)
@@ -406,30 +491,34 @@ def optimized_merged_clusters(
 
 
 @dg.asset(
-    io_manager_key="io_manager",
+    io_manager_key="columnar_io_manager",
     deps=["optimized_merged_clusters"],
     compute_kind="merging",
     group_name="merging",
-    required_resource_keys={"internal_model_output", "external_model_output", "job_params"},
+    required_resource_keys={"job_params"},
 )
 def cluster_reassignment(
     context: dg.AssetExecutionContext,
     optimized_merged_clusters: dict[str, pl.DataFrame],
 ) -> pl.DataFrame:
-    """Reassign small clusters to their nearest large cluster using centroids.
+    """Rebalance merged clusters until every cluster meets the minimum size.
+
+    Stores in undersized clusters are moved to the nearest cluster centroid in
+    standardized feature space. Centroids are updated incrementally after every
+    pass, and passes repeat until no cluster falls below ``min_cluster_size``.
+    Categories are rebalanced independently on a worker pool.
 
     Args:
         context: Asset execution context
         optimized_merged_clusters: Dictionary with cluster data
 
     Returns:
-        DataFrame with final cluster assignments
+        DataFrame with final cluster assignments for all categories
     """
-    context.log.info("Reassigning small clusters to nearest large clusters")
+    context.log.info("Rebalancing small clusters into nearest viable clusters")
 
     # Extract data from input
     small_clusters = optimized_merged_clusters["small_clusters"]
-    large_clusters = optimized_merged_clusters["large_clusters"]
     merged_data = optimized_merged_clusters["merged_data"]
 
     # Get minimum cluster size from configuration (now that it's not passed in the dictionary)
@@ -438,137 +527,122 @@ def cluster_reassignment(
         if hasattr(context.resources.job_params, "min_cluster_size")
         else 20
     )  # Default to 20 if not specified
+    max_passes = getattr(context.resources.job_params, "max_rebalance_passes", 50)
+    max_workers = getattr(context.resources.job_params, "merge_max_workers", None)
     context.log.info(f"Using min_cluster_size: {min_cluster_size}")
 
     # If no small clusters, return original assignments
     if small_clusters.height == 0:
         context.log.info("No small clusters to reassign")
-        return merged_data.select(["STORE_NBR", "merged_cluster"]).with_columns(
-            pl.col("merged_cluster").alias("final_cluster")
-        )
-
-    # Get the paths from the writer resources
-    internal_model_path = context.resources.internal_model_output.path
-    external_model_path = context.resources.external_model_output.path
-
-    # Create readers using the same paths as the writers
-    internal_model_reader = PickleReader(path=internal_model_path)
-    external_model_reader = PickleReader(path=external_model_path)
-
-    # Load model outputs
-    try:
-        internal_model = internal_model_reader.read()
-        external_model = external_model_reader.read()
-    except Exception as e:
-        context.log.error(f"Error reading model outputs: {str(e)}")
-        # Fallback: use original assignments without reassignment
-        context.log.warning("Using original cluster assignments without reassignment")
-        return merged_data.select(["STORE_NBR", "merged_cluster"]).with_columns(
-            pl.col("merged_cluster").alias("final_cluster")
+        return merged_data.select(
+            ["STORE_NBR", "category", "merged_cluster", "merged_cluster_label"]
+        ).with_columns(
+            pl.col("merged_cluster").alias("final_cluster"),
+            pl.col("merged_cluster_label").alias("final_cluster_label"),
         )
 
-    # If models are dictionaries of models by category, use the first one
-    if isinstance(internal_model, dict) and not any(
-        k in internal_model for k in ["model", "centroids"]
-    ):
-        internal_category = next(iter(internal_model.keys()))
-        context.log.info(f"Using internal model for category: {internal_category}")
-        internal_model = internal_model[internal_category]
-
-    if isinstance(external_model, dict) and not any(
-        k in external_model for k in ["model", "centroids"]
-    ):
-        external_category = (
-            "default" if "default" in external_model else next(iter(external_model.keys()))
-        )
-        context.log.info(f"Using external model for category: {external_category}")
-        external_model = external_model[external_category]
-
-    # Extract centroids from models
-    if "centroids" not in internal_model or "centroids" not in external_model:
-        context.log.error("Could not find centroids in model outputs")
-        # Fallback: use original assignments without reassignment
-        context.log.warning("Using original cluster assignments without reassignment")
-        return merged_data.select(["STORE_NBR", "merged_cluster"]).with_columns(
-            pl.col("merged_cluster").alias("final_cluster")
-        )
+    # Rebalance every category on a worker pool
+    partitions = merged_data.partition_by("category", as_dict=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            key[0]: pool.submit(
+                _rebalance_category, context, key[0], frame, min_cluster_size, max_passes
+            )
+            for key, frame in partitions.items()
+        }
+        results = {category: future.result() for category, future in futures.items()}
+
+    final_assignments = pl.concat([frame for frame, _ in results.values()])
+    reassigned_count = sum(stats["reassigned_stores"] for _, stats in results.values())
+
+    context.log.info(f"Reassigned {reassigned_count} stores across {len(results)} categories")
+
+    context.add_output_metadata(
+        {
+            "reassigned_stores": reassigned_count,
+            "categories": dg.MetadataValue.json(
+                {category: stats for category, (_, stats) in results.items()}
+            ),
+        }
+    )
 
-    internal_centroids = internal_model["centroids"]
-    external_centroids = external_model["centroids"]
-
-    # Create a mapping of original clusters to their centroids
-    all_centroids = {}
-    for i_cluster, i_centroid in internal_centroids.items():
-        for e_cluster, e_centroid in external_centroids.items():
-            merged_id = f"{i_cluster}_{e_cluster}"
-            # Combine centroids (assuming they are numpy arrays)
-            all_centroids[merged_id] = np.concatenate([i_centroid, e_centroid])
-
-    # Get the small and large cluster IDs
-    small_cluster_ids = small_clusters.select("merged_cluster").to_series().to_list()
-    large_cluster_ids = large_clusters.select("merged_cluster").to_series().to_list()
-
-    # Create mapping of small clusters to nearest large cluster
-    reassignment_map = {}
-    for small_id in small_cluster_ids:
-        # Get centroid of small cluster
-        small_centroid = all_centroids.get(small_id)
-        if small_centroid is None:
-            context.log.warning(f"No centroid found for small cluster {small_id}")
-            continue
-
-        # Calculate distances to all large clusters
-        distances = {}
-        for large_id in large_cluster_ids:
-            large_centroid = all_centroids.get(large_id)
-            if large_centroid is None:
-                continue
-
-            # Calculate Euclidean distance between centroids
-            distance = pairwise_distances(
-                small_centroid.reshape(1, -1), large_centroid.reshape(1, -1), metric="euclidean"
-            )[0][0]
-            distances[large_id] = distance
-
-            # Explicitly clean up memory
-            del large_centroid
-            # Force garbage collection periodically
-            if len(distances) % 10 == 0:
-                import gc
-
-                gc.collect()
-
-        # Assign to nearest large cluster
-        if distances:
-            nearest_cluster = min(distances, key=distances.get)
-            reassignment_map[small_id] = nearest_cluster
-        else:
-            context.log.warning(f"Could not find any large cluster for reassignment of {small_id}")
-            # Keep the original assignment if no reassignment is possible
-            reassignment_map[small_id] = small_id
+    return final_assignments
 
-        # Clean up memory after processing each small cluster
-        del small_centroid
-        del distances
-        import gc
 
-        gc.collect()
+def _rebalance_category(
+    context: dg.AssetExecutionContext,
+    category: str,
+    data: pl.DataFrame,
+    min_cluster_size: int,
+    max_passes: int,
+) -> tuple[pl.DataFrame, dict[str, int]]:
+    """Rebalance the merged clusters of a single category.
 
-    # Apply reassignments to create final cluster assignments
-    def map_to_final_cluster(cluster_id):
-        return reassignment_map.get(cluster_id, cluster_id)
+    Args:
+        context: Asset execution context
+        category: Category being rebalanced
+        data: Merged cluster data for the category
+        min_cluster_size: Minimum number of stores per cluster
+        max_passes: Upper bound on rebalancing passes
 
-    # Create final cluster assignments
-    final_assignments = merged_data.with_columns(
-        pl.col("merged_cluster").map_elements(map_to_final_cluster).alias("final_cluster")
-    ).select(["STORE_NBR", "merged_cluster", "final_cluster"])
+    Returns:
+        Tuple of the final assignments and rebalancing statistics
+    """
+    assignments = data.select(["STORE_NBR", "category", "merged_cluster", "merged_cluster_label"])
+
+    # Other categories' feature columns are null in this partition
+    columns = [col for col in feature_columns(data) if data[col].null_count() < data.height]
+    if not columns:
+        context.log.warning(
+            f"No numeric feature columns available for centroids in category {category}, "
+            "using original cluster assignments without reassignment"
+        )
+        return assignments.with_columns(
+            pl.col("merged_cluster").alias("final_cluster"),
+            pl.col("merged_cluster_label").alias("final_cluster_label"),
+        ), {
+            "reassigned_stores": 0,
+            "rebalance_passes": 0,
+            "final_cluster_count": data["merged_cluster"].n_unique(),
+        }
+
+    # Position every store in standardized feature space
+    features = standardize_features(data, columns)
+
+    # Encode merged cluster ids as contiguous codes for the rebalancing engine
+    ids, codes = np.unique(data["merged_cluster"].to_numpy(), return_inverse=True)
+    id_labels = (
+        data.select("merged_cluster", "merged_cluster_label")
+        .unique(subset="merged_cluster")
+        .sort("merged_cluster")["merged_cluster_label"]
+    )
+    final_codes, passes = rebalance_clusters(
+        codes, features, min_cluster_size=min_cluster_size, max_passes=max_passes
+    )
 
     # Log reassignment stats
-    reassigned_count = merged_data.filter(pl.col("merged_cluster").is_in(small_cluster_ids)).height
+    reassigned_count = int((final_codes != codes).sum())
+    final_sizes = np.bincount(final_codes)
+    undersized = int(((final_sizes > 0) & (final_sizes < min_cluster_size)).sum())
 
-    context.log.info(f"Reassigned {reassigned_count} stores from small clusters")
+    context.log.info(
+        f"Category {category}: reassigned {reassigned_count} stores in {passes} passes; "
+        f"{int((final_sizes > 0).sum())} clusters remain"
+    )
+    if undersized:
+        context.log.warning(
+            f"Category {category}: {undersized} clusters remain below {min_cluster_size} "
+            "stores; there are not enough stores to satisfy the size floor"
+        )
 
-    return final_assignments
+    return assignments.with_columns(
+        pl.Series("final_cluster", ids[final_codes]),
+        id_labels.gather(final_codes).alias("final_cluster_label"),
+    ), {
+        "reassigned_stores": reassigned_count,
+        "rebalance_passes": passes,
+        "final_cluster_count": int((final_sizes > 0).sum()),
+    }
 
 
 @dg.asset(
@@ -0,0 +1,162 @@
+"""Size-constrained rebalancing of merged clusters.
+
+Clusters below the minimum size are dissolved into their nearest viable cluster
+until every surviving cluster meets the size floor. Centroids are tracked as
+running per-cluster sums and counts, so each move updates them in place instead
+of recomputing means over the full feature matrix.
+"""
+
+import numpy as np
+import polars as pl
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+# Columns that identify stores or clusters rather than describe them
+NON_FEATURE_COLUMNS = {"STORE_NBR", "category"}
+
+
+def feature_columns(data: pl.DataFrame) -> list[str]:
+    """Select the numeric feature columns used to position stores.
+
+    Args:
+        data: Merged cluster data
+
+    Returns:
+        Names of numeric columns that are not identifiers or cluster labels
+    """
+    return [
+        name
+        for name, dtype in data.schema.items()
+        if dtype.is_numeric() and name not in NON_FEATURE_COLUMNS and "cluster" not in name.lower()
+    ]
+
+
+def standardize_features(data: pl.DataFrame, columns: list[str]) -> np.ndarray:
+    """Build a standardized feature matrix for distance computations.
+
+    Missing values are replaced by the column mean and constant columns are left
+    at zero so they do not influence distances.
+
+    Args:
+        data: Merged cluster data
+        columns: Feature columns to include
+
+    Returns:
+        Array of shape (rows, features) with zero mean and unit variance columns
+    """
+    matrix = data.select(columns).to_numpy().astype(np.float64)
+    means = np.nanmean(matrix, axis=0) if matrix.size else np.zeros(len(columns))
+    means = np.nan_to_num(means)
+    matrix = np.where(np.isnan(matrix), means, matrix)
+    stds = matrix.std(axis=0)
+    stds[stds == 0] = 1.0
+    return (matrix - means) / stds
+
+
+def _accumulate(
+    codes: np.ndarray, features: np.ndarray, n_clusters: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sum features and count rows per cluster code."""
+    counts = np.bincount(codes, minlength=n_clusters)
+    sums = np.zeros((n_clusters, features.shape[1]))
+    for j in range(features.shape[1]):
+        sums[:, j] = np.bincount(codes, weights=features[:, j], minlength=n_clusters)
+    return sums, counts
+
+
+def _squared_distances(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Compute squared Euclidean distances between every point and centroid."""
+    return (
+        np.einsum("ij,ij->i", points, points)[:, None]
+        - 2.0 * points @ centroids.T
+        + np.einsum("ij,ij->i", centroids, centroids)[None, :]
+    )
+
+
+def rebalance_clusters(
+    codes: np.ndarray,
+    features: np.ndarray,
+    min_cluster_size: int,
+    max_passes: int = 50,
+) -> tuple[np.ndarray, int]:
+    """Reassign rows until every cluster meets the minimum size.
+
+    Each pass works on all undersized clusters at once:
+
+    1. If some clusters already meet the floor, every row of an undersized
+       cluster moves to the nearest of those clusters' centroids.
+    2. Otherwise every cluster links to its nearest neighbouring centroid and
+       each connected group of links is merged into one cluster, which at
+       least halves the cluster count per pass.
+
+    Sums and counts are adjusted for the moved rows only, so centroids stay
+    exact without a full recomputation.
+
+    Args:
+        codes: Integer cluster code for each row
+        features: Feature matrix with one row per code
+        min_cluster_size: Minimum number of rows a cluster must hold
+        max_passes: Upper bound on the number of passes
+
+    Returns:
+        Tuple of the rebalanced codes and the number of passes performed
+    """
+    codes = np.asarray(codes, dtype=np.int64).copy()
+    if codes.size == 0:
+        return codes, 0
+
+    n_clusters = int(codes.max()) + 1
+    sums, counts = _accumulate(codes, features, n_clusters)
+
+    for passes in range(max_passes):
+        live = counts > 0
+        small = live & (counts < min_cluster_size)
+        if not small.any():
+            return codes, passes
+
+        targets = np.flatnonzero(live & ~small)
+        if targets.size:
+            # Row-level moves into clusters that already satisfy the floor
+            moving = np.flatnonzero(small[codes])
+            centroids = sums[targets] / counts[targets, None]
+            destinations = targets[_squared_distances(features[moving], centroids).argmin(axis=1)]
+
+            removed_sums, removed_counts = _accumulate(codes[moving], features[moving], n_clusters)
+            added_sums, added_counts = _accumulate(destinations, features[moving], n_clusters)
+            sums += added_sums - removed_sums
+            counts += added_counts - removed_counts
+            codes[moving] = destinations
+            continue
+
+        live_ids = np.flatnonzero(live)
+        if live_ids.size == 1:
+            # Everything already sits in one cluster; nothing left to merge into
+            return codes, passes
+
+        # Cluster-level merges while no cluster is large enough to absorb rows
+        centroids = sums[live_ids] / counts[live_ids, None]
+        distances = _squared_distances(centroids, centroids)
+        np.fill_diagonal(distances, np.inf)
+        links = coo_matrix(
+            (np.ones(live_ids.size), (np.arange(live_ids.size), distances.argmin(axis=1))),
+            shape=(live_ids.size, live_ids.size),
+        )
+        _, groups = connected_components(links, directed=True, connection="weak")
+
+        # Each group collapses onto one of its members
+        representatives = np.empty(groups.max() + 1, dtype=np.int64)
+        representatives[groups] = live_ids
+        destinations = representatives[groups]
+
+        merged_sums = sums[live_ids]
+        merged_counts = counts[live_ids]
+        sums[live_ids] = 0.0
+        counts[live_ids] = 0
+        np.add.at(sums, destinations, merged_sums)
+        np.add.at(counts, destinations, merged_counts)
+
+        remap = np.arange(n_clusters)
+        remap[live_ids] = destinations
+        codes = remap[codes]
+
+    return codes, max_passes
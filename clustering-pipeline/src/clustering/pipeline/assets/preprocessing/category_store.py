@@ -0,0 +1,178 @@
+"""Persisted per-category store for incremental preprocessing.
+
+Each category's pivoted sales table is kept as its own Parquet file together with
+a fingerprint of the input sales rows it was built from. A run only aggregates
+and pivots categories whose fingerprint changed and reloads the rest from the store.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from clustering.shared.common.filesystem import set_default_permissions
+
+MANIFEST_FILE = "manifest.json"
+
+# Input columns that determine a category's pivot, in a fixed order
+FINGERPRINT_COLUMNS = ["STORE_NBR", "NEED_STATE", "TOTAL_SALES"]
+
+
+def fingerprint_categories(data: pl.DataFrame | pl.LazyFrame) -> dict[str, str]:
+    """Fingerprint each category's input sales rows.
+
+    Every row is hashed on its own and the hashes are combined per category
+    with order-independent integer aggregates: the row count, the sums of the
+    hash halves and their XOR. The fingerprint therefore depends neither on
+    row order nor on the rounding of parallel float sums, and computing it
+    takes one streaming pass without the store and need state aggregation.
+
+    Args:
+        data: Sales rows with a ``CAT_DSC`` column
+
+    Returns:
+        Hex digest per category that changes whenever any of its rows changes
+    """
+    data = data.lazy()
+    row_hash = pl.struct(FINGERPRINT_COLUMNS).hash(seed=0)
+    summary = (
+        data.group_by("CAT_DSC")
+        .agg(
+            pl.len().alias("rows"),
+            # Each half is below 2**32, so the sums cannot overflow
+            (row_hash % 2**32).sum().alias("low"),
+            (row_hash // 2**32).sum().alias("high"),
+            row_hash.bitwise_xor().alias("xor"),
+        )
+        .collect(engine="streaming")
+    )
+    schema = str(data.select(FINGERPRINT_COLUMNS).collect_schema())
+    return {
+        row["CAT_DSC"]: hashlib.sha256(
+            f"{schema}|{row['rows']}|{row['low']}|{row['high']}|{row['xor']}".encode()
+        ).hexdigest()
+        for row in summary.sort("CAT_DSC").iter_rows(named=True)
+    }
+
+
+def dirty_categories(base_dir: str) -> list[str]:
+    """List the categories recomputed by the most recent run.
+
+    Args:
+        base_dir: Directory of the category store
+
+    Returns:
+        Names of the categories that changed in the last update
+    """
+    manifest_path = Path(base_dir) / MANIFEST_FILE
+    if not manifest_path.exists():
+        return []
+    return json.loads(manifest_path.read_text())["dirty"]
+
+
+class CategoryStore:
+    """Directory of per-category Parquet tables with their sales fingerprints.
+
+    Fingerprints rely on Polars row hashing, which is only stable within a Polars
+    version, so a version change marks every category dirty.
+    """
+
+    def __init__(self, base_dir: str) -> None:
+        """Initialize the store.
+
+        Args:
+            base_dir: Directory holding the tables and the manifest
+        """
+        self.base_dir = Path(base_dir)
+        self.manifest = self._load_manifest()
+
+    def dirty(self, fingerprints: dict[str, str]) -> list[str]:
+        """Find the categories that must be recomputed.
+
+        Args:
+            fingerprints: Current fingerprint of every category
+
+        Returns:
+            Categories that are new, changed or missing from the store
+        """
+        stored = self.manifest["fingerprints"]
+        files = self.manifest["files"]
+        return [
+            category
+            for category, fingerprint in fingerprints.items()
+            if stored.get(category) != fingerprint
+            or category not in files
+            or not (self.base_dir / files[category]).exists()
+        ]
+
+    def update(
+        self, recomputed: dict[str, pl.DataFrame], fingerprints: dict[str, str]
+    ) -> dict[str, pl.DataFrame]:
+        """Merge recomputed categories into the store and load the full result.
+
+        Args:
+            recomputed: Freshly computed tables of the dirty categories
+            fingerprints: Current fingerprint of every category
+
+        Returns:
+            Tables of every category, in the order of ``fingerprints``
+        """
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        files = {
+            category: file
+            for category, file in self.manifest["files"].items()
+            if category in fingerprints
+        }
+
+        for category, frame in recomputed.items():
+            file_name = f"{hashlib.sha1(category.encode()).hexdigest()}.parquet"
+            fd, tmp_name = tempfile.mkstemp(dir=self.base_dir, suffix=".parquet.tmp")
+            os.close(fd)
+            frame.write_parquet(tmp_name)
+            set_default_permissions(tmp_name)
+            os.replace(tmp_name, self.base_dir / file_name)
+            files[category] = file_name
+
+        # Categories that disappeared from the sales data leave the store
+        for category, file_name in self.manifest["files"].items():
+            if category not in fingerprints:
+                (self.base_dir / file_name).unlink(missing_ok=True)
+
+        self.manifest = {
+            "polars_version": pl.__version__,
+            "fingerprints": fingerprints,
+            "files": files,
+            "dirty": list(recomputed),
+        }
+        self._write_manifest()
+
+        return {
+            category: recomputed[category]
+            if category in recomputed
+            else pl.read_parquet(self.base_dir / files[category])
+            for category in fingerprints
+        }
+
+    def _load_manifest(self) -> dict[str, Any]:
+        """Load the manifest, starting empty if it is missing or outdated."""
+        empty = {"polars_version": pl.__version__, "fingerprints": {}, "files": {}, "dirty": []}
+        manifest_path = self.base_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return empty
+
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("polars_version") != pl.__version__:
+            return {**empty, "files": manifest.get("files", {})}
+        return manifest
+
+    def _write_manifest(self) -> None:
+        """Write the manifest atomically."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.base_dir, suffix=".json.tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(self.manifest, file)
+        set_default_permissions(tmp_name)
+        os.replace(tmp_name, self.base_dir / MANIFEST_FILE)
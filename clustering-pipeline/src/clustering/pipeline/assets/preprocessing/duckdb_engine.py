@@ -0,0 +1,140 @@
+"""DuckDB engine for internal preprocessing of larger-than-memory sales extracts.
+
+The need state join, the sales normalization, the store percentages and the
+pivot run as SQL directly over the source files. DuckDB streams the sources and
+spills intermediate state to local disk, so the raw sales never have to fit in
+memory. Results come back as one Arrow table per category.
+"""
+
+import duckdb
+import pyarrow as pa
+
+
+def _literal(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _identifier(name: str) -> str:
+    """Quote a name as a SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _source(path: str) -> str:
+    """Build a table function reading a CSV or Parquet source."""
+    if path.endswith(".parquet"):
+        return f"read_parquet({_literal(path)})"
+    return f"read_csv_auto({_literal(path)})"
+
+
+def sales_by_category_duckdb(
+    sales_path: str,
+    map_path: str,
+    temp_dir: str | None = None,
+    memory_limit: str | None = None,
+) -> dict[str, pa.Table]:
+    """Compute need state sales percentages per category with DuckDB.
+
+    Mirrors the Polars preprocessing chain: need states are upper-cased and
+    de-duplicated, sales are joined on SKU, split evenly across a SKU's need
+    states, summed per store and need state, turned into percentages of the
+    store total and pivoted into one ``% Sales`` column per need state.
+
+    Args:
+        sales_path: Path to the need state sales file
+        map_path: Path to the need state mapping file
+        temp_dir: Directory DuckDB spills to when it exceeds its memory limit
+        memory_limit: DuckDB memory limit, for example ``"4GB"``
+
+    Returns:
+        Dictionary of Arrow tables keyed by category
+    """
+    conn = duckdb.connect()
+    try:
+        if temp_dir:
+            conn.execute(f"SET temp_directory = {_literal(temp_dir)}")
+        if memory_limit:
+            conn.execute(f"SET memory_limit = {_literal(memory_limit)}")
+        conn.execute("SET preserve_insertion_order = false")
+
+        # Mappings without need states fall back to a single default need state
+        describe = conn.execute(f"DESCRIBE SELECT * FROM {_source(map_path)}").fetchall()
+        if "NEED_STATE" in {row[0] for row in describe}:
+            need_state, excluded = "upper(NEED_STATE)", "PRODUCT_ID, NEED_STATE"
+        else:
+            need_state, excluded = "'DEFAULT'", "PRODUCT_ID"
+
+        conn.execute(
+            f"""
+            CREATE TEMP TABLE store_ns_sales AS
+            WITH sales AS (
+                SELECT
+                    CAST(SKU_NBR AS BIGINT) AS SKU_NBR,
+                    CAST(STORE_NBR AS BIGINT) AS STORE_NBR,
+                    CAST(CAT_DSC AS VARCHAR) AS CAT_DSC,
+                    CAST(TOTAL_SALES AS DOUBLE) AS TOTAL_SALES
+                FROM {_source(sales_path)}
+            ),
+            need_states AS (
+                SELECT DISTINCT * EXCLUDE ({excluded}),
+                    CAST(PRODUCT_ID AS BIGINT) AS PRODUCT_ID,
+                    {need_state} AS NEED_STATE
+                FROM {_source(map_path)}
+                WHERE PRODUCT_ID IS NOT NULL
+            ),
+            normalized AS (
+                SELECT
+                    s.CAT_DSC,
+                    s.STORE_NBR,
+                    n.NEED_STATE,
+                    s.TOTAL_SALES / COUNT(*) OVER (
+                        PARTITION BY s.SKU_NBR, s.STORE_NBR, s.CAT_DSC
+                    ) AS TOTAL_SALES
+                FROM sales AS s
+                JOIN need_states AS n ON s.SKU_NBR = n.PRODUCT_ID
+            )
+            SELECT
+                CAT_DSC,
+                STORE_NBR,
+                NEED_STATE,
+                SUM(TOTAL_SALES) AS STORE_NS_TOTAL_SALES,
+                SUM(TOTAL_SALES) / SUM(SUM(TOTAL_SALES)) OVER (
+                    PARTITION BY CAT_DSC, STORE_NBR
+                ) * 100.0 AS Pct_of_Sales
+            FROM normalized
+            GROUP BY CAT_DSC, STORE_NBR, NEED_STATE
+            """
+        )
+
+        categories = conn.execute(
+            """
+            SELECT CAT_DSC, list(DISTINCT NEED_STATE ORDER BY NEED_STATE)
+            FROM store_ns_sales
+            WHERE CAT_DSC IS NOT NULL AND NEED_STATE IS NOT NULL
+            GROUP BY CAT_DSC
+            ORDER BY CAT_DSC
+            """
+        ).fetchall()
+
+        result = {}
+        for category, need_states in categories:
+            # Conditional aggregation pivots with the need states known up front
+            columns = ", ".join(
+                f"COALESCE(ROUND(SUM(Pct_of_Sales) FILTER (WHERE NEED_STATE = {_literal(ns)}), 2),"
+                f" 0) AS {_identifier(f'% Sales {ns}')}"
+                for ns in need_states
+            )
+            result[category] = conn.execute(
+                f"""
+                SELECT STORE_NBR, {columns}
+                FROM store_ns_sales
+                WHERE CAT_DSC = $category
+                GROUP BY STORE_NBR
+                ORDER BY STORE_NBR
+                """,
+                {"category": category},
+            ).arrow()
+
+        return result
+    finally:
+        conn.close()
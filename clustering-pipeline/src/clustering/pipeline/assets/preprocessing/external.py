@@ -1,8 +1,12 @@
 """External preprocessing assets for the clustering pipeline."""
 
+import asyncio
+
 import dagster as dg
 import polars as pl
 
+from clustering.shared.io import read_many
+
 
 @dg.asset(
     io_manager_key="io_manager",
@@ -34,13 +38,14 @@ def external_features_data(
         # Add additional readers here as needed
     ]
 
-    # Step 2: Read data from all sources
+    # Step 2: Read data from all sources concurrently; ingest is I/O bound
     context.log.info("Reading data from all external sources")
-    dataframes: list[pl.DataFrame] = []
+    results = asyncio.run(read_many(dict(enumerate(external_readers))))
 
-    for reader in external_readers:
-        context.log.info(f"Reading from: {reader}")
-        df = reader.read()
+    dataframes: list[pl.DataFrame] = []
+    for reader, result in zip(external_readers, results.values()):
+        df = result.value
+        context.log.info(f"Read {df.shape} from {reader} in {result.seconds:.2f}s")
 
         # Validate we have the key column needed for merging
         if "STORE_NBR" not in df.columns:
@@ -58,16 +63,18 @@ def external_features_data(
         context.log.info("Only one external data source. No merging needed.")
         return dataframes[0]
 
-    # Start with the first dataframe
-    context.log.info(
-        f"Merging {len(dataframes)} external data sources with outer join on STORE_NBR"
-    )
-    base_df = dataframes[0]
+    # Step 4: Drop columns already provided by an earlier source
+    seen_columns = {"STORE_NBR"}
+    for i, df in enumerate(dataframes):
+        duplicates = [col for col in df.columns if col in seen_columns and col != "STORE_NBR"]
+        if duplicates:
+            context.log.info(f"Dropping {len(duplicates)} duplicate columns from source {i + 1}")
+            dataframes[i] = df.drop(duplicates)
+        seen_columns.update(df.columns)
 
-    # Join with each subsequent dataframe using coalesce=True to avoid duplicate STORE_NBR columns
-    for i, df in enumerate(dataframes[1:], 1):
-        context.log.info(f"Joining with data source {i + 1} with coalesced join key")
-        base_df = base_df.join(df, on="STORE_NBR", how="outer", coalesce=True)
+    # Step 5: Join every source onto the sorted union of store keys in one plan
+    context.log.info(f"Merging {len(dataframes)} external data sources on STORE_NBR")
+    base_df = _multiway_join(dataframes, key="STORE_NBR")
 
     context.log.info(
         f"Merged external data has {base_df.shape[0]} rows and {base_df.shape[1]} columns"
@@ -75,6 +82,30 @@ def external_features_data(
     return base_df
 
 
+def _multiway_join(dataframes: list[pl.DataFrame], key: str) -> pl.DataFrame:
+    """Outer-join several frames on a key in a single query.
+
+    Every frame is left-joined onto the sorted union of keys, so the result holds
+    each key once per matching row combination, like a chain of outer joins, but
+    without materializing a growing intermediate after each join. Rows with a
+    null key cannot be matched and are dropped.
+
+    Args:
+        dataframes: Frames to join; non-key column names must not collide
+        key: Join key column
+
+    Returns:
+        Joined DataFrame sorted by the key
+    """
+    keys = pl.concat([df.select(key) for df in dataframes]).drop_nulls().unique().sort(key)
+
+    plan = keys.lazy()
+    for df in dataframes:
+        plan = plan.join(df.lazy(), on=key, how="left")
+
+    return plan.collect()
+
+
 @dg.asset(
     io_manager_key="io_manager",
     deps=["external_features_data"],
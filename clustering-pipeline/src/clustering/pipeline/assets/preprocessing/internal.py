@@ -2,54 +2,141 @@
 
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import dagster as dg
 import pandas as pd
 import polars as pl
 
+from clustering.pipeline.assets.preprocessing.category_store import (
+    CategoryStore,
+    dirty_categories,
+    fingerprint_categories,
+)
+from clustering.pipeline.assets.preprocessing.duckdb_engine import sales_by_category_duckdb
+from clustering.shared.io import IngestCache
+
+NS_SALES_PATH = "/workspaces/clustering-dagster/data/internal/ns_sales.csv"
+NS_MAP_PATH = "/workspaces/clustering-dagster/data/internal/ns_map.csv"
+
+
+def _engine(context: dg.AssetExecutionContext) -> str:
+    """Get the preprocessing engine selected in the job parameters.
+
+    Args:
+        context: Asset execution context
+
+    Returns:
+        ``"polars"`` (default) or ``"duckdb"``
+    """
+    return getattr(context.resources.job_params, "preprocessing_engine", "polars")
+
+
+def _lazy_mode(context: dg.AssetExecutionContext) -> bool:
+    """Check whether preprocessing should build a lazy query plan.
+
+    The DuckDB engine reads the sources itself, so upstream assets only build
+    plans that are never executed.
+
+    Args:
+        context: Asset execution context
+
+    Returns:
+        True if ``lazy_preprocessing`` is enabled or the DuckDB engine is selected
+    """
+    return _engine(context) == "duckdb" or bool(
+        getattr(context.resources.job_params, "lazy_preprocessing", False)
+    )
+
+
+def _use_ingest_cache(context: dg.AssetExecutionContext) -> bool:
+    """Check whether CSV sources should be read through the ingest cache.
+
+    Args:
+        context: Asset execution context
+
+    Returns:
+        True if ``use_ingest_cache`` is enabled in the job parameters
+    """
+    return bool(getattr(context.resources.job_params, "use_ingest_cache", False))
+
+
+def _scan_source(file_path: str, use_cache: bool = False) -> pl.LazyFrame:
+    """Build a lazy scan over a CSV or Parquet source.
+
+    Args:
+        file_path: Path to the source file
+        use_cache: Scan a cached Parquet copy of CSV sources instead of the text
+
+    Returns:
+        LazyFrame reading the source
+    """
+    if file_path.endswith(".parquet"):
+        return pl.scan_parquet(file_path)
+    if use_cache:
+        return IngestCache().scan(file_path, lambda: pl.read_csv(file_path))
+    return pl.scan_csv(file_path)
+
+
+def _shape(data: pl.DataFrame | pl.LazyFrame) -> str:
+    """Describe a frame for logging without executing a lazy plan."""
+    return str(data.shape) if isinstance(data, pl.DataFrame) else "lazy plan"
 
 
 @dg.asset(
     io_manager_key="io_manager",
     compute_kind="internal_preprocessing",
     group_name="preprocessing",
+    required_resource_keys={"job_params"},
 )
-def internal_raw_sales_data(context: dg.AssetExecutionContext) -> pl.DataFrame:
+def internal_raw_sales_data(context: dg.AssetExecutionContext) -> Any:
     """Load raw internal sales data.
 
+    With ``lazy_preprocessing`` enabled the source is scanned instead of read, and
+    the returned LazyFrame is executed by ``internal_sales_by_category``.
+
     Args:
         context: Asset execution context
 
     Returns:
-        DataFrame containing raw sales data
+        DataFrame or LazyFrame containing raw sales data
     """
     context.log.info("Reading need state sales data")
 
     try:
         # Get the file path from resources config
-        file_path = "/workspaces/clustering-dagster/data/internal/ns_sales.csv"
+        file_path = NS_SALES_PATH
 
         # Check if file exists
         if not os.path.exists(file_path):
             context.log.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        context.log.info(f"Reading from file: {file_path}")
+        if _lazy_mode(context):
+            # Defer the read so filters and projections reach the scan
+            context.log.info(f"Scanning file: {file_path}")
+            df = _scan_source(file_path, _use_ingest_cache(context))
+        elif _use_ingest_cache(context):
+            context.log.info(f"Reading from ingest cache for file: {file_path}")
+            df = _scan_source(file_path, use_cache=True).collect()
+        else:
+            context.log.info(f"Reading from file: {file_path}")
 
-        # Read file directly with polars with careful error handling
-        try:
-            df = pl.read_csv(file_path)
-        except Exception as e:
-            context.log.warning(f"Polars read failed: {str(e)}. Trying pandas fallback.")
-            # Fallback to pandas
-            pandas_df = pd.read_csv(file_path)
-            df = pl.from_pandas(pandas_df)
+            # Read file directly with polars with careful error handling
+            try:
+                df = pl.read_csv(file_path)
+            except Exception as e:
+                context.log.warning(f"Polars read failed: {str(e)}. Trying pandas fallback.")
+                # Fallback to pandas
+                pandas_df = pd.read_csv(file_path)
+                df = pl.from_pandas(pandas_df)
 
-        context.log.info(f"Successfully read data with shape: {df.shape}")
+            context.log.info(f"Successfully read data with shape: {df.shape}")
 
         # Ensure required columns are present
         required_columns = ["SKU_NBR", "STORE_NBR", "CAT_DSC", "TOTAL_SALES"]
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in required_columns if col not in df.collect_schema()]
 
         if missing_columns:
             context.log.error(f"Missing required columns: {missing_columns}")
@@ -65,7 +152,7 @@ def internal_raw_sales_data(context: dg.AssetExecutionContext) -> pl.DataFrame:
             ]
         )
 
-        context.log.info(f"Successfully processed sales data: {df.shape}")
+        context.log.info(f"Successfully processed sales data: {_shape(df)}")
         return df
 
     except Exception as e:
@@ -79,42 +166,52 @@ def internal_raw_sales_data(context: dg.AssetExecutionContext) -> pl.DataFrame:
     io_manager_key="io_manager",
     compute_kind="internal_preprocessing",
     group_name="preprocessing",
+    required_resource_keys={"job_params"},
 )
 def internal_product_category_mapping(
     context: dg.AssetExecutionContext,
-) -> pl.DataFrame:
+) -> Any:
     """Load raw internal need state data.
 
     Args:
         context: Asset execution context
 
     Returns:
-        DataFrame containing cleaned product category mapping data
+        DataFrame or LazyFrame containing cleaned product category mapping data
     """
     try:
         # Get the file path directly
-        file_path = "/workspaces/clustering-dagster/data/internal/ns_map.csv"
+        file_path = NS_MAP_PATH
 
         # Check if file exists
         if not os.path.exists(file_path):
             context.log.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        context.log.info(f"Reading from file: {file_path}")
+        if _lazy_mode(context):
+            context.log.info(f"Scanning file: {file_path}")
+            df = _scan_source(file_path, _use_ingest_cache(context))
+        elif _use_ingest_cache(context):
+            context.log.info(f"Reading from ingest cache for file: {file_path}")
+            df = _scan_source(file_path, use_cache=True).collect()
+        else:
+            context.log.info(f"Reading from file: {file_path}")
 
-        # Read file directly with careful error handling
-        try:
-            df = pl.read_csv(file_path)
-        except Exception as e:
-            context.log.warning(f"Polars read failed: {str(e)}. Trying pandas fallback.")
-            # Fallback to pandas
-            pandas_df = pd.read_csv(file_path)
-            df = pl.from_pandas(pandas_df)
+            # Read file directly with careful error handling
+            try:
+                df = pl.read_csv(file_path)
+            except Exception as e:
+                context.log.warning(f"Polars read failed: {str(e)}. Trying pandas fallback.")
+                # Fallback to pandas
+                pandas_df = pd.read_csv(file_path)
+                df = pl.from_pandas(pandas_df)
 
-        context.log.info(f"Successfully read data with shape: {df.shape}, columns: {df.columns}")
+            context.log.info(
+                f"Successfully read data with shape: {df.shape}, columns: {df.columns}"
+            )
 
         # Check for required column
-        if "PRODUCT_ID" not in df.columns:
+        if "PRODUCT_ID" not in df.collect_schema():
             context.log.error("Missing required column: PRODUCT_ID")
             raise ValueError("Product mapping data is missing required column: PRODUCT_ID")
 
@@ -123,7 +220,7 @@ def internal_product_category_mapping(
         result_df = df.filter(pl.col("PRODUCT_ID").is_not_null())
 
         # Add NEED_STATE column if missing
-        if "NEED_STATE" not in result_df.columns:
+        if "NEED_STATE" not in result_df.collect_schema():
             context.log.warning("NEED_STATE column not found in data, creating default values")
             result_df = result_df.with_columns(pl.lit("DEFAULT").alias("NEED_STATE"))
         else:
@@ -136,7 +233,7 @@ def internal_product_category_mapping(
         # Remove duplicates
         result_df = result_df.unique()
 
-        context.log.info(f"Successfully processed mapping data: {result_df.shape}")
+        context.log.info(f"Successfully processed mapping data: {_shape(result_df)}")
         return result_df
 
     except Exception as e:
@@ -154,9 +251,9 @@ def internal_product_category_mapping(
 )
 def internal_sales_with_categories(
     context: dg.AssetExecutionContext,
-    internal_raw_sales_data: pl.DataFrame,
-    internal_product_category_mapping: pl.DataFrame,
-) -> pl.DataFrame:
+    internal_raw_sales_data: Any,
+    internal_product_category_mapping: Any,
+) -> Any:
     """Merge sales data with product category mapping.
 
     Args:
@@ -165,22 +262,23 @@ def internal_sales_with_categories(
         internal_product_category_mapping: Product category mapping data
 
     Returns:
-        DataFrame containing merged data with categories
+        DataFrame or LazyFrame containing merged data with categories
     """
     context.log.info("Merging sales and category data")
 
     try:
         context.log.info(
-            f"Sales data: {internal_raw_sales_data.shape}, Mapping data: {internal_product_category_mapping.shape}"
+            f"Sales data: {_shape(internal_raw_sales_data)}, "
+            f"Mapping data: {_shape(internal_product_category_mapping)}"
         )
 
         # Handle column renames if needed
-        if "SKU_NBR" not in internal_raw_sales_data.columns:
+        if "SKU_NBR" not in internal_raw_sales_data.collect_schema():
             context.log.error("SKU_NBR column not found in sales data")
             raise ValueError("SKU_NBR column not found in sales data")
 
         # Ensure mapping has correct join column
-        if "PRODUCT_ID" not in internal_product_category_mapping.columns:
+        if "PRODUCT_ID" not in internal_product_category_mapping.collect_schema():
             context.log.error("PRODUCT_ID column not found in mapping data")
             raise ValueError("PRODUCT_ID column not found in mapping data")
 
@@ -192,11 +290,11 @@ def internal_sales_with_categories(
             how="inner",
         )
 
-        context.log.info(f"Join resulted in {merged_df.shape[0]} rows")
+        context.log.info(f"Join resulted in {_shape(merged_df)}")
 
         # Select required columns
         result_columns = ["SKU_NBR", "STORE_NBR", "CAT_DSC", "NEED_STATE", "TOTAL_SALES"]
-        missing_columns = [col for col in result_columns if col not in merged_df.columns]
+        missing_columns = [col for col in result_columns if col not in merged_df.collect_schema()]
 
         if missing_columns:
             context.log.error(f"Merged data missing required columns: {missing_columns}")
@@ -204,7 +302,7 @@ def internal_sales_with_categories(
 
         result = merged_df.select(result_columns)
 
-        context.log.info(f"Final merged data: {result.shape}")
+        context.log.info(f"Final merged data: {_shape(result)}")
         return result
 
     except Exception as e:
@@ -222,8 +320,8 @@ def internal_sales_with_categories(
 )
 def internal_normalized_sales_data(
     context: dg.AssetExecutionContext,
-    internal_sales_with_categories: pl.DataFrame,
-) -> pl.DataFrame:
+    internal_sales_with_categories: Any,
+) -> Any:
     """Normalize sales data by distributing sales evenly across need states.
 
     Args:
@@ -231,17 +329,19 @@ def internal_normalized_sales_data(
         internal_sales_with_categories: Sales data with categories
 
     Returns:
-        DataFrame containing normalized sales data
+        DataFrame or LazyFrame containing normalized sales data
     """
     context.log.info("Distributing sales evenly across need states")
 
     try:
-        context.log.info(f"Input data shape: {internal_sales_with_categories.shape}")
+        context.log.info(f"Input data shape: {_shape(internal_sales_with_categories)}")
 
         # Check for required columns
         required_columns = ["SKU_NBR", "STORE_NBR", "CAT_DSC", "NEED_STATE", "TOTAL_SALES"]
         missing_columns = [
-            col for col in required_columns if col not in internal_sales_with_categories.columns
+            col
+            for col in required_columns
+            if col not in internal_sales_with_categories.collect_schema()
         ]
 
         if missing_columns:
@@ -253,8 +353,14 @@ def internal_normalized_sales_data(
         result = (
             internal_sales_with_categories.pipe(
                 lambda df: df.with_columns(
-                    pl.count()
-                    .over([c for c in df.columns if c != "NEED_STATE" and c != "TOTAL_SALES"])
+                    pl.len()
+                    .over(
+                        [
+                            c
+                            for c in df.collect_schema().names()
+                            if c != "NEED_STATE" and c != "TOTAL_SALES"
+                        ]
+                    )
                     .alias("group_count")
                 )
             )
@@ -264,7 +370,7 @@ def internal_normalized_sales_data(
             .drop("group_count")
         )
 
-        context.log.info(f"Normalized data shape: {result.shape}")
+        context.log.info(f"Normalized data shape: {_shape(result)}")
         return result
 
     except Exception as e:
@@ -279,18 +385,33 @@ def internal_normalized_sales_data(
     deps=["internal_normalized_sales_data"],
     compute_kind="internal_preprocessing",
     group_name="preprocessing",
+    required_resource_keys={"job_params"},
 )
 def internal_sales_by_category(
     context: dg.AssetExecutionContext,
-    internal_normalized_sales_data: pl.DataFrame,
+    internal_normalized_sales_data: Any,
 ) -> dict[str, pl.DataFrame]:
     """Create category dictionary from normalized sales data with percentage of sales by need state.
 
     This asset:
-    1. Groups data by category
-    2. For each category, calculates store-need state sales and store total sales
-    3. Computes percentage of sales by need state for each store
-    4. Pivots the data to have need states as columns
+    1. Sums sales per category, store and need state in a single group-by
+    2. Computes each need state's percentage of the store total with a window
+    3. Partitions the result by category
+    4. Pivots every partition in parallel to have need states as columns
+
+    When ``incremental_store_dir`` is set, each category's input rows are
+    fingerprinted first and only categories whose fingerprint changed are
+    aggregated and pivoted; the rest are loaded from the persisted category
+    store. The recomputed categories are reported in the ``dirty_categories``
+    output metadata and by ``dirty_categories()``.
+
+    With ``preprocessing_engine: duckdb`` the whole computation runs as DuckDB SQL
+    over the source files instead, spilling to ``duckdb_temp_dir`` when it exceeds
+    ``duckdb_memory_limit``; the input plan is then not executed.
+
+    A LazyFrame input is the plan built by the upstream assets in lazy mode. The
+    store and need state aggregation is appended to it and the plan is executed
+    with the streaming engine, so the raw rows never have to fit in memory.
 
     Args:
         context: Asset execution context
@@ -302,99 +423,178 @@ def internal_sales_by_category(
     context.log.info("Creating category dictionary with need state percentage metrics")
 
     try:
-        context.log.info(f"Input data shape: {internal_normalized_sales_data.shape}")
+        context.log.info(f"Input data shape: {_shape(internal_normalized_sales_data)}")
 
         # Check for required columns
         required_columns = ["STORE_NBR", "CAT_DSC", "NEED_STATE", "TOTAL_SALES"]
         missing_columns = [
-            col for col in required_columns if col not in internal_normalized_sales_data.columns
+            col
+            for col in required_columns
+            if col not in internal_normalized_sales_data.collect_schema()
         ]
 
         if missing_columns:
             context.log.error(f"Input data missing required columns: {missing_columns}")
             raise ValueError(f"Input data missing required columns: {missing_columns}")
 
-        # Get unique categories
-        categories = (
-            internal_normalized_sales_data.select(pl.col("CAT_DSC").unique()).to_series().to_list()
+        if _engine(context) == "duckdb":
+            job_params = context.resources.job_params
+            context.log.info("Running sales by category with the DuckDB engine")
+            tables = sales_by_category_duckdb(
+                NS_SALES_PATH,
+                NS_MAP_PATH,
+                temp_dir=getattr(job_params, "duckdb_temp_dir", None),
+                memory_limit=getattr(job_params, "duckdb_memory_limit", None),
+            )
+            result = {cat: pl.from_arrow(table) for cat, table in tables.items()}
+            context.add_output_metadata({"num_categories": len(result)})
+            context.log.info(
+                f"Successfully created category dictionary with {len(result)} categories"
+            )
+            return result
+
+        sales = internal_normalized_sales_data.lazy()
+
+        # With a category store only categories whose input rows changed are
+        # aggregated and pivoted; the others are loaded from the store
+        store_dir = getattr(context.resources.job_params, "incremental_store_dir", None)
+        if store_dir:
+            store = CategoryStore(store_dir)
+            fingerprints = fingerprint_categories(internal_normalized_sales_data)
+            dirty = store.dirty(fingerprints)
+            context.log.info(f"Recomputing {len(dirty)} of {len(fingerprints)} categories: {dirty}")
+            sales = sales.filter(pl.col("CAT_DSC").is_in(dirty))
+
+        if store_dir and not dirty:
+            partitions = {}
+        else:
+            partitions = _aggregate_by_category(
+                context, sales, isinstance(internal_normalized_sales_data, pl.LazyFrame)
+            )
+        context.log.info(f"Found {len(partitions)} unique categories: {list(partitions)}")
+        if not store_dir:
+            dirty = list(partitions)
+
+        with ThreadPoolExecutor() as pool:
+            futures = {
+                cat: pool.submit(_pivot_category, context, cat, frame)
+                for cat, frame in partitions.items()
+            }
+            result = {cat: future.result() for cat, future in futures.items()}
+
+        if store_dir:
+            result = store.update(result, fingerprints)
+
+        context.add_output_metadata(
+            {
+                "num_categories": len(result),
+                "dirty_categories": dg.MetadataValue.json(dirty),
+            }
         )
 
-        context.log.info(f"Found {len(categories)} unique categories: {categories}")
+        context.log.info(f"Successfully created category dictionary with {len(result)} categories")
+        return result
 
-        # Create result dictionary
-        result = {}
+    except Exception as e:
+        context.log.error(f"Error creating sales by category: {str(e)}")
+        context.log.error(f"Exception type: {type(e).__name__}")
+        context.log.error(f"Traceback: {traceback.format_exc()}")
+        raise
 
-        # Process each category
-        for cat in categories:
-            context.log.info(f"Processing category: {cat}")
 
-            # Filter data for this category
-            cat_data = internal_normalized_sales_data.filter(pl.col("CAT_DSC") == cat)
-            context.log.info(f"  Category {cat} has {cat_data.shape[0]} rows")
+def _aggregate_by_category(
+    context: dg.AssetExecutionContext,
+    sales: pl.LazyFrame,
+    streaming: bool,
+) -> dict[str, pl.DataFrame]:
+    """Compute each need state's percentage of its store's sales, split by category.
 
-            # Calculate store-need state sales
-            store_ns_sales = cat_data.group_by(["STORE_NBR", "NEED_STATE"]).agg(
-                pl.sum("TOTAL_SALES").alias("STORE_NS_TOTAL_SALES")
-            )
+    Args:
+        context: Asset execution context
+        sales: Normalized sales rows
+        streaming: Execute the plan with the streaming engine
 
-            # Calculate store total sales
-            store_sales = cat_data.group_by("STORE_NBR").agg(
-                pl.sum("TOTAL_SALES").alias("STORE_TOTAL_SALES")
-            )
+    Returns:
+        Store and need state percentages per category
+    """
+    # One global aggregation per (category, store, need state) with the store
+    # totals as a window, instead of filtering and grouping every category
+    store_ns_sales = (
+        sales.group_by(["CAT_DSC", "STORE_NBR", "NEED_STATE"])
+        .agg(pl.sum("TOTAL_SALES").alias("STORE_NS_TOTAL_SALES"))
+        .with_columns(
+            (
+                pl.col("STORE_NS_TOTAL_SALES")
+                / pl.col("STORE_NS_TOTAL_SALES").sum().over(["CAT_DSC", "STORE_NBR"])
+                * 100.0
+            ).alias("Pct_of_Sales")
+        )
+    )
 
-            # Merge and calculate percentages
-            merged = store_ns_sales.join(store_sales, on="STORE_NBR", how="left").with_columns(
-                (pl.col("STORE_NS_TOTAL_SALES") / pl.col("STORE_TOTAL_SALES") * 100.0).alias(
-                    "Pct_of_Sales"
-                )
-            )
+    if streaming:
+        context.log.info("Executing lazy preprocessing plan with the streaming engine")
+        store_ns_sales = store_ns_sales.collect(engine="streaming")
+    else:
+        store_ns_sales = store_ns_sales.collect()
 
-            # Get need states for column renaming
-            need_states = merged.select("NEED_STATE").unique().to_series().to_list()
-            context.log.info(f"  Found {len(need_states)} need states for category {cat}")
+    context.log.info(f"Aggregated data shape: {store_ns_sales.shape}")
 
-            # Pivot the data
-            try:
-                pivoted = merged.pivot(
-                    index="STORE_NBR", values="Pct_of_Sales", columns="NEED_STATE"
-                ).fill_null(0)
+    # Split once so the categories can be pivoted in parallel
+    return {
+        key[0]: frame
+        for key, frame in store_ns_sales.partition_by(
+            "CAT_DSC", as_dict=True, include_key=False
+        ).items()
+    }
 
-                # Create column rename mapping
-                rename_map = {ns: f"% Sales {ns}" for ns in need_states if ns in pivoted.columns}
 
-                # Rename columns and round values
-                final_df = pivoted.rename(rename_map)
+def _pivot_category(
+    context: dg.AssetExecutionContext,
+    cat: str,
+    merged: pl.DataFrame,
+) -> pl.DataFrame:
+    """Pivot one category's need state percentages into columns.
 
-                # Round all percentage columns
-                round_cols = [
-                    f"% Sales {ns}" for ns in need_states if f"% Sales {ns}" in final_df.columns
-                ]
-                if round_cols:
-                    final_df = final_df.with_columns([pl.col(col).round(2) for col in round_cols])
+    Args:
+        context: Asset execution context
+        cat: Category being pivoted
+        merged: Store and need state percentages for the category
 
-                # Add to result dictionary
-                result[cat] = final_df
-                context.log.info(f"  Successfully processed category {cat}: {final_df.shape}")
+    Returns:
+        DataFrame with one row per store and one ``% Sales`` column per need state
+    """
+    # Get need states for column renaming
+    need_states = merged.select("NEED_STATE").unique().to_series().to_list()
+    context.log.info(f"  Category {cat}: {merged.height} rows, {len(need_states)} need states")
 
-            except Exception as e:
-                context.log.error(f"  Error pivoting data for category {cat}: {str(e)}")
-                # Create a minimal dataframe with just STORE_NBR to avoid pipeline failure
-                store_nums = store_sales.select("STORE_NBR")
-                for ns in need_states:
-                    store_nums = store_nums.with_columns(pl.lit(0.0).alias(f"% Sales {ns}"))
-                result[cat] = store_nums
-                context.log.info(
-                    f"  Created fallback dataframe for category {cat}: {store_nums.shape}"
-                )
+    # Pivot the data
+    try:
+        pivoted = merged.pivot(index="STORE_NBR", values="Pct_of_Sales", on="NEED_STATE").fill_null(
+            0
+        )
 
-        context.log.info(f"Successfully created category dictionary with {len(result)} categories")
-        return result
+        # Create column rename mapping
+        rename_map = {ns: f"% Sales {ns}" for ns in need_states if ns in pivoted.columns}
+
+        # Rename columns and round values
+        final_df = pivoted.rename(rename_map)
+
+        # Round all percentage columns
+        round_cols = [f"% Sales {ns}" for ns in need_states if f"% Sales {ns}" in final_df.columns]
+        if round_cols:
+            final_df = final_df.with_columns([pl.col(col).round(2) for col in round_cols])
+
+        context.log.info(f"  Successfully processed category {cat}: {final_df.shape}")
+        return final_df
 
     except Exception as e:
-        context.log.error(f"Error creating sales by category: {str(e)}")
-        context.log.error(f"Exception type: {type(e).__name__}")
-        context.log.error(f"Traceback: {traceback.format_exc()}")
-        raise
+        context.log.error(f"  Error pivoting data for category {cat}: {str(e)}")
+        # Create a minimal dataframe with just STORE_NBR to avoid pipeline failure
+        store_nums = merged.select(pl.col("STORE_NBR").unique(maintain_order=True))
+        for ns in need_states:
+            store_nums = store_nums.with_columns(pl.lit(0.0).alias(f"% Sales {ns}"))
+        context.log.info(f"  Created fallback dataframe for category {cat}: {store_nums.shape}")
+        return store_nums
 
 
 @dg.asset(
@@ -402,7 +602,7 @@ def internal_sales_by_category(
     deps=["internal_sales_by_category"],
     compute_kind="internal_preprocessing",
     group_name="preprocessing",
-    required_resource_keys={"sales_by_category_writer"},
+    required_resource_keys={"sales_by_category_writer", "job_params"},
 )
 def internal_output_sales_table(
     context: dg.AssetExecutionContext,
@@ -440,13 +640,20 @@ def internal_output_sales_table(
 
         context.log.info(f"Found {len(all_stores)} unique stores across all categories")
 
+        metadata = {
+            "num_categories": len(internal_sales_by_category),
+            "num_stores": len(all_stores),
+        }
+
+        # Tell downstream consumers which categories actually changed
+        store_dir = getattr(context.resources.job_params, "incremental_store_dir", None)
+        if store_dir:
+            dirty = dirty_categories(store_dir)
+            context.log.info(f"Categories changed since the previous run: {dirty}")
+            metadata["dirty_categories"] = dg.MetadataValue.json(dirty)
+
         # Add metadata
-        context.add_output_metadata(
-            metadata={
-                "num_categories": len(internal_sales_by_category),
-                "num_stores": len(all_stores),
-            }
-        )
+        context.add_output_metadata(metadata=metadata)
 
         context.log.info("Successfully wrote sales by category data")
 
@@ -63,7 +63,9 @@ from clustering.pipeline.assets.preprocessing.internal import (
 )
 
 # Resources
+from clustering.shared.io.blob_clients import BlobClientSettings, configure_blob_clients
 from clustering.pipeline.resources.data_io import data_reader, data_writer
+from clustering.pipeline.resources.io_manager import columnar_io_manager
 
 
 # Define Environment enum locally
@@ -365,6 +367,16 @@ def get_resources_by_env(
     readers_config = config_data.get("readers", {})
     writers_config = config_data.get("writers", {})
 
+    # Blob readers and writers share one pooled client per connection string
+    azure_storage = config_data.get("azure_storage") or {}
+    configure_blob_clients(
+        **{
+            name: value
+            for name, value in azure_storage.items()
+            if name in BlobClientSettings.model_fields
+        }
+    )
+
     # Create config object
     params = SimpleNamespace(**job_params)
     # Set the env as Environment enum if possible
@@ -383,6 +395,9 @@ def get_resources_by_env(
         "io_manager": dg.FilesystemIOManager(
             base_dir=os.environ.get("DAGSTER_STORAGE_DIR", "storage")
         ),
+        "columnar_io_manager": columnar_io_manager.configured(
+            {"base_dir": os.path.join(os.environ.get("DAGSTER_STORAGE_DIR", "storage"), "columnar")}
+        ),
         # Parameter resources (both names point to same resource)
         "job_params": params_resource,
         "config": params_resource,
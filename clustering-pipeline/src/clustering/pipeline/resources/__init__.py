@@ -1,8 +1,11 @@
 """Resources for Dagster pipelines."""
 
 from .data_io import data_reader, data_writer
+from .io_manager import ColumnarIOManager, columnar_io_manager
 
 __all__ = [
+    "ColumnarIOManager",
+    "columnar_io_manager",
     "data_reader",
     "data_writer",
 ]
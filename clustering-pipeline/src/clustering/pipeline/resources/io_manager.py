@@ -0,0 +1,140 @@
+"""Columnar IO manager for handing DataFrames between assets."""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import dagster as dg
+import polars as pl
+
+from clustering.shared.common.filesystem import set_default_permissions
+
+INDEX_FILE = "_index.json"
+
+
+class ColumnarIOManager(dg.IOManager):
+    """IO manager that stores Polars DataFrames as Arrow IPC files.
+
+    A single DataFrame is stored as ``<asset key>.arrow``. A dictionary of
+    DataFrames is stored as a ``<asset key>/`` directory with one file per key
+    and an index that preserves the original keys and their order. Files are
+    memory-mapped on load, so downstream assets read them without a pickle
+    round trip or a pandas conversion.
+    """
+
+    def __init__(self, base_dir: str) -> None:
+        """Initialize the IO manager.
+
+        Args:
+            base_dir: Directory under which asset outputs are stored
+        """
+        self.base_dir = Path(base_dir)
+
+    def _path(self, context: dg.OutputContext | dg.InputContext) -> Path:
+        """Get the storage path for an asset, without extension."""
+        return self.base_dir.joinpath(*context.asset_key.path)
+
+    def handle_output(
+        self, context: dg.OutputContext, obj: pl.DataFrame | dict[str, pl.DataFrame] | None
+    ) -> None:
+        """Write an asset output as Arrow IPC.
+
+        Args:
+            context: Output context
+            obj: DataFrame or dictionary of DataFrames to store
+
+        Raises:
+            TypeError: If the output is not columnar
+        """
+        if obj is None:
+            return
+
+        path = self._path(context)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(obj, pl.DataFrame):
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".arrow.tmp")
+            os.close(fd)
+            obj.write_ipc(tmp_name)
+            set_default_permissions(tmp_name)
+            _remove(path)
+            os.replace(tmp_name, path.with_suffix(".arrow"))
+            context.add_output_metadata({"rows": obj.height, "columns": obj.width})
+        elif isinstance(obj, dict) and all(isinstance(v, pl.DataFrame) for v in obj.values()):
+            tmp_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+            index = {}
+            for position, (key, frame) in enumerate(obj.items()):
+                file_name = f"{position:05d}.arrow"
+                frame.write_ipc(tmp_dir / file_name)
+                index[str(key)] = file_name
+            (tmp_dir / INDEX_FILE).write_text(json.dumps(index))
+            set_default_permissions(tmp_dir)
+            _remove(path)
+            os.replace(tmp_dir, path)
+            context.add_output_metadata({"keys": len(obj)})
+        else:
+            raise TypeError(
+                f"ColumnarIOManager can only store DataFrames or dictionaries of DataFrames, "
+                f"got {type(obj).__name__} for {context.asset_key.to_user_string()}"
+            )
+
+    def load_input(self, context: dg.InputContext) -> pl.DataFrame | dict[str, pl.DataFrame]:
+        """Load an upstream asset from Arrow IPC.
+
+        Args:
+            context: Input context
+
+        Returns:
+            The stored DataFrame or dictionary of DataFrames
+
+        Raises:
+            FileNotFoundError: If the upstream asset has not been materialized
+        """
+        path = self._path(context)
+
+        if path.with_suffix(".arrow").exists():
+            return pl.read_ipc(path.with_suffix(".arrow"), memory_map=True)
+
+        if (path / INDEX_FILE).exists():
+            index: dict[str, Any] = json.loads((path / INDEX_FILE).read_text())
+            return {
+                key: pl.read_ipc(path / file_name, memory_map=True)
+                for key, file_name in index.items()
+            }
+
+        raise FileNotFoundError(
+            f"No stored output for {context.asset_key.to_user_string()} under {self.base_dir}"
+        )
+
+
+def _remove(path: Path) -> None:
+    """Remove a previous output stored either as a file or a directory."""
+    if path.is_dir():
+        shutil.rmtree(path)
+    if path.with_suffix(".arrow").exists():
+        path.with_suffix(".arrow").unlink()
+
+
+@dg.io_manager(
+    config_schema={
+        "base_dir": dg.Field(
+            dg.String,
+            is_required=False,
+            default_value="storage/columnar",
+            description="Directory under which asset outputs are stored",
+        ),
+    }
+)
+def columnar_io_manager(context: dg.InitResourceContext) -> ColumnarIOManager:
+    """Resource for storing DataFrame assets as Arrow IPC.
+
+    Args:
+        context: The context for initializing the resource.
+
+    Returns:
+        ColumnarIOManager: A configured IO manager.
+    """
+    return ColumnarIOManager(base_dir=context.resource_config["base_dir"])
@@ -1,5 +1,6 @@
 """Filesystem utilities."""
 
+import functools
 import os
 from pathlib import Path
 
@@ -18,6 +19,27 @@ def ensure_directory(path: str | Path) -> Path:
     return path_obj
 
 
+@functools.cache
+def _umask() -> int:
+    """Read the process umask once; it can only be read by setting it."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def set_default_permissions(path: str | Path) -> None:
+    """Give a file or directory the mode it would get from a plain create.
+
+    ``tempfile.mkstemp`` and ``mkdtemp`` create owner-only entries, so outputs
+    written through them are chmod-ed with this before being moved into place.
+
+    Args:
+        path: Path to the file or directory
+    """
+    mode = 0o777 if os.path.isdir(path) else 0o666
+    os.chmod(path, mode & ~_umask())
+
+
 def get_project_root() -> Path:
     """Get the project root directory."""
     # Start from this file's location
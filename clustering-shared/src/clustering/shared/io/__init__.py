@@ -1,6 +1,12 @@
 """Input/Output services for the clustering pipeline."""
 
+from clustering.shared.io.async_io import IOResult, read_many, write_many
+from clustering.shared.io.compression import CODECS, open_decompressed
+from clustering.shared.io.ingest_cache import IngestCache
+from clustering.shared.io.manifest import read_manifest
+from clustering.shared.io.query_cache import QueryCache
 from clustering.shared.io.readers import (
+    ArrowTablesReader,
     BlobReader,
     CSVReader,
     ExcelReader,
@@ -11,6 +17,7 @@ from clustering.shared.io.readers import (
     SnowflakeReader,
 )
 from clustering.shared.io.writers import (
+    ArrowTablesWriter,
     BlobWriter,
     CSVWriter,
     ExcelWriter,
@@ -22,9 +29,22 @@ from clustering.shared.io.writers import (
 )
 
 __all__ = [
+    # Concurrent I/O
+    "IOResult",
+    "read_many",
+    "write_many",
+    # Caches
+    "IngestCache",
+    "QueryCache",
+    # Compression
+    "CODECS",
+    "open_decompressed",
+    # Manifests
+    "read_manifest",
     # Readers
     "Reader",
     "FileReader",
+    "ArrowTablesReader",
     "BlobReader",
     "CSVReader",
     "ExcelReader",
@@ -34,6 +54,7 @@ __all__ = [
     # Writers
     "Writer",
     "FileWriter",
+    "ArrowTablesWriter",
     "BlobWriter",
     "CSVWriter",
     "ExcelWriter",
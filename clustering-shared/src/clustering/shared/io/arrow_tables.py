@@ -0,0 +1,109 @@
+"""Multi-table container of Arrow IPC tables.
+
+A container holds several named tables in one file. Each table is stored as a
+complete Arrow IPC file, and a JSON index at the end of the container records
+the key, byte range and row count of every table::
+
+    [IPC table 0][IPC table 1]...[index JSON][index length: u64 LE][MAGIC]
+
+Reading a key memory-maps the container and opens only that table's byte
+range, so the other tables are never read and uncompressed columns are used
+without a copy.
+"""
+
+import json
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+from pyarrow import ipc
+
+from clustering.shared.common.filesystem import set_default_permissions
+
+MAGIC = b"CLTABLES"
+_TRAILER = struct.Struct("<Q")
+
+
+def write_tables(path: str, tables: dict[str, pa.Table], compression: str | None = None) -> None:
+    """Write named tables to a container atomically.
+
+    Args:
+        path: Destination file
+        tables: Tables keyed by name, written in order
+        compression: IPC buffer compression, ``"lz4"`` or ``"zstd"``; tables
+            written without compression can be read without a copy
+    """
+    destination = Path(path)
+    options = ipc.IpcWriteOptions(compression=compression)
+    fd, tmp_name = tempfile.mkstemp(dir=destination.parent, suffix=".tables.tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            entries = []
+            for key, table in tables.items():
+                sink = pa.BufferOutputStream()
+                with ipc.new_file(sink, table.schema, options=options) as writer:
+                    writer.write_table(table)
+                buffer = sink.getvalue()
+                entries.append(
+                    {
+                        "key": key,
+                        "offset": file.tell(),
+                        "length": buffer.size,
+                        "rows": table.num_rows,
+                    }
+                )
+                file.write(buffer)
+
+            index = json.dumps({"version": 1, "tables": entries}).encode()
+            file.write(index)
+            file.write(_TRAILER.pack(len(index)))
+            file.write(MAGIC)
+        set_default_permissions(tmp_name)
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_index(source: pa.NativeFile) -> list[dict[str, Any]]:
+    """Read the index of an open container.
+
+    Args:
+        source: Open container file
+
+    Returns:
+        Entries with the key, offset, length and row count of each table
+
+    Raises:
+        ValueError: If the file is not a table container
+    """
+    size = source.size()
+    trailer_size = _TRAILER.size + len(MAGIC)
+    if size < trailer_size:
+        raise ValueError("Not a table container: file too small")
+
+    source.seek(size - trailer_size)
+    trailer = source.read(trailer_size)
+    if trailer[_TRAILER.size :] != MAGIC:
+        raise ValueError("Not a table container: missing magic bytes")
+
+    (index_length,) = _TRAILER.unpack(trailer[: _TRAILER.size])
+    source.seek(size - trailer_size - index_length)
+    return json.loads(source.read(index_length))["tables"]
+
+
+def read_table(source: pa.NativeFile, entry: dict[str, Any]) -> pa.Table:
+    """Read one table of an open container.
+
+    Args:
+        source: Open container file, ideally memory-mapped
+        entry: Index entry of the table
+
+    Returns:
+        The table, backed by the container's memory map when uncompressed
+    """
+    source.seek(entry["offset"])
+    return ipc.open_file(source.read_buffer(entry["length"])).read_all()
@@ -0,0 +1,153 @@
+"""Process-wide registry of pooled Azure Blob Service clients."""
+
+import importlib.util
+import threading
+from typing import Any
+
+import pydantic as pdt
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.blob import BlobServiceClient
+from azure.storage.blob.aio import BlobClient as AsyncBlobClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class BlobClientSettings(pdt.BaseModel):
+    """Connection settings of the pooled blob clients.
+
+    Attributes:
+        max_connections: Maximum number of pooled connections per storage host
+        connection_timeout: Seconds to wait when opening a connection
+        read_timeout: Seconds to wait for data on an open connection
+    """
+
+    max_connections: int = pdt.Field(default=32, ge=1)
+    connection_timeout: float = 20.0
+    read_timeout: float = 60.0
+
+
+_lock = threading.Lock()
+_settings = BlobClientSettings()
+_clients: dict[str, tuple[BlobServiceClient, requests.Session]] = {}
+
+
+def configure_blob_clients(**settings: Any) -> BlobClientSettings:
+    """Set the connection settings of the pooled blob clients.
+
+    Clients created before the call keep their settings, so they are closed and
+    replaced on next use when the settings change.
+
+    Args:
+        **settings: Fields of BlobClientSettings to change
+
+    Returns:
+        The settings now in effect
+    """
+    global _settings
+
+    with _lock:
+        updated = BlobClientSettings(**{**_settings.model_dump(), **settings})
+        if updated != _settings:
+            _settings = updated
+            _close_all()
+        return _settings
+
+
+def get_blob_service_client(connection_string: str) -> BlobServiceClient:
+    """Get the shared Blob Service client for a connection string.
+
+    The first call for a connection string creates a client whose transport
+    keeps a pool of open HTTP connections. Later calls, from any reader, writer
+    or thread, reuse it instead of setting up new sessions and TLS handshakes.
+
+    Args:
+        connection_string: Azure Storage connection string
+
+    Returns:
+        The pooled BlobServiceClient
+    """
+    with _lock:
+        entry = _clients.get(connection_string)
+        if entry is None:
+            entry = _create_client(connection_string, _settings)
+            _clients[connection_string] = entry
+        return entry[0]
+
+
+def async_blob_clients_available() -> bool:
+    """Check whether native async blob clients can be created; they need aiohttp."""
+    return importlib.util.find_spec("aiohttp") is not None
+
+
+def create_async_blob_client(
+    connection_string: str, container_name: str, blob_name: str
+) -> AsyncBlobClient:
+    """Create a native async client for one blob.
+
+    Async clients are bound to the event loop that uses them, so they are not
+    pooled. Use the client as an async context manager to close its session.
+
+    Args:
+        connection_string: Azure Storage connection string
+        container_name: Name of the container
+        blob_name: Name of the blob
+
+    Returns:
+        The async BlobClient, with the configured timeouts
+    """
+    with _lock:
+        settings = _settings
+    return AsyncBlobClient.from_connection_string(
+        connection_string,
+        container_name,
+        blob_name,
+        connection_timeout=settings.connection_timeout,
+        read_timeout=settings.read_timeout,
+    )
+
+
+def close_blob_clients() -> None:
+    """Close every pooled client and its connections."""
+    with _lock:
+        _close_all()
+
+
+def _create_client(
+    connection_string: str, settings: BlobClientSettings
+) -> tuple[BlobServiceClient, requests.Session]:
+    """Create a client whose transport uses a pooled HTTP session.
+
+    Args:
+        connection_string: Azure Storage connection string
+        settings: Connection settings
+
+    Returns:
+        The client and the session it owns
+    """
+    session = requests.Session()
+    # The Azure pipeline retries requests itself
+    adapter = HTTPAdapter(
+        pool_connections=settings.max_connections,
+        pool_maxsize=settings.max_connections,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    transport = RequestsTransport(
+        session=session,
+        session_owner=False,
+        connection_timeout=settings.connection_timeout,
+        read_timeout=settings.read_timeout,
+    )
+    client = BlobServiceClient.from_connection_string(connection_string, transport=transport)
+    return client, session
+
+
+def _close_all() -> None:
+    """Close and forget every pooled client. The caller holds the lock."""
+    for client, session in _clients.values():
+        client.close()
+        session.close()
+    _clients.clear()
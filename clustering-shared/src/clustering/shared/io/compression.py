@@ -0,0 +1,236 @@
+"""Compression codecs for written files and blobs."""
+
+import gzip
+import io
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pyarrow as pa
+
+# Codecs a writer can compress its output with
+CODECS = ("gzip", "zstd", "lz4")
+
+# File name extensions of compressed files
+CODEC_EXTENSIONS = {".gz": "gzip", ".zst": "zstd", ".lz4": "lz4"}
+
+# Leading bytes of gzip members, zstd frames and LZ4 frames
+_MAGIC = {
+    b"\x1f\x8b": "gzip",
+    b"\x28\xb5\x2f\xfd": "zstd",
+    b"\x04\x22\x4d\x18": "lz4",
+}
+
+_LEVELS = {"gzip": (0, 9)}
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def check_level(codec: str, level: int | None) -> None:
+    """Check that a compression level is valid for a codec.
+
+    Args:
+        codec: Name of the codec
+        level: Compression level, or None for the codec's default
+
+    Raises:
+        ValueError: If the codec is unknown or the level is out of range
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported codec: {codec}. Supported codecs are: {', '.join(CODECS)}")
+    if level is None:
+        return
+    if codec in _LEVELS:
+        low, high = _LEVELS[codec]
+    else:
+        low = pa.Codec.minimum_compression_level(codec)
+        high = pa.Codec.maximum_compression_level(codec)
+    if not low <= level <= high:
+        raise ValueError(f"Compression level for {codec} must be between {low} and {high}")
+
+
+def detect_codec(header: bytes) -> str | None:
+    """Identify the codec of compressed data from its first bytes.
+
+    Args:
+        header: At least the first four bytes of the data
+
+    Returns:
+        Name of the codec, or None if the data is not compressed
+    """
+    for magic, codec in _MAGIC.items():
+        if header.startswith(magic):
+            return codec
+    return None
+
+
+def file_codec(path: str | Path) -> str | None:
+    """Identify the codec a file was compressed with.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Name of the codec, or None if the file is not compressed
+    """
+    with open(path, "rb") as file:
+        return detect_codec(file.read(4))
+
+
+def compress_block(block: bytes, codec: str, level: int | None = None) -> bytes:
+    """Compress a block into one self-contained gzip member or zstd/LZ4 frame.
+
+    Args:
+        block: Data to compress
+        codec: Name of the codec
+        level: Compression level, or None for the codec's default
+
+    Returns:
+        The compressed block
+    """
+    if codec == "gzip":
+        # Arrow's one-shot gzip codec is not usable; zlib also releases the GIL.
+        # A fixed header timestamp keeps identical data byte-identical.
+        return gzip.compress(block, compresslevel=6 if level is None else level, mtime=0)
+    return pa.Codec(codec, compression_level=level).compress(block, asbytes=True)
+
+
+def compress_stream(
+    source: BinaryIO,
+    sink: BinaryIO,
+    codec: str,
+    level: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_workers: int | None = None,
+) -> None:
+    """Compress a stream as independently compressed blocks, in parallel.
+
+    Concatenated gzip members, zstd frames and LZ4 frames are valid streams
+    of their format, so the output is read back by any decompressor. Blocks
+    are compressed by a pool of threads and written in order, with at most
+    two blocks per worker held in memory.
+
+    Args:
+        source: Readable binary stream of the data
+        sink: Writable binary stream receiving the compressed data
+        codec: Name of the codec
+        level: Compression level, or None for the codec's default
+        block_size: Size of the uncompressed blocks in bytes
+        max_workers: Number of compression threads, by default one per CPU
+    """
+    check_level(codec, level)
+    workers = max_workers or os.cpu_count() or 1
+    pending: deque[Future[bytes]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while block := source.read(block_size):
+            pending.append(executor.submit(compress_block, block, codec, level))
+            while len(pending) >= 2 * workers:
+                sink.write(pending.popleft().result())
+        while pending:
+            sink.write(pending.popleft().result())
+
+
+def compress_bytes(
+    data: bytes,
+    codec: str,
+    level: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_workers: int | None = None,
+) -> bytes:
+    """Compress data held in memory as independently compressed blocks.
+
+    Args:
+        data: Data to compress
+        codec: Name of the codec
+        level: Compression level, or None for the codec's default
+        block_size: Size of the uncompressed blocks in bytes
+        max_workers: Number of compression threads, by default one per CPU
+
+    Returns:
+        The compressed data
+    """
+    sink = io.BytesIO()
+    compress_stream(io.BytesIO(data), sink, codec, level, block_size, max_workers)
+    return sink.getvalue()
+
+
+def open_decompressed(source: str | Path | BinaryIO) -> BinaryIO:
+    """Open a file for reading, decompressing it if it is compressed.
+
+    Args:
+        source: Path of the file, or a readable and seekable binary stream
+
+    Returns:
+        Buffered binary stream of the decompressed content; close it when done
+    """
+    if isinstance(source, str | Path):
+        file = open(source, "rb")  # noqa: SIM115 - returned to the caller, who closes it
+    else:
+        file = source
+    codec = detect_codec(file.read(4))
+    file.seek(0)
+    if codec is None:
+        return file
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=file)
+    stream = pa.CompressedInputStream(pa.PythonFile(file, mode="r"), codec)
+    return io.BufferedReader(_ArrowStream(stream, file), buffer_size=DEFAULT_BLOCK_SIZE)
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """Decompress data if it is compressed.
+
+    Args:
+        data: Data, compressed or not
+
+    Returns:
+        The decompressed data, or ``data`` itself if it is not compressed
+    """
+    if detect_codec(data[:4]) is None:
+        return data
+    with open_decompressed(io.BytesIO(data)) as file:
+        return file.read()
+
+
+class _ArrowStream(io.RawIOBase):
+    """Raw binary stream over an Arrow decompressing input stream.
+
+    Arrow streams lack ``readline`` and line iteration; wrapped in a
+    BufferedReader they behave like a regular binary file.
+    """
+
+    def __init__(self, stream: pa.NativeFile, file: Any) -> None:
+        """Initialize the stream.
+
+        Args:
+            stream: Arrow stream of the decompressed data
+            file: Underlying compressed file, closed with the stream
+        """
+        self.stream = stream
+        self.file = file
+
+    def readable(self) -> bool:
+        """Return whether the stream can be read."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read decompressed bytes into a buffer.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes read, 0 at the end of the data
+        """
+        data = self.stream.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """Close the Arrow stream and the underlying file."""
+        if not self.closed:
+            self.stream.close()
+            self.file.close()
+        super().close()
@@ -0,0 +1,156 @@
+"""Columnar ingest cache for text and spreadsheet sources."""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pydantic as pdt
+
+from clustering.shared.common.filesystem import get_project_root, set_default_permissions
+
+
+class IngestCache(pdt.BaseModel):
+    """Cache that keeps a Parquet copy of CSV and Excel sources.
+
+    The first read of a source parses it and stores the result as Parquet with the
+    inferred schema. Later reads scan the Parquet copy, so column projections and
+    row filters are pushed down instead of re-parsing the text.
+
+    Each entry is keyed by the source path and the parse options, and records the
+    source's size, modification time and content hash. An entry is reused when
+    the size and modification time still match, or when only the modification
+    time changed and the content hash did not. Otherwise the entry is stale and
+    is replaced.
+    """
+
+    cache_dir: str = str(get_project_root() / "cache/ingest")
+    hash_chunk_size: int = 1 << 20
+
+    def scan(
+        self,
+        path: str,
+        load: Callable[[], pl.DataFrame],
+        options: dict[str, Any] | None = None,
+    ) -> pl.LazyFrame:
+        """Scan the cached copy of a source, converting it first if needed.
+
+        Args:
+            path: Path to the source file
+            load: Function that parses the source into a DataFrame
+            options: Parse options that distinguish entries for the same path
+
+        Returns:
+            LazyFrame over the cached Parquet copy
+        """
+        source = Path(path).resolve()
+        entry = self._entry_path(source, options)
+        manifest = self._load_manifest(entry)
+
+        if manifest is None or not self._is_fresh(source, manifest):
+            self._store(source, entry, load(), options)
+
+        return pl.scan_parquet(entry.with_suffix(".parquet"))
+
+    def evict_stale(self) -> int:
+        """Remove entries whose source was deleted or changed.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for manifest_path in Path(self.cache_dir).glob("*.json"):
+            manifest = self._load_manifest(manifest_path.with_suffix(""))
+            source = Path(manifest["path"]) if manifest else None
+            if manifest is None or not source.exists() or not self._is_fresh(source, manifest):
+                self._remove(manifest_path.with_suffix(""))
+                removed += 1
+        return removed
+
+    def _entry_path(self, source: Path, options: dict[str, Any] | None) -> Path:
+        """Get the entry path, without extension, for a source and its options."""
+        key = json.dumps({"path": str(source), "options": options or {}}, sort_keys=True)
+        return Path(self.cache_dir) / hashlib.sha256(key.encode()).hexdigest()[:32]
+
+    def _content_hash(self, source: Path) -> str:
+        """Hash the source contents in fixed-size chunks."""
+        digest = hashlib.blake2b()
+        with open(source, "rb") as file:
+            while chunk := file.read(self.hash_chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _is_fresh(self, source: Path, manifest: dict[str, Any]) -> bool:
+        """Check whether a cache entry still matches its source."""
+        stat = source.stat()
+        if stat.st_size == manifest["size"] and stat.st_mtime_ns == manifest["mtime_ns"]:
+            return True
+        if stat.st_size != manifest["size"]:
+            return False
+
+        # Same size but touched: only the content decides
+        if self._content_hash(source) != manifest["content_hash"]:
+            return False
+
+        manifest["mtime_ns"] = stat.st_mtime_ns
+        self._write_manifest(self._entry_path(source, manifest["options"]), manifest)
+        return True
+
+    def _store(
+        self,
+        source: Path,
+        entry: Path,
+        data: pl.DataFrame,
+        options: dict[str, Any] | None,
+    ) -> None:
+        """Write a new cache entry, replacing any previous one atomically."""
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        stat = source.stat()
+
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".parquet.tmp")
+        os.close(fd)
+        data.write_parquet(tmp_name, statistics=True)
+        set_default_permissions(tmp_name)
+        os.replace(tmp_name, entry.with_suffix(".parquet"))
+
+        self._write_manifest(
+            entry,
+            {
+                "path": str(source),
+                "options": options or {},
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "content_hash": self._content_hash(source),
+                "schema": {name: str(dtype) for name, dtype in data.schema.items()},
+            },
+        )
+
+        # Misses are rare, so sweep entries of deleted or changed sources here
+        self.evict_stale()
+
+    def _load_manifest(self, entry: Path) -> dict[str, Any] | None:
+        """Load an entry's manifest, or None if the entry is missing or incomplete."""
+        manifest_path = entry.with_suffix(".json")
+        if not manifest_path.exists() or not entry.with_suffix(".parquet").exists():
+            return None
+        try:
+            return json.loads(manifest_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    def _write_manifest(self, entry: Path, manifest: dict[str, Any]) -> None:
+        """Write an entry's manifest atomically."""
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".json.tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump(manifest, file)
+        set_default_permissions(tmp_name)
+        os.replace(tmp_name, entry.with_suffix(".json"))
+
+    def _remove(self, entry: Path) -> None:
+        """Delete an entry's data and manifest."""
+        for suffix in (".parquet", ".json"):
+            entry.with_suffix(suffix).unlink(missing_ok=True)
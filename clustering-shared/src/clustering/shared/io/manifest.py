@@ -0,0 +1,134 @@
+"""Sidecar manifests recording the content checksums of written files."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from clustering.shared.common.filesystem import set_default_permissions
+
+# Appended to the name of the file or dataset a manifest describes
+MANIFEST_SUFFIX = ".manifest.json"
+
+_ALGORITHM = "sha256"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def manifest_path(path: str | Path) -> Path:
+    """Get the path of the manifest describing a file or dataset directory.
+
+    The manifest sits next to what it describes, never inside a dataset
+    directory, where readers would take it for a data file.
+
+    Args:
+        path: Path of the described file or dataset
+
+    Returns:
+        Path of the sidecar manifest
+    """
+    path = Path(path)
+    return path.with_name(path.name + MANIFEST_SUFFIX)
+
+
+def file_checksum(path: str | Path) -> str:
+    """Compute the checksum of a file's content, reading it in chunks.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Hex digest of the content
+    """
+    digest = hashlib.new(_ALGORITHM)
+    with open(path, "rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_entry(path: str | Path, checksum: str) -> dict[str, Any]:
+    """Describe a file that was just written.
+
+    Args:
+        path: Path of the file
+        checksum: Checksum of its content
+
+    Returns:
+        The ``algorithm`` and ``checksum`` of the content, and the ``size``
+        and ``mtime_ns`` of the file
+    """
+    stat = Path(path).stat()
+    return {
+        "algorithm": _ALGORITHM,
+        "checksum": checksum,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def is_unchanged(entry: dict[str, Any] | None, path: str | Path, checksum: str) -> bool:
+    """Check whether a file already holds content with the given checksum.
+
+    The file must still match the size and modification time recorded in its
+    entry, so a file changed by other means is not mistaken for current.
+
+    Args:
+        entry: Recorded description of the file, if any
+        path: Path of the file
+        checksum: Checksum of the new content
+
+    Returns:
+        True if the file exists and its entry records the same content
+    """
+    if not entry or entry.get("algorithm") != _ALGORITHM:
+        return False
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return False
+    return (
+        entry.get("checksum") == checksum
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    )
+
+
+def read_manifest(path: str | Path) -> dict[str, Any] | None:
+    """Read the manifest of a file or dataset.
+
+    A file's manifest is its entry, as made by ``file_entry``. A partitioned
+    dataset's manifest maps each data file, relative to the dataset root,
+    to its entry under ``files``. Checksums change only when the content
+    does, so they can serve as data versions.
+
+    Args:
+        path: Path of the described file or dataset
+
+    Returns:
+        The manifest, or None if it is missing or unreadable
+    """
+    try:
+        return json.loads(manifest_path(path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_manifest(path: str | Path, manifest: dict[str, Any]) -> None:
+    """Write the manifest of a file or dataset atomically.
+
+    Args:
+        path: Path of the described file or dataset
+        manifest: Manifest to write
+    """
+    destination = manifest_path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=destination.parent, suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump(manifest, file)
+        set_default_permissions(tmp_name)
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,309 @@
+"""DuckDB-backed cache of SQL query results."""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import duckdb
+import loguru
+import polars as pl
+import pydantic as pdt
+
+from clustering.shared.common.filesystem import get_project_root
+
+# String literals, quoted identifiers, comments, whitespace, or any other character
+_SQL_TOKEN = re.compile(
+    r"""(?P<literal>'(?:[^']|'')*')"""
+    r"""|(?P<quoted>"(?:[^"]|"")*")"""
+    r"""|(?P<comment>--[^\n]*|/\*.*?\*/)"""
+    r"""|(?P<space>\s+)"""
+    r"""|(?P<other>.)""",
+    re.DOTALL,
+)
+
+# Characters around which whitespace is insignificant
+_TIGHT = set("(),;=<>!+-*/.")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_cache_entries (
+    key VARCHAR PRIMARY KEY,
+    query VARCHAR,
+    created_at DOUBLE,
+    expires_at DOUBLE,
+    last_access DOUBLE,
+    size_bytes BIGINT,
+    hits BIGINT
+);
+CREATE TABLE IF NOT EXISTS query_cache_stats (name VARCHAR PRIMARY KEY, value BIGINT);
+INSERT OR IGNORE INTO query_cache_stats VALUES ('hits', 0), ('misses', 0), ('evictions', 0);
+"""
+
+# DuckDB allows one writing process per file, and one connection per file in a process
+_lock = threading.Lock()
+
+
+def normalize_sql(query: str) -> str:
+    """Normalize a SQL query so that equivalent spellings share a cache entry.
+
+    Comments and trailing semicolons are removed, whitespace runs become a
+    single space or vanish next to punctuation, and unquoted text is
+    lowercased. String literals and quoted
+    identifiers are kept as written, since their case is significant.
+
+    Args:
+        query: SQL query
+
+    Returns:
+        The normalized query
+    """
+    parts: list[str] = []
+    pending_space = False
+    for match in _SQL_TOKEN.finditer(query):
+        kind, text = match.lastgroup, match.group()
+        if kind in ("comment", "space"):
+            pending_space = bool(parts)
+            continue
+        if kind == "other":
+            text = text.lower()
+        # Spacing around punctuation and operators does not change the query
+        if pending_space and parts[-1][-1] not in _TIGHT and text[0] not in _TIGHT:
+            parts.append(" ")
+        parts.append(text)
+        pending_space = False
+
+    normalized = "".join(parts)
+    while normalized.endswith(";"):
+        normalized = normalized[:-1]
+    return normalized
+
+
+class QueryCache(pdt.BaseModel):
+    """Cache of query results stored as native DuckDB tables.
+
+    Entries are keyed by a hash of the normalized query, so formatting changes
+    do not cause misses, and storing a result replaces the previous one. Each
+    entry expires ``ttl_seconds`` after it was stored. When the tables outgrow
+    ``max_bytes`` on disk, the least recently used entries are evicted.
+
+    Hits, misses and evictions are counted in the cache file, so every process
+    sharing the file (pipeline runs, the dashboard) reports the same metrics.
+    If another process holds the file, lookups and stores are skipped rather
+    than blocking the read.
+    """
+
+    cache_file: str = str(get_project_root() / "cache/snowflake_cache.duckdb")
+    ttl_seconds: float | None = pdt.Field(default=24 * 3600, gt=0)
+    max_bytes: int = pdt.Field(default=2 * 1024**3, gt=0)
+    lock_retries: int = 5
+
+    def get(self, query: str) -> pl.DataFrame | None:
+        """Get the cached result of a query.
+
+        Args:
+            query: SQL query
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        if not os.path.exists(self.cache_file):
+            return None
+
+        key = self.key(query)
+        now = time.time()
+        with self._connect() as conn:
+            if conn is None:
+                return None
+            entry = conn.execute(
+                "SELECT expires_at FROM query_cache_entries WHERE key = ?", [key]
+            ).fetchone()
+
+            if entry is None or (entry[0] is not None and entry[0] <= now):
+                if entry is not None:
+                    self._drop(conn, [key])
+                self._count(conn, "misses")
+                return None
+
+            conn.execute(
+                "UPDATE query_cache_entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                [now, key],
+            )
+            self._count(conn, "hits")
+            return conn.execute(f"SELECT * FROM {_table(key)}").pl()
+
+    def put(self, query: str, data: pl.DataFrame) -> None:
+        """Store the result of a query, replacing any previous one.
+
+        Expired entries are then removed, followed by the least recently used
+        ones until the cache fits its budget again.
+
+        Args:
+            query: SQL query
+            data: Result of the query
+        """
+        key = self.key(query)
+        now = time.time()
+        expires_at = None if self.ttl_seconds is None else now + self.ttl_seconds
+        Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            if conn is None:
+                return
+            conn.register("incoming", data)
+            try:
+                conn.execute(f"CREATE OR REPLACE TABLE {_table(key)} AS SELECT * FROM incoming")
+            finally:
+                conn.unregister("incoming")
+            # Flush the table so its size on disk can be measured
+            conn.execute("CHECKPOINT")
+            conn.execute(
+                "INSERT OR REPLACE INTO query_cache_entries VALUES (?, ?, ?, ?, ?, ?, 0)",
+                [key, query, now, expires_at, now, _table_bytes(conn, _table(key))],
+            )
+            self._evict(conn, now)
+
+    def stats(self) -> dict[str, int]:
+        """Get the cache metrics.
+
+        Returns:
+            Hits, misses and evictions so far, and the current number of
+            entries and their size on disk in bytes
+        """
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "size_bytes": 0}
+        if not os.path.exists(self.cache_file):
+            return stats
+
+        with self._connect() as conn:
+            if conn is None:
+                return stats
+            stats.update(conn.execute("SELECT name, value FROM query_cache_stats").fetchall())
+            entries, size = conn.execute(
+                "SELECT count(*), coalesce(sum(size_bytes), 0) FROM query_cache_entries"
+            ).fetchone()
+        return {**stats, "entries": entries, "size_bytes": int(size)}
+
+    def clear(self) -> None:
+        """Remove every entry, keeping the metrics."""
+        if not os.path.exists(self.cache_file):
+            return
+
+        with self._connect() as conn:
+            if conn is not None:
+                rows = conn.execute("SELECT key FROM query_cache_entries").fetchall()
+                self._drop(conn, [row[0] for row in rows])
+
+    @staticmethod
+    def key(query: str) -> str:
+        """Get the cache key of a query.
+
+        Args:
+            query: SQL query
+
+        Returns:
+            Hash of the normalized query
+        """
+        return hashlib.sha256(normalize_sql(query).encode()).hexdigest()
+
+    @contextmanager
+    def _connect(self) -> Iterator[duckdb.DuckDBPyConnection | None]:
+        """Open the cache file, retrying while another process holds it.
+
+        Yields:
+            Connection with the cache schema, or None if the file stayed locked
+        """
+        with _lock:
+            conn = None
+            for attempt in range(self.lock_retries):
+                try:
+                    conn = duckdb.connect(self.cache_file)
+                    break
+                except duckdb.IOException as e:
+                    if attempt == self.lock_retries - 1:
+                        loguru.logger.warning(f"Query cache unavailable: {e}")
+                    else:
+                        time.sleep(0.05 * 2**attempt)
+            if conn is None:
+                yield None
+                return
+
+            try:
+                conn.execute(_SCHEMA)
+                # Results stored as Parquet blobs before the cache held native tables
+                conn.execute("DROP TABLE IF EXISTS cache")
+                yield conn
+            finally:
+                conn.close()
+
+    def _evict(self, conn: duckdb.DuckDBPyConnection, now: float) -> None:
+        """Remove expired entries, then least recently used ones over the budget.
+
+        Args:
+            conn: Connection to the cache file
+            now: Current time
+        """
+        expired = [
+            row[0]
+            for row in conn.execute(
+                "SELECT key FROM query_cache_entries WHERE expires_at <= ?", [now]
+            ).fetchall()
+        ]
+
+        over_budget = []
+        total = 0
+        entries = conn.execute(
+            "SELECT key, size_bytes FROM query_cache_entries "
+            "WHERE expires_at IS NULL OR expires_at > ? ORDER BY last_access DESC",
+            [now],
+        ).fetchall()
+        for index, (key, size) in enumerate(entries):
+            total += size
+            # The most recent entry is kept even if it alone exceeds the budget
+            if total > self.max_bytes and index > 0:
+                over_budget.append(key)
+
+        self._drop(conn, expired + over_budget)
+        self._count(conn, "evictions", len(expired) + len(over_budget))
+
+    @staticmethod
+    def _drop(conn: duckdb.DuckDBPyConnection, keys: list[str]) -> None:
+        """Drop entries and their tables.
+
+        Args:
+            conn: Connection to the cache file
+            keys: Keys of the entries
+        """
+        for key in keys:
+            conn.execute(f"DROP TABLE IF EXISTS {_table(key)}")
+            conn.execute("DELETE FROM query_cache_entries WHERE key = ?", [key])
+
+    @staticmethod
+    def _count(conn: duckdb.DuckDBPyConnection, name: str, amount: int = 1) -> None:
+        """Increase a metric.
+
+        Args:
+            conn: Connection to the cache file
+            name: Name of the metric
+            amount: Amount to add
+        """
+        if amount:
+            conn.execute(
+                "UPDATE query_cache_stats SET value = value + ? WHERE name = ?", [amount, name]
+            )
+
+
+def _table(key: str) -> str:
+    """Get the name of the table holding an entry's result."""
+    return f"result_{key[:32]}"
+
+
+def _table_bytes(conn: duckdb.DuckDBPyConnection, table: str) -> int:
+    """Measure the disk space used by a table."""
+    (block_size,) = conn.execute("SELECT block_size FROM pragma_database_size()").fetchone()
+    (blocks,) = conn.execute(
+        f"SELECT count(DISTINCT block_id) FROM pragma_storage_info('{table}') WHERE block_id >= 0"
+    ).fetchone()
+    return blocks * block_size
@@ -1,5 +1,6 @@
 """Data readers for the clustering pipeline."""
 
+from clustering.shared.io.readers.arrow_tables_reader import ArrowTablesReader
 from clustering.shared.io.readers.base import FileReader, Reader
 from clustering.shared.io.readers.blob_reader import BlobReader
 from clustering.shared.io.readers.csv_reader import CSVReader
@@ -12,6 +13,7 @@ from clustering.shared.io.readers.snowflake_reader import SnowflakeReader
 __all__ = [
     "Reader",
     "FileReader",
+    "ArrowTablesReader",
     "BlobReader",
     "CSVReader",
     "ExcelReader",
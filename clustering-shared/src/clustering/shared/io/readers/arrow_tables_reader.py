@@ -0,0 +1,54 @@
+"""Arrow table container reader implementation."""
+
+import polars as pl
+import pyarrow as pa
+
+from clustering.shared.io.arrow_tables import read_index, read_table
+from clustering.shared.io.readers.base import FileReader
+
+
+class ArrowTablesReader(FileReader):
+    """Reader for containers of named Arrow IPC tables.
+
+    Only the requested keys are read. The container is memory-mapped, so a
+    single category costs one table regardless of how many the file holds.
+    """
+
+    keys: list[str] | None = None
+    memory_map: bool = True
+
+    def _read_from_source(self) -> dict[str, pl.DataFrame]:
+        """Read the selected tables from the container.
+
+        Returns:
+            Dictionary of DataFrames keyed by table name, in container order
+
+        Raises:
+            KeyError: If a requested key is not in the container
+        """
+        source = pa.memory_map(self.path) if self.memory_map else pa.OSFile(self.path)
+        with source:
+            entries = {entry["key"]: entry for entry in read_index(source)}
+            missing = [key for key in self.keys or [] if key not in entries]
+            if missing:
+                raise KeyError(f"Keys not found in {self.path}: {', '.join(missing)}")
+
+            selected = [key for key in entries if self.keys is None or key in self.keys]
+            return {
+                key: pl.from_arrow(read_table(source, entries[key]), rechunk=False)
+                for key in selected
+            }
+
+    def read(self) -> dict[str, pl.DataFrame]:
+        """Read the selected tables, applying the pushdown options to each.
+
+        Returns:
+            Dictionary of DataFrames keyed by table name
+        """
+        self._validate_source()
+        data = self._read_from_source()
+        if self._has_pushdown():
+            data = {
+                key: self._apply_pushdown(frame.lazy()).collect() for key, frame in data.items()
+            }
+        return data
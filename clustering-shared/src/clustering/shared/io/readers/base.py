@@ -1,15 +1,57 @@
 """Base classes for data readers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import Any, ClassVar
 
 import polars as pl
 import pydantic as pdt
 
+# Comparison operators accepted in filter predicates
+FILTER_OPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+# Reader fields that describe what to read rather than where to read it from
+PUSHDOWN_FIELDS = {"limit", "columns", "filters", "sample_fraction", "sample_seed"}
+
+# Temporary column holding the row position while sampling
+_ROW_INDEX = "__reader_row_index"
+
 
 class Reader(pdt.BaseModel, ABC):
-    """Base class for data readers."""
+    """Base class for data readers.
+
+    Readers share a pushdown contract: ``filters`` keep rows matching every
+    ``(column, operator, value)`` predicate, ``sample_fraction`` keeps a seeded
+    random share of those rows, ``columns`` projects the result and ``limit``
+    caps the number of rows, applied in that order. Readers with
+    ``native_pushdown`` hand these options to the source so only the requested
+    data is loaded. Other readers load everything and the base class applies the
+    options afterwards.
+    """
 
     limit: int | None = None
+    columns: list[str] | None = None
+    filters: list[tuple[str, str, Any]] | None = None
+    sample_fraction: float | None = pdt.Field(default=None, gt=0, le=1)
+    sample_seed: int = 0
+
+    # Whether _read_from_source already applies the pushdown options
+    native_pushdown: ClassVar[bool] = False
+
+    @pdt.field_validator("filters")
+    @classmethod
+    def _check_filters(
+        cls, filters: list[tuple[str, str, Any]] | None
+    ) -> list[tuple[str, str, Any]] | None:
+        """Reject predicates with unknown operators."""
+        for column, operator, _ in filters or []:
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Unsupported filter operator {operator!r} on column {column!r}. "
+                    f"Supported operators are: {', '.join(FILTER_OPERATORS)}"
+                )
+        return filters
 
     def read(self) -> pl.DataFrame:
         """Template method defining the reading algorithm.
@@ -27,12 +69,58 @@ class Reader(pdt.BaseModel, ABC):
         # Step 2: Read data from source (implemented by subclasses)
         data = self._read_from_source()
 
-        # Step 3: Apply limit if specified
-        if self.limit is not None:
-            data = data.head(self.limit)
+        # Steps 3 and 4: Apply the remaining pushdown options and post-process
+        return self._finish_read(data)
 
-        # Step 4: Post-process the data
-        return self._post_process(data)
+    async def read_async(self) -> pl.DataFrame:
+        """Read the data without blocking the event loop.
+
+        Readers with a native async client override this method. The default
+        implementation runs ``read`` in a worker thread, which suits file and
+        database reads that release the GIL while waiting on I/O.
+
+        Returns:
+            DataFrame containing the data
+        """
+        return await asyncio.to_thread(self.read)
+
+    def read_batches(self, batch_size: int = 50_000) -> Iterator[pl.DataFrame]:
+        """Read the data as a stream of DataFrames.
+
+        Readers with a native batched path read the source incrementally, so
+        memory use depends on the batch size rather than the source size. The
+        default implementation slices a full read.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches with the pushdown options applied
+
+        Raises:
+            ValueError: If the batch size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        self._validate_source()
+        yield from self._read_batches_from_source(batch_size)
+
+    def _read_batches_from_source(self, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Read batches from the source.
+
+        This hook method can be overridden by subclasses that can read the
+        source incrementally. Batches must have the pushdown options applied.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches of the data
+        """
+        data = self.read()
+        if isinstance(data, pl.LazyFrame):
+            data = data.collect()
+        yield from data.iter_slices(batch_size)
 
     def _validate_source(self) -> None:
         """Validate the data source before reading.
@@ -57,6 +145,88 @@ class Reader(pdt.BaseModel, ABC):
         """
         pass
 
+    def _finish_read(self, data: pl.DataFrame) -> pl.DataFrame:
+        """Apply the pushdown options the reader did not handle itself and post-process.
+
+        Args:
+            data: The data read from the source
+
+        Returns:
+            Processed DataFrame
+        """
+        if not self.native_pushdown and self._has_pushdown():
+            data = self._apply_pushdown(data.lazy()).collect()
+        return self._post_process(data)
+
+    def _has_pushdown(self) -> bool:
+        """Check whether any pushdown option is set."""
+        return any(
+            option is not None
+            for option in (self.limit, self.columns, self.filters, self.sample_fraction)
+        )
+
+    def _apply_pushdown(self, data: pl.LazyFrame, row_offset: int = 0) -> pl.LazyFrame:
+        """Apply the pushdown options to a lazy query.
+
+        Over a Polars scan, the projection, the predicates and the row limit are
+        pushed into the scan itself, so only the requested data is read.
+
+        Args:
+            data: Lazy query over the source
+            row_offset: Position of the first row in the source, for batches
+
+        Returns:
+            Lazy query with filters, sampling, projection and limit applied
+        """
+        # Sampling hashes each row's position in the source, which keeps it lazy
+        # and picks the same rows whether the source is read whole or in batches
+        sampling = self.sample_fraction is not None and self.sample_fraction < 1
+        if sampling:
+            data = data.with_row_index(_ROW_INDEX, offset=row_offset)
+
+        for column, operator, value in self.filters or []:
+            data = data.filter(_filter_expr(column, operator, value))
+
+        if sampling:
+            threshold = min(int(self.sample_fraction * 2**64), 2**64 - 1)
+            data = data.filter(
+                pl.col(_ROW_INDEX).hash(self.sample_seed) < pl.lit(threshold, pl.UInt64)
+            ).drop(_ROW_INDEX)
+
+        if self.columns is not None:
+            available = data.collect_schema()
+            data = data.select([col for col in self.columns if col in available])
+
+        if self.limit is not None:
+            data = data.head(self.limit)
+
+        return data
+
+    def _pushdown_batches(self, batches: Iterable[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+        """Apply the pushdown options to consecutive batches of the source.
+
+        Args:
+            batches: Unfiltered batches in source order
+
+        Yields:
+            Batches with filters, sampling and projection applied, stopping once
+            the limit is reached
+        """
+        remaining = self.limit
+        row_offset = 0
+        for batch in batches:
+            height = batch.height
+            if self._has_pushdown():
+                batch = self._apply_pushdown(batch.lazy(), row_offset).collect()
+            row_offset += height
+            if remaining is not None:
+                batch = batch.head(remaining)
+                remaining -= batch.height
+            if batch.height:
+                yield batch
+            if remaining == 0:
+                return
+
     def _post_process(self, data: pl.DataFrame) -> pl.DataFrame:
         """Post-process the data after reading.
 
@@ -72,6 +242,50 @@ class Reader(pdt.BaseModel, ABC):
         return data
 
 
+def rebatch(batches: Iterable[pl.DataFrame], batch_size: int) -> Iterator[pl.DataFrame]:
+    """Regroup batches of arbitrary sizes into batches of a fixed size.
+
+    Args:
+        batches: Consecutive batches of any size
+        batch_size: Number of rows per output batch
+
+    Yields:
+        Batches of ``batch_size`` rows, the last one possibly shorter
+    """
+    pending: list[pl.DataFrame] = []
+    pending_rows = 0
+    for batch in batches:
+        while batch.height:
+            part = batch.head(batch_size - pending_rows)
+            batch = batch.slice(part.height)
+            pending.append(part)
+            pending_rows += part.height
+            if pending_rows == batch_size:
+                yield pl.concat(pending, how="vertical_relaxed")
+                pending, pending_rows = [], 0
+    if pending:
+        yield pl.concat(pending, how="vertical_relaxed")
+
+
+def _filter_expr(column: str, operator: str, value: Any) -> pl.Expr:
+    """Build a Polars expression for a filter predicate."""
+    col = pl.col(column)
+    if value is None and operator in ("==", "!="):
+        return col.is_null() if operator == "==" else col.is_not_null()
+    if operator == "in":
+        return col.is_in(list(value))
+    if operator == "not in":
+        return ~col.is_in(list(value))
+    return {
+        "==": col.eq,
+        "!=": col.ne,
+        "<": col.lt,
+        "<=": col.le,
+        ">": col.gt,
+        ">=": col.ge,
+    }[operator](value)
+
+
 class FileReader(Reader):
     """Base class for file-based readers."""
 
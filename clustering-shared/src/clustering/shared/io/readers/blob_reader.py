@@ -1,18 +1,51 @@
 """Azure Blob Storage reader implementation."""
 
+import asyncio
+import hashlib
+import io
+import json
+import os
 import pickle
+import tempfile
 from io import BytesIO
+from pathlib import Path
+from typing import Any
 
 import polars as pl
-from azure.storage.blob import BlobServiceClient
+import pyarrow as pa
+import pyarrow.parquet as pq
+from azure.core import MatchConditions
+from azure.core.exceptions import AzureError
+from azure.storage.blob import BlobClient, BlobServiceClient
 
+from clustering.shared.common.filesystem import get_project_root, set_default_permissions
+from clustering.shared.io.blob_clients import (
+    async_blob_clients_available,
+    create_async_blob_client,
+    get_blob_service_client,
+)
+from clustering.shared.io.compression import decompress_bytes, file_codec, open_decompressed
 from clustering.shared.io.readers.base import Reader
 
+# Comparisons that row-group min/max statistics can rule out
+_PRUNABLE_OPERATORS = {"==", "<", "<=", ">", ">=", "in"}
+
 
 class BlobReader(Reader):
     """Reader for Azure Blob Storage.
 
     Supports reading CSV, Parquet, and Pickle files from Azure Blob Storage.
+
+    Parquet blobs read with a column selection, filters or a limit are fetched
+    with ranged requests: the footer first, then only the column chunks of the
+    row groups that can hold matching rows. Other reads download the whole
+    blob, into a local cache when ``use_cache`` is set. Cached copies are reused
+    as long as the blob's ETag and Last-Modified time are unchanged.
+
+    ``read_async`` downloads whole blobs with the native async client when
+    aiohttp is installed, so concurrent reads do not each hold a thread.
+
+    Blobs compressed with gzip, zstd or LZ4 are decompressed before parsing.
     """
 
     connection_string: str
@@ -21,6 +54,10 @@ class BlobReader(Reader):
     file_format: str
     max_concurrency: int = 8
 
+    # Local copies of downloaded blobs, revalidated against the blob properties
+    use_cache: bool = False
+    cache_dir: str = str(get_project_root() / "cache/blob")
+
     def _validate_source(self) -> None:
         """Validate the blob storage connection and file format.
 
@@ -37,10 +74,13 @@ class BlobReader(Reader):
     def _get_blob_service_client(self) -> BlobServiceClient:
         """Get the Azure Blob Service client.
 
+        The client is shared by every reader and writer using the same
+        connection string, so its pooled connections are reused.
+
         Returns:
             BlobServiceClient: The Azure Blob Service client
         """
-        return BlobServiceClient.from_connection_string(self.connection_string)
+        return get_blob_service_client(self.connection_string)
 
     def _read_from_source(self) -> pl.DataFrame:
         """Read data from Azure Blob Storage.
@@ -61,22 +101,80 @@ class BlobReader(Reader):
         blob_client = container_client.get_blob_client(self.blob_path)
 
         try:
-            # Download the blob content with parallelism
-            blob_data = blob_client.download_blob(max_concurrency=self.max_concurrency).readall()
-        except Exception as e:
-            raise RuntimeError(f"Failed to download blob: {e}")
+            if self.file_format == "parquet" and self._is_selective():
+                return self._read_parquet_ranges(blob_client)
+
+            if self.use_cache:
+                source = str(self._download_to_cache(blob_client))
+            else:
+                # Download the blob content with parallelism
+                source = BytesIO(
+                    blob_client.download_blob(max_concurrency=self.max_concurrency).readall()
+                )
+        except (AzureError, OSError, pa.ArrowInvalid) as e:
+            raise RuntimeError(f"Failed to download blob: {e}") from e
+
+        return self._parse(source)
+
+    async def read_async(self) -> pl.DataFrame:
+        """Read data from Azure Blob Storage without blocking the event loop.
+
+        Whole-blob downloads use the native async client. Ranged and cached
+        reads, and every read when aiohttp is missing, run in a worker thread.
+
+        Returns:
+            DataFrame containing the data
+
+        Raises:
+            RuntimeError: If there's an error downloading from blob storage
+        """
+        ranged = self.file_format == "parquet" and self._is_selective()
+        if ranged or self.use_cache or not async_blob_clients_available():
+            return await super().read_async()
+
+        self._validate_source()
+        try:
+            async with create_async_blob_client(
+                self.connection_string, self.container_name, self.blob_path
+            ) as blob_client:
+                downloader = await blob_client.download_blob(max_concurrency=self.max_concurrency)
+                content = await downloader.readall()
+        except (AzureError, OSError) as e:
+            raise RuntimeError(f"Failed to download blob: {e}") from e
+
+        # Parsing is CPU-bound, so it runs off the event loop
+        return await asyncio.to_thread(lambda: self._finish_read(self._parse(BytesIO(content))))
+
+    def _parse(self, source: str | BytesIO) -> pl.DataFrame:
+        """Parse downloaded blob content.
+
+        Args:
+            source: Path of a local copy or the downloaded bytes
+
+        Returns:
+            DataFrame containing the data
+        """
+        if isinstance(source, BytesIO):
+            source = BytesIO(decompress_bytes(source.getvalue()))
+        elif file_codec(source) is not None:
+            with open_decompressed(source) as file:
+                source = BytesIO(file.read())
 
         # Process based on file format specified
         if self.file_format == "csv":
-            data = pl.read_csv(BytesIO(blob_data))
+            data = pl.read_csv(source)
         elif self.file_format == "parquet":
-            data = pl.read_parquet(BytesIO(blob_data))
+            data = pl.read_parquet(source)
         elif self.file_format == "json":
-            data = pl.read_json(BytesIO(blob_data))
+            data = pl.read_json(source)
         elif self.file_format == "excel":
-            data = pl.read_excel(BytesIO(blob_data))
+            data = pl.read_excel(source)
         elif self.file_format == "pickle":
-            data = pickle.loads(blob_data)
+            if isinstance(source, str):
+                with open(source, "rb") as file:
+                    data = pickle.load(file)
+            else:
+                data = pickle.loads(source.getvalue())
             # Convert to Polars DataFrame if needed
             if not isinstance(data, pl.DataFrame):
                 data = pl.from_pandas(data) if hasattr(data, "to_pandas") else pl.DataFrame(data)
@@ -85,3 +183,182 @@ class BlobReader(Reader):
             raise ValueError(f"Unsupported file format: {self.file_format}")
 
         return data
+
+    def _is_selective(self) -> bool:
+        """Check whether the read needs only part of the blob."""
+        return any(option is not None for option in (self.columns, self.filters, self.limit))
+
+    def _read_parquet_ranges(self, blob_client: BlobClient) -> pl.DataFrame:
+        """Read the needed parts of a Parquet blob with ranged requests.
+
+        Row groups are skipped when their statistics rule out the filters, or
+        once enough rows have been read for an unfiltered limit. The pushdown
+        options are applied to the result by the base class.
+
+        Args:
+            blob_client: Client of the Parquet blob
+
+        Returns:
+            DataFrame holding the needed columns of the candidate row groups
+        """
+        size = blob_client.get_blob_properties().size
+        with pa.PythonFile(_BlobRangeFile(blob_client, size), mode="r") as file:
+            parquet = pq.ParquetFile(file, pre_buffer=True)
+            metadata = parquet.metadata
+            names = parquet.schema_arrow.names
+
+            columns = None
+            if self.columns is not None:
+                needed = [*self.columns, *(column for column, _, _ in self.filters or [])]
+                columns = [col for col in dict.fromkeys(needed) if col in names]
+
+            groups = []
+            rows = 0
+            for index in range(metadata.num_row_groups):
+                row_group = metadata.row_group(index)
+                if not _row_group_may_match(row_group, self.filters or []):
+                    continue
+                groups.append(index)
+                rows += row_group.num_rows
+                unfiltered = self.filters is None and self.sample_fraction is None
+                if unfiltered and self.limit is not None and rows >= self.limit:
+                    break
+
+            return pl.from_arrow(parquet.read_row_groups(groups, columns=columns))
+
+    def _download_to_cache(self, blob_client: BlobClient) -> Path:
+        """Get a local copy of the blob, downloading it only if it changed.
+
+        Args:
+            blob_client: Client of the blob
+
+        Returns:
+            Path of the up-to-date local copy
+        """
+        properties = blob_client.get_blob_properties()
+        version = {"etag": properties.etag, "last_modified": str(properties.last_modified)}
+
+        cache_dir = Path(self.cache_dir)
+        entry = cache_dir / hashlib.sha256(blob_client.url.encode()).hexdigest()[:32]
+        manifest_path = entry.with_suffix(".json")
+        data_path = entry.with_suffix(".blob")
+        if data_path.exists() and manifest_path.exists():
+            try:
+                if json.loads(manifest_path.read_text()) == version:
+                    return data_path
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".blob.tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                # The condition fails the download if the blob changes midway
+                blob_client.download_blob(
+                    max_concurrency=self.max_concurrency,
+                    etag=properties.etag,
+                    match_condition=MatchConditions.IfNotModified,
+                ).readinto(file)
+            set_default_permissions(tmp_name)
+            os.replace(tmp_name, data_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        manifest_path.write_text(json.dumps(version))
+        return data_path
+
+
+class _BlobRangeFile(io.RawIOBase):
+    """Read-only, seekable file whose reads are ranged blob downloads."""
+
+    def __init__(self, blob_client: BlobClient, size: int) -> None:
+        """Initialize the file.
+
+        Args:
+            blob_client: Client of the blob
+            size: Size of the blob in bytes
+        """
+        self.blob_client = blob_client
+        self.size = size
+        self.position = 0
+
+    def readable(self) -> bool:
+        """Return whether the file can be read."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether the file supports seeking."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a new position.
+
+        Args:
+            offset: Offset relative to ``whence``
+            whence: Reference point of the offset
+
+        Returns:
+            The new position
+        """
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: self.size}[whence]
+        self.position = max(0, base + offset)
+        return self.position
+
+    def readinto(self, buffer: Any) -> int:
+        """Download the next bytes into a buffer.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes read
+        """
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        data = self.blob_client.download_blob(offset=self.position, length=length).readall()
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+def _row_group_may_match(
+    row_group: pq.RowGroupMetaData, filters: list[tuple[str, str, Any]]
+) -> bool:
+    """Check whether a row group's statistics allow rows matching every filter.
+
+    Args:
+        row_group: Metadata of the row group
+        filters: Filter predicates
+
+    Returns:
+        False only if the statistics prove that no row can match
+    """
+    statistics = {}
+    for index in range(row_group.num_columns):
+        column = row_group.column(index)
+        if column.statistics is not None and column.statistics.has_min_max:
+            statistics[column.path_in_schema] = column.statistics
+
+    for column, operator, value in filters:
+        stats = statistics.get(column)
+        if stats is None or value is None or operator not in _PRUNABLE_OPERATORS:
+            continue
+        try:
+            low, high = stats.min, stats.max
+            if operator == "==" and not low <= value <= high:
+                return False
+            if operator == "in" and not any(low <= item <= high for item in value):
+                return False
+            if operator in ("<", "<=") and (low >= value if operator == "<" else low > value):
+                return False
+            if operator in (">", ">=") and (high <= value if operator == ">" else high < value):
+                return False
+        except TypeError:
+            continue
+    return True
@@ -1,12 +1,23 @@
 """CSV reader implementation."""
 
+import io
+from collections.abc import Iterator
+
+import loguru
 import polars as pl
 
-from clustering.shared.io.readers.base import FileReader
+from clustering.shared.common.filesystem import get_project_root
+from clustering.shared.io.compression import file_codec, open_decompressed
+from clustering.shared.io.ingest_cache import IngestCache
+from clustering.shared.io.readers.base import PUSHDOWN_FIELDS, FileReader, rebatch
 
 
 class CSVReader(FileReader):
-    """Reader for CSV files."""
+    """Reader for CSV files.
+
+    Files compressed with gzip, zstd or LZ4 are decompressed in memory and
+    parsed eagerly instead of being scanned.
+    """
 
     delimiter: str = ","
     has_header: bool = True
@@ -15,15 +26,120 @@ class CSVReader(FileReader):
     infer_schema_length: int = 10000
     try_parse_dates: bool = True
     null_values: list[str] = ["", "NA", "N/A", "None", "null"]
-    columns: list[str] | None = None
     comment_char: str | None = None
     skip_rows: int = 0
     dtypes: dict[str, str] | None = None
     encoding: str = "utf8"
 
+    # Parquet copy of the parsed file, reused until the file changes
+    use_cache: bool = False
+    cache_dir: str = str(get_project_root() / "cache/ingest")
+
+    native_pushdown = True
+
     def _read_from_source(self) -> pl.DataFrame:
         """Read data from CSV file.
 
+        Column selection, filters and the row limit are pushed into a lazy scan,
+        so a limited read stops after the requested rows and unselected columns
+        are never materialized.
+
+        Returns:
+            DataFrame containing the data
+        """
+        if self.use_cache:
+            options = self.model_dump(exclude={"path", "use_cache", "cache_dir", *PUSHDOWN_FIELDS})
+            data = IngestCache(cache_dir=self.cache_dir).scan(
+                self.path, lambda: self._parse(None), options
+            )
+            return self._apply_pushdown(data).collect()
+
+        if self.encoding in ("utf8", "utf8-lossy") and not self._is_compressed():
+            try:
+                return self._apply_pushdown(self._scan()).collect()
+            except (pl.exceptions.ComputeError, OSError) as e:
+                loguru.logger.warning(f"Polars CSV scan failed: {e}. Trying full read...")
+
+        return self._apply_pushdown(self._parse(self.columns).lazy()).collect()
+
+    def _read_batches_from_source(self, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Read the CSV file incrementally with the Polars batched reader.
+
+        Without filters or sampling, the limit is passed on as ``n_rows`` so the
+        reader stops parsing once it has enough rows.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches of the data
+        """
+        if self.use_cache or self.encoding not in ("utf8", "utf8-lossy") or self._is_compressed():
+            yield from super()._read_batches_from_source(batch_size)
+            return
+
+        row_filtered = self.filters is not None or self.sample_fraction is not None
+        reader = pl.read_csv_batched(
+            self.path,
+            separator=self.delimiter,
+            has_header=self.has_header,
+            quote_char=self.quote_char,
+            ignore_errors=self.ignore_errors,
+            infer_schema_length=self.infer_schema_length,
+            try_parse_dates=self.try_parse_dates,
+            null_values=self.null_values,
+            skip_rows=self.skip_rows,
+            encoding=self.encoding,
+            batch_size=batch_size,
+            n_rows=None if row_filtered else self.limit,
+        )
+
+        def batches() -> Iterator[pl.DataFrame]:
+            while chunk := reader.next_batches(1):
+                yield from chunk
+
+        yield from rebatch(self._pushdown_batches(batches()), batch_size)
+
+    def _scan(self) -> pl.LazyFrame:
+        """Scan the CSV file lazily.
+
+        Returns:
+            LazyFrame over the file
+        """
+        return pl.scan_csv(
+            self.path,
+            separator=self.delimiter,
+            has_header=self.has_header,
+            quote_char=self.quote_char,
+            ignore_errors=self.ignore_errors,
+            infer_schema_length=self.infer_schema_length,
+            try_parse_dates=self.try_parse_dates,
+            null_values=self.null_values,
+            skip_rows=self.skip_rows,
+            encoding=self.encoding,
+        )
+
+    def _is_compressed(self) -> bool:
+        """Check whether the CSV file is compressed."""
+        return file_codec(self.path) is not None
+
+    def _source(self) -> str | io.BytesIO:
+        """Get the CSV content to parse: the path, or the decompressed bytes.
+
+        Returns:
+            Path of a plain file, or the content of a compressed one
+        """
+        if not self._is_compressed():
+            return self.path
+        with open_decompressed(self.path) as file:
+            return io.BytesIO(file.read())
+
+    def _parse(self, columns: list[str] | None) -> pl.DataFrame:
+        """Parse the CSV file.
+
+        Args:
+            columns: Columns to keep, or None for all columns
+
         Returns:
             DataFrame containing the data
         """
@@ -31,7 +147,7 @@ class CSVReader(FileReader):
             # First attempt: Using polars with all parameters
             try:
                 df = pl.read_csv(
-                    self.path,
+                    self._source(),
                     separator=self.delimiter,
                     has_header=self.has_header,
                     quote_char=self.quote_char,
@@ -44,8 +160,8 @@ class CSVReader(FileReader):
                 )
 
                 # Filter columns if specified
-                if self.columns is not None:
-                    df = df.select([col for col in self.columns if col in df.columns])
+                if columns is not None:
+                    df = df.select([col for col in columns if col in df.columns])
 
                 return df
             except Exception as e:
@@ -56,13 +172,13 @@ class CSVReader(FileReader):
             import pandas as pd
 
             df_pandas = pd.read_csv(
-                self.path,
+                self._source(),
                 sep=self.delimiter,
                 header=0 if self.has_header else None,
                 quotechar=self.quote_char,
                 on_bad_lines="skip" if self.ignore_errors else "error",
                 skiprows=self.skip_rows,
-                usecols=self.columns,
+                usecols=columns,
                 dtype=self.dtypes,
                 encoding=self.encoding,
                 na_values=self.null_values,
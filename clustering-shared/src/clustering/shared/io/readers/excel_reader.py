@@ -3,6 +3,8 @@
 import polars as pl
 import pandas as pd
 
+from clustering.shared.common.filesystem import get_project_root
+from clustering.shared.io.ingest_cache import IngestCache
 from clustering.shared.io.readers.base import FileReader
 
 
@@ -12,9 +14,28 @@ class ExcelReader(FileReader):
     sheet_name: str | int | None = None
     engine: str = "openpyxl"
 
+    # Parquet copy of the parsed workbook, reused until the file changes
+    use_cache: bool = False
+    cache_dir: str = str(get_project_root() / "cache/ingest")
+
+    native_pushdown = True
+
     def _read_from_source(self) -> pl.DataFrame:
         """Read data from Excel file.
 
+        Returns:
+            DataFrame containing the data
+        """
+        if not self.use_cache:
+            return self._apply_pushdown(self._parse().lazy()).collect()
+
+        options = {"sheet_name": self.sheet_name, "engine": self.engine}
+        data = IngestCache(cache_dir=self.cache_dir).scan(self.path, self._parse, options)
+        return self._apply_pushdown(data).collect()
+
+    def _parse(self) -> pl.DataFrame:
+        """Parse the Excel file.
+
         Returns:
             DataFrame containing the data
         """
@@ -33,9 +54,4 @@ class ExcelReader(FileReader):
         Returns:
             DataFrame containing the data
         """
-        data = self._read_from_source()
-
-        if self.limit is not None:
-            data = data.head(self.limit)
-
-        return data
+        return self._read_from_source()
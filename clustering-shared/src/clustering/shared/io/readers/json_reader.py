@@ -1,44 +1,109 @@
 """JSON reader for data input."""
 
+import io
 import json
+from collections.abc import Iterator
+from itertools import islice
 
 import polars as pl
 
-from clustering.shared.io.readers.base import FileReader
+from clustering.shared.io.compression import file_codec, open_decompressed
+from clustering.shared.io.readers.base import FileReader, rebatch
 
 
 class JSONReader(FileReader):
-    """Reader for JSON files."""
+    """Reader for JSON files.
+
+    JSON lines (newline-delimited JSON) are scanned lazily by the Polars NDJSON
+    reader, so projections, filters and limits are pushed into the scan. Regular
+    JSON documents holding an array of objects are parsed natively by Polars,
+    without building Python objects for the records; documents holding an
+    object of columns are read column-wise. Files compressed with gzip, zstd
+    or LZ4 are decompressed in memory and parsed eagerly.
+    """
 
     lines: bool = True
+    infer_schema_length: int | None = 100
+    ignore_errors: bool = False
+    lazy: bool = False
+
+    native_pushdown = True
 
-    def _read_from_source(self) -> pl.DataFrame:
+    def _read_from_source(self) -> pl.DataFrame | pl.LazyFrame:
         """Read data from JSON file.
 
         Returns:
-            DataFrame with data from JSON file
+            DataFrame with data from JSON file, or the LazyFrame over it when
+            ``lazy`` is set
         """
-        # Polars doesn't support a lines parameter for read_json directly
-        # For lines=True, we need to handle JSON lines (newline-delimited JSON)
-        with open(self.path, "r") as f:
-            content = f.read()
-
-        if self.lines:
-            # For JSON lines, each line is a JSON object
-            if not content.strip():
-                # Handle empty file
-                return pl.DataFrame()
-
-            # Parse each line as separate JSON object and create DataFrame
-            json_objects = [
-                json.loads(line) for line in content.strip().split("\n") if line.strip()
-            ]
-            return pl.DataFrame(json_objects)
+        if self._is_blank():
+            data = pl.LazyFrame()
+        elif not self.lines:
+            data = self._read_document().lazy()
+        elif file_codec(self.path) is not None:
+            with open_decompressed(self.path) as file:
+                content = io.BytesIO(file.read())
+            data = pl.read_ndjson(
+                content,
+                infer_schema_length=self.infer_schema_length,
+                ignore_errors=self.ignore_errors,
+            ).lazy()
         else:
-            # For regular JSON, assume array of objects
-            if not content.strip():
-                # Handle empty file
-                return pl.DataFrame()
+            data = pl.scan_ndjson(
+                self.path,
+                infer_schema_length=self.infer_schema_length,
+                ignore_errors=self.ignore_errors,
+            )
+
+        data = self._apply_pushdown(data)
+        return data if self.lazy else data.collect()
+
+    def _read_batches_from_source(self, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Read JSON lines in chunks of lines.
+
+        Regular JSON documents fall back to slicing a full read.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches of the data
+        """
+        if not self.lines:
+            yield from super()._read_batches_from_source(batch_size)
+            return
+
+        def batches() -> Iterator[pl.DataFrame]:
+            with open_decompressed(self.path) as file:
+                lines = (line for line in file if line.strip())
+                while chunk := list(islice(lines, batch_size)):
+                    yield pl.read_ndjson(
+                        io.BytesIO(b"".join(chunk)),
+                        infer_schema_length=self.infer_schema_length,
+                        ignore_errors=self.ignore_errors,
+                    )
+
+        yield from rebatch(self._pushdown_batches(batches()), batch_size)
+
+    def _read_document(self) -> pl.DataFrame:
+        """Read a regular JSON document.
+
+        An array of records is parsed natively by Polars. An object mapping
+        column names to lists of values is read column-wise.
+
+        Returns:
+            DataFrame with data from the document
+        """
+        with open_decompressed(self.path) as file:
+            content = file.read()
+        if content.lstrip().startswith(b"["):
+            return pl.read_json(io.BytesIO(content), infer_schema_length=self.infer_schema_length)
+        return pl.DataFrame(json.loads(content))
 
-            # Parse JSON and create DataFrame
-            return pl.DataFrame(json.loads(content))
+    def _is_blank(self) -> bool:
+        """Check whether the file holds only whitespace, reading as little as possible."""
+        with open_decompressed(self.path) as file:
+            while chunk := file.read(1 << 16):
+                if chunk.strip():
+                    return False
+        return True
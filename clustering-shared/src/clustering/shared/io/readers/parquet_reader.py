@@ -1,17 +1,100 @@
 """Parquet reader implementation."""
 
+import glob
+from collections.abc import Iterator
+
 import polars as pl
+import pyarrow.dataset as ds
 
-from clustering.shared.io.readers.base import FileReader
+from clustering.shared.io.readers.base import FileReader, rebatch
 
 
 class ParquetReader(FileReader):
-    """Reader for Parquet files."""
+    """Reader for Parquet files and datasets.
+
+    The path may be a single file, a directory or a glob pattern. Directories
+    written with hive partitioning, such as ``sales/CAT_DSC=Snacks/0.parquet``,
+    expose their partition keys as columns, and filters on those columns skip
+    the other partitions entirely. Local files are memory-mapped by the Polars
+    reader, so only the pages that are decoded are paged in.
+    """
+
+    hive_partitioning: bool | None = None
+    use_statistics: bool = True
+    allow_missing_columns: bool = False
+    lazy: bool = False
+
+    native_pushdown = True
+
+    def _validate_source(self) -> None:
+        """Validate that the file, directory or glob matches something.
+
+        Raises:
+            FileNotFoundError: If nothing exists at the path
+        """
+        if self._is_glob():
+            if not glob.glob(self.path, recursive=True):
+                raise FileNotFoundError(f"No files match: {self.path}")
+            return
+        super()._validate_source()
+
+    def _read_from_source(self) -> pl.DataFrame | pl.LazyFrame:
+        """Read data from Parquet files.
+
+        The source is scanned lazily, so only the selected columns are decoded,
+        partitions and row groups whose values cannot match the filters are
+        skipped and a limited read stops after the requested rows.
+
+        Returns:
+            DataFrame containing the data, or the LazyFrame over it when
+            ``lazy`` is set
+        """
+        data = self._apply_pushdown(self._scan())
+        return data if self.lazy else data.collect()
+
+    def _read_batches_from_source(self, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Read the Parquet source incrementally, row group by row group.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches of the data
+        """
+        source = sorted(glob.glob(self.path, recursive=True)) if self._is_glob() else self.path
+        dataset = ds.dataset(
+            source,
+            format="parquet",
+            partitioning=None if self.hive_partitioning is False else "hive",
+        )
+        batches = (
+            pl.from_arrow(batch)
+            for batch in dataset.to_batches(
+                batch_size=batch_size, columns=self._batch_columns(dataset.schema.names)
+            )
+        )
+        yield from rebatch(self._pushdown_batches(batches), batch_size)
+
+    def _batch_columns(self, available: list[str]) -> list[str] | None:
+        """Get the columns needed for the projection and the filters."""
+        if self.columns is None:
+            return None
+        needed = [*self.columns, *(column for column, _, _ in self.filters or [])]
+        return [col for col in dict.fromkeys(needed) if col in available]
+
+    def _is_glob(self) -> bool:
+        """Check whether the path is a glob pattern."""
+        return any(char in self.path for char in "*?[")
 
-    def _read_from_source(self) -> pl.DataFrame:
-        """Read data from Parquet file.
+    def _scan(self) -> pl.LazyFrame:
+        """Scan the Parquet source without applying any pushdown options.
 
         Returns:
-            DataFrame containing the data
+            LazyFrame over the file, directory or glob
         """
-        return pl.read_parquet(self.path)
+        return pl.scan_parquet(
+            self.path,
+            hive_partitioning=self.hive_partitioning,
+            use_statistics=self.use_statistics,
+            allow_missing_columns=self.allow_missing_columns,
+        )
@@ -4,11 +4,15 @@ import pickle
 
 import polars as pl
 
+from clustering.shared.io.compression import open_decompressed
 from clustering.shared.io.readers.base import FileReader
 
 
 class PickleReader(FileReader):
-    """Reader for Pickle files."""
+    """Reader for Pickle files.
+
+    Files compressed with gzip, zstd or LZ4 are decompressed while unpickling.
+    """
 
     def _read_from_source(self) -> pl.DataFrame | dict[str, pl.DataFrame]:
         """Read data from Pickle file.
@@ -16,7 +20,7 @@ class PickleReader(FileReader):
         Returns:
             DataFrame or dictionary of DataFrames containing the data
         """
-        with open(self.path, "rb") as file:
+        with open_decompressed(self.path) as file:
             data = pickle.load(file)
 
         # If data is already a dictionary of DataFrames, process each DataFrame
@@ -54,12 +58,13 @@ class PickleReader(FileReader):
         # Step 2: Read data from source (implemented by subclasses)
         data = self._read_from_source()
 
-        # Step 3: If it's a dictionary, apply limit to each DataFrame
-        if isinstance(data, dict) and self.limit is not None:
-            return {key: value.head(self.limit) for key, value in data.items()}
-        # Otherwise, let the base implementation handle it
-        elif not isinstance(data, dict) and self.limit is not None:
-            data = data.head(self.limit)
+        # Step 3: Apply the pushdown options, to each DataFrame of a dictionary
+        if isinstance(data, dict) and self._has_pushdown():
+            return {
+                key: self._apply_pushdown(value.lazy()).collect() for key, value in data.items()
+            }
+        elif not isinstance(data, dict) and self._has_pushdown():
+            data = self._apply_pushdown(data.lazy()).collect()
 
         # Step 4: Post-process the data (only if it's a single DataFrame)
         if not isinstance(data, dict):
@@ -1,54 +1,109 @@
 """Snowflake reader implementation."""
 
-import io
-import json
-import os
-import pickle
+import datetime as dt
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from typing import Any
 
-import duckdb
 import polars as pl
 import snowflake.connector
 
-from clustering.shared.io.readers.base import Reader
 from clustering.shared.common.filesystem import get_project_root
+from clustering.shared.io.query_cache import QueryCache
+from clustering.shared.io.readers.base import Reader, rebatch
+from clustering.shared.io.snowflake_connections import connect, pooled_connection
+from clustering.shared.io.snowflake_local import LocalSnowflakeConnection
 
 
 class SnowflakeReader(Reader):
     """Reader for Snowflake database.
 
-    Reading data from Snowflake can be resource intensive, so caching is implemented using DuckDB.
+    Results are fetched as Arrow batches and converted to Polars without a
+    row-wise hop, over connections pooled across the readers of a process.
+    Pushdown options are compiled into the query, so Snowflake only returns the
+    requested rows and columns.
+
+    Reading data from Snowflake can be resource intensive, so results are cached in a
+    DuckDB file shared with the dashboard. Cached results expire after
+    ``cache_ttl_seconds`` and the least recently used ones are evicted once the
+    cache exceeds ``cache_max_bytes`` on disk.
     """
 
     query: str
     use_cache: bool = True
     cache_file: str = str(get_project_root() / "cache/snowflake_cache.duckdb")
+    cache_ttl_seconds: float | None = 24 * 3600
+    cache_max_bytes: int = 2 * 1024**3
 
     # Credentials paths
     pkb_path: str = str(get_project_root() / "creds/pkb.pkl")
     creds_path: str = str(get_project_root() / "creds/sf_creds.json")
 
+    # DuckDB file queried through the local stand-in connector instead of Snowflake
+    local_database: str | None = None
+
+    native_pushdown = True
+
+    def _build_query(self) -> str:
+        """Wrap the query with the pushdown options.
+
+        Sampling uses Bernoulli row sampling, which Snowflake does not seed on
+        subqueries, so ``sample_seed`` does not apply here.
+
+        Returns:
+            The query as written when no pushdown option is set, otherwise a
+            query selecting the requested columns and rows from it
+        """
+        if not self._has_pushdown():
+            return self.query
+
+        columns = ", ".join(_identifier(col) for col in self.columns) if self.columns else "*"
+        sql = f"SELECT {columns} FROM ({self.query.strip().rstrip(';')}) AS src"
+        if self.sample_fraction is not None and self.sample_fraction < 1:
+            sql += f" SAMPLE ROW ({self.sample_fraction * 100:g})"
+        if self.filters:
+            sql += " WHERE " + " AND ".join(_predicate(*predicate) for predicate in self.filters)
+        if self.limit is not None:
+            sql += f" LIMIT {int(self.limit)}"
+        return sql
+
     def _create_connection(self) -> snowflake.connector.SnowflakeConnection:
         """Create a Snowflake connection.
 
+        The credentials are read once per process. With ``local_database`` set,
+        a local stand-in connection is created instead.
+
         Returns:
             SnowflakeConnection: A connection to Snowflake
         """
-        with open(self.pkb_path, "rb") as file:
-            pkb = pickle.load(file)
-
-        with open(self.creds_path) as file:
-            sf_params = json.loads(file.read())
-
-        conn = snowflake.connector.connect(
-            user=sf_params["SF_USER_NAME"],
-            private_key=pkb,
-            account=sf_params["SF_ACCOUNT"],
-            database=sf_params["SF_DB"],
-            warehouse=sf_params["SF_WAREHOUSE"],
-            role=sf_params["SF_USER_ROLE"],
-            insecure_mode=sf_params.get("SF_INSECURE_MODE") == "True",
+        if self.local_database is not None:
+            return LocalSnowflakeConnection(self.local_database)
+        return connect(self.pkb_path, self.creds_path)
+
+    def _connection(self) -> AbstractContextManager[snowflake.connector.SnowflakeConnection]:
+        """Borrow a connection from the pool shared by all Snowflake readers.
+
+        Returns:
+            Context manager yielding an open connection
+        """
+        key = (
+            ("local", self.local_database)
+            if self.local_database
+            else (self.pkb_path, self.creds_path)
+        )
+        return pooled_connection(key, self._create_connection)
+
+    def _cache(self) -> QueryCache:
+        """Get the query result cache.
+
+        Returns:
+            QueryCache: The cache stored in ``cache_file``
+        """
+        return QueryCache(
+            cache_file=self.cache_file,
+            ttl_seconds=self.cache_ttl_seconds,
+            max_bytes=self.cache_max_bytes,
         )
-        return conn
 
     def _load_cache(self) -> pl.DataFrame | None:
         """Load cached query results if available.
@@ -56,17 +111,7 @@ class SnowflakeReader(Reader):
         Returns:
             Optional[pl.DataFrame]: Cached dataframe or None if not cached
         """
-        if os.path.exists(self.cache_file):
-            conn = duckdb.connect(self.cache_file)
-            try:
-                result = conn.execute(
-                    "SELECT data FROM cache WHERE query = ?", (self.query,)
-                ).fetchone()
-                if result:
-                    return pl.read_parquet(io.BytesIO(result[0]))
-            except duckdb.CatalogException as e:
-                print("DuckDB CatalogException:", e)
-        return None
+        return self._cache().get(self._build_query())
 
     def _save_cache(self, data: pl.DataFrame) -> None:
         """Save query results to cache.
@@ -74,18 +119,7 @@ class SnowflakeReader(Reader):
         Args:
             data: DataFrame to cache
         """
-        # Ensure cache directory exists
-        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-
-        conn = duckdb.connect(self.cache_file)
-        conn.execute("CREATE TABLE IF NOT EXISTS cache (query VARCHAR, data BLOB)")
-
-        # Convert DataFrame to parquet bytes
-        buffer = io.BytesIO()
-        data.write_parquet(buffer)
-        buffer.seek(0)
-
-        conn.execute("INSERT INTO cache VALUES (?, ?)", (self.query, buffer.getvalue()))
+        self._cache().put(self._build_query(), data)
 
     def _read_from_source(self) -> pl.DataFrame:
         """Read data from Snowflake.
@@ -101,15 +135,75 @@ class SnowflakeReader(Reader):
             if cached_data is not None:
                 return cached_data
 
-        # Execute query if not cached or cache disabled
-        conn = self._create_connection()
-
-        # Use polars to read directly from the database connection
-        data = pl.read_database(query=self.query, connection=conn)
-        conn.close()
+        # Fetch the result as Arrow, without converting rows to Python objects
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self._build_query())
+                data = pl.from_arrow(cursor.fetch_arrow_all(force_return_table=True))
+            finally:
+                cursor.close()
 
         # Cache the result
         if self.use_cache:
             self._save_cache(data)
 
         return data
+
+    def _read_batches_from_source(self, batch_size: int) -> Iterator[pl.DataFrame]:
+        """Stream query results as Arrow batches.
+
+        A cached result is sliced instead. Streamed results are not cached,
+        since the full result never exists in memory.
+
+        Args:
+            batch_size: Maximum number of rows per batch
+
+        Yields:
+            Consecutive batches of the query result
+        """
+        if self.use_cache:
+            cached_data = self._load_cache()
+            if cached_data is not None:
+                yield from cached_data.iter_slices(batch_size)
+                return
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(self._build_query())
+                batches = (pl.from_arrow(table) for table in cursor.fetch_arrow_batches())
+                yield from rebatch(batches, batch_size)
+            finally:
+                cursor.close()
+
+
+def _identifier(name: str) -> str:
+    """Quote a column name as a case-sensitive SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: Any) -> str:
+    """Render a Python value as a SQL literal."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (dt.date, dt.datetime)):
+        value = value.isoformat()
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _predicate(column: str, operator: str, value: Any) -> str:
+    """Render a filter predicate as a SQL condition."""
+    if value is None and operator in ("==", "!="):
+        return f"{_identifier(column)} IS {'' if operator == '==' else 'NOT '}NULL"
+    if operator in ("in", "not in"):
+        if not value:
+            return "FALSE" if operator == "in" else "TRUE"
+        values = ", ".join(_literal(item) for item in value)
+        return f"{_identifier(column)} {operator.upper()} ({values})"
+    sql_operator = {"==": "=", "!=": "<>"}.get(operator, operator)
+    return f"{_identifier(column)} {sql_operator} {_literal(value)}"
@@ -0,0 +1,141 @@
+"""Process-wide pool of Snowflake connections."""
+
+import atexit
+import json
+import pickle
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+
+import duckdb
+import loguru
+import snowflake.connector
+
+_lock = threading.Lock()
+_max_idle = 4
+_idle: dict[Hashable, list[Any]] = {}
+
+
+@lru_cache(maxsize=8)
+def load_credentials(pkb_path: str, creds_path: str) -> tuple[Any, dict[str, str]]:
+    """Load the private key and connection parameters once per process.
+
+    Args:
+        pkb_path: Path to the pickled private key
+        creds_path: Path to the JSON connection parameters
+
+    Returns:
+        The private key and the connection parameters
+    """
+    with open(pkb_path, "rb") as file:
+        pkb = pickle.load(file)
+
+    with open(creds_path) as file:
+        sf_params = json.loads(file.read())
+
+    return pkb, sf_params
+
+
+def connect(pkb_path: str, creds_path: str) -> snowflake.connector.SnowflakeConnection:
+    """Open a Snowflake connection with key-pair authentication.
+
+    Args:
+        pkb_path: Path to the pickled private key
+        creds_path: Path to the JSON connection parameters
+
+    Returns:
+        SnowflakeConnection: A new connection to Snowflake
+    """
+    pkb, sf_params = load_credentials(pkb_path, creds_path)
+    return snowflake.connector.connect(
+        user=sf_params["SF_USER_NAME"],
+        private_key=pkb,
+        account=sf_params["SF_ACCOUNT"],
+        database=sf_params["SF_DB"],
+        warehouse=sf_params["SF_WAREHOUSE"],
+        role=sf_params["SF_USER_ROLE"],
+        insecure_mode=sf_params.get("SF_INSECURE_MODE") == "True",
+    )
+
+
+def configure_snowflake_pool(max_idle: int) -> None:
+    """Set how many idle connections are kept per connection key.
+
+    Args:
+        max_idle: Maximum number of idle connections kept for reuse
+
+    Raises:
+        ValueError: If max_idle is negative
+    """
+    global _max_idle
+
+    if max_idle < 0:
+        raise ValueError("max_idle must not be negative")
+    with _lock:
+        _max_idle = max_idle
+        for connections in _idle.values():
+            while len(connections) > max_idle:
+                _close(connections.pop(0))
+
+
+@contextmanager
+def pooled_connection(key: Hashable, factory: Callable[[], Any]) -> Iterator[Any]:
+    """Borrow a connection from the pool, creating one if none is idle.
+
+    The connection goes back to the pool when the block exits normally. If
+    the block raises, the connection is closed instead, since its session
+    state is unknown.
+
+    Args:
+        key: Identifies interchangeable connections, e.g. the credential paths
+        factory: Creates a new connection for the key
+
+    Yields:
+        An open connection
+    """
+    conn = None
+    with _lock:
+        connections = _idle.get(key, [])
+        while connections and conn is None:
+            candidate = connections.pop()
+            if candidate.is_closed():
+                continue
+            conn = candidate
+    if conn is None:
+        conn = factory()
+
+    try:
+        yield conn
+    except BaseException:
+        _close(conn)
+        raise
+
+    with _lock:
+        connections = _idle.setdefault(key, [])
+        if len(connections) < _max_idle and not conn.is_closed():
+            connections.append(conn)
+            return
+    _close(conn)
+
+
+def close_snowflake_connections() -> None:
+    """Close every idle connection and forget the loaded credentials."""
+    with _lock:
+        for connections in _idle.values():
+            for conn in connections:
+                _close(conn)
+        _idle.clear()
+    load_credentials.cache_clear()
+
+
+def _close(conn: Any) -> None:
+    """Close a connection, ignoring errors of connections already broken."""
+    try:
+        conn.close()
+    except (snowflake.connector.errors.Error, duckdb.Error) as e:
+        loguru.logger.warning(f"Error closing Snowflake connection: {e}")
+
+
+atexit.register(close_snowflake_connections)
@@ -0,0 +1,250 @@
+"""Local stand-in for the Snowflake connector, backed by DuckDB."""
+
+import glob
+import re
+import shutil
+import tempfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pyarrow as pa
+
+# Snowflake statements without a DuckDB equivalent, emulated by the cursor
+_CREATE_STAGE = re.compile(r"CREATE\s+(?:TEMPORARY\s+)?STAGE\s+(?P<stage>[^\s(]+)", re.IGNORECASE)
+_DROP_STAGE = re.compile(r"DROP\s+STAGE\s+(?:IF\s+EXISTS\s+)?(?P<stage>\S+)", re.IGNORECASE)
+_PUT = re.compile(r"PUT\s+'?file://(?P<path>[^'\s]+)'?\s+@(?P<stage>\S+)", re.IGNORECASE)
+_COPY = re.compile(
+    r"COPY\s+INTO\s+(?P<table>\S+)\s+FROM\s+@(?P<stage>\S+)(?P<options>.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+_MERGE = re.compile(
+    r"MERGE\s+INTO\s+(?P<target>\S+)\s+AS\s+t\s+USING\s+(?P<source>\S+)\s+AS\s+s\s+"
+    r"ON\s+(?P<on>.+?)"
+    r"(?:\s+WHEN\s+MATCHED\s+THEN\s+UPDATE\s+SET\s+(?P<assignments>.+?))?"
+    r"\s+WHEN\s+NOT\s+MATCHED\s+THEN\s+INSERT\s+\((?P<columns>.+?)\)\s+VALUES\s+\((?P<values>.+)\)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_SWAP = re.compile(
+    r"ALTER\s+TABLE\s+(?P<table>\S+)\s+SWAP\s+WITH\s+(?P<other>\S+)\s*$", re.IGNORECASE
+)
+_INSERT_OVERWRITE = re.compile(
+    r"INSERT\s+OVERWRITE\s+INTO\s+(?P<table>\S+)\s+(?P<rest>.+)", re.IGNORECASE | re.DOTALL
+)
+
+
+class LocalSnowflakeCursor:
+    """Cursor exposing the part of the Snowflake cursor API used by the IO classes."""
+
+    def __init__(self, connection: "LocalSnowflakeConnection") -> None:
+        """Initialize the cursor.
+
+        Args:
+            connection: Connection the cursor belongs to
+        """
+        self.connection = connection
+        self.arraysize = connection.arraysize
+        self._result: duckdb.DuckDBPyConnection | None = None
+
+    @property
+    def description(self) -> list[tuple] | None:
+        """Describe the columns of the last result."""
+        return None if self._result is None else self._result.description
+
+    def execute(self, command: str, params: Sequence[Any] | None = None) -> "LocalSnowflakeCursor":
+        """Run a statement.
+
+        Args:
+            command: Stage, PUT, COPY INTO, MERGE, SWAP or INSERT OVERWRITE
+                statement, or any DuckDB statement
+            params: Values of the statement's placeholders
+
+        Returns:
+            The cursor itself
+        """
+        self.connection.statements.append(command)
+        for pattern, handler in (
+            (_CREATE_STAGE, self._create_stage),
+            (_DROP_STAGE, self._drop_stage),
+            (_PUT, self._put),
+            (_COPY, self._copy),
+            (_MERGE, self._merge),
+            (_SWAP, self._swap),
+            (_INSERT_OVERWRITE, self._insert_overwrite),
+        ):
+            match = pattern.match(command.strip())
+            if match:
+                self._result = self._status(handler(**match.groupdict()))
+                return self
+
+        self._result = self.connection.database.execute(command, params)
+        return self
+
+    def fetch_arrow_batches(self) -> Iterator[pa.Table]:
+        """Stream the result as Arrow tables of ``arraysize`` rows.
+
+        Yields:
+            Consecutive parts of the result
+        """
+        reader = self._result.fetch_record_batch(self.arraysize)
+        for batch in reader:
+            yield pa.Table.from_batches([batch])
+
+    def fetch_arrow_all(self, force_return_table: bool = False) -> pa.Table | None:
+        """Fetch the whole result as an Arrow table.
+
+        Args:
+            force_return_table: Return an empty table instead of None for empty results
+
+        Returns:
+            The result, or None if it is empty and ``force_return_table`` is unset
+        """
+        table = self._result.fetch_arrow_table()
+        return table if table.num_rows or force_return_table else None
+
+    def fetchall(self) -> list[tuple]:
+        """Fetch the remaining rows of the result."""
+        return self._result.fetchall()
+
+    def fetchone(self) -> tuple | None:
+        """Fetch the next row of the result."""
+        return self._result.fetchone()
+
+    def close(self) -> None:
+        """Release the result."""
+        self._result = None
+
+    def _status(self, message: str) -> duckdb.DuckDBPyConnection:
+        """Make a one-row result holding a status message."""
+        return self.connection.database.execute("SELECT ? AS status", [message])
+
+    def _create_stage(self, stage: str) -> str:
+        """Create a stage as a local directory."""
+        self.connection.stages[stage] = Path(tempfile.mkdtemp(prefix="stage-"))
+        return f"Stage area {stage} successfully created."
+
+    def _drop_stage(self, stage: str) -> str:
+        """Remove a stage and its files."""
+        directory = self.connection.stages.pop(stage, None)
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+        return f"{stage} successfully dropped."
+
+    def _put(self, path: str, stage: str) -> str:
+        """Copy local files matching a pattern into a stage."""
+        files = sorted(glob.glob(path))
+        for file in files:
+            shutil.copy(file, self.connection.stages[stage])
+            self.connection.staged_files.append((stage, Path(file).name))
+        return f"{len(files)} files uploaded."
+
+    def _copy(self, table: str, stage: str, options: str) -> str:
+        """Load the Parquet files of a stage into a table, matching columns by name."""
+        files = sorted(str(file) for file in self.connection.stages[stage].iterdir())
+        if files:
+            self.connection.database.execute(
+                f"INSERT INTO {table} BY NAME SELECT * FROM read_parquet(?)", [files]
+            )
+        if re.search(r"PURGE\s*=\s*TRUE", options, re.IGNORECASE):
+            for file in files:
+                Path(file).unlink()
+        return f"{len(files)} files loaded."
+
+    def _merge(
+        self,
+        target: str,
+        source: str,
+        on: str,
+        assignments: str | None,
+        columns: str,
+        values: str,
+    ) -> str:
+        """Upsert the source rows into the target as an UPDATE and an INSERT."""
+        statements = []
+        if assignments is not None:
+            statements.append(
+                f"UPDATE {target} AS t SET {assignments} FROM {source} AS s WHERE {on}"
+            )
+        statements.append(
+            f"INSERT INTO {target} ({columns}) SELECT {values} FROM {source} AS s "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {target} AS t WHERE {on})"
+        )
+        self._run_atomically(statements)
+        return "Merge completed."
+
+    def _swap(self, table: str, other: str) -> str:
+        """Exchange the names of two tables as three renames."""
+        swapped = f"{table}__SWAP"
+        self._run_atomically(
+            [
+                f"ALTER TABLE {table} RENAME TO {swapped}",
+                f"ALTER TABLE {other} RENAME TO {table}",
+                f"ALTER TABLE {swapped} RENAME TO {other}",
+            ]
+        )
+        return "Statement executed successfully."
+
+    def _insert_overwrite(self, table: str, rest: str) -> str:
+        """Replace the rows of a table as a DELETE and an INSERT."""
+        self._run_atomically([f"DELETE FROM {table}", f"INSERT INTO {table} {rest}"])
+        return "Insert overwrite completed."
+
+    def _run_atomically(self, statements: list[str]) -> None:
+        """Run statements in one transaction, rolling all of them back on failure."""
+        database = self.connection.database
+        database.execute("BEGIN TRANSACTION")
+        try:
+            for statement in statements:
+                database.execute(statement)
+            database.execute("COMMIT")
+        except BaseException:
+            database.execute("ROLLBACK")
+            raise
+
+
+class LocalSnowflakeConnection:
+    """Connection whose statements run against a local DuckDB database.
+
+    It lets readers and writers run end to end in tests and offline work,
+    including the Arrow batch fetch, without a Snowflake account. Stages are
+    local directories, and the ``PUT``, ``COPY INTO``, ``MERGE``, ``SWAP WITH``
+    and ``INSERT OVERWRITE`` statements issued by the writer are emulated.
+    Every statement is recorded in ``statements`` and every uploaded file in
+    ``staged_files``. Other statements must be valid DuckDB SQL; Snowflake-only
+    syntax such as ``SAMPLE ROW`` is not translated.
+    """
+
+    def __init__(self, database: str = ":memory:", arraysize: int = 10_000) -> None:
+        """Open the local database.
+
+        Args:
+            database: Path of the DuckDB file, or ``:memory:``
+            arraysize: Rows per Arrow batch returned by the cursors
+        """
+        self.database = duckdb.connect(database)
+        self.arraysize = arraysize
+        self.statements: list[str] = []
+        self.staged_files: list[tuple[str, str]] = []
+        self.stages: dict[str, Path] = {}
+        self._closed = False
+
+    def cursor(self) -> LocalSnowflakeCursor:
+        """Create a cursor."""
+        return LocalSnowflakeCursor(self)
+
+    def commit(self) -> None:
+        """Commit the current transaction; statements autocommit, so this does nothing."""
+
+    def is_closed(self) -> bool:
+        """Return whether the connection was closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Close the local database and remove the stages."""
+        if not self._closed:
+            for directory in self.stages.values():
+                shutil.rmtree(directory, ignore_errors=True)
+            self.stages.clear()
+            self.database.close()
+            self._closed = True
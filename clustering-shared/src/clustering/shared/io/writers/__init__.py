@@ -1,5 +1,6 @@
 """Data writers for the clustering pipeline."""
 
+from clustering.shared.io.writers.arrow_tables_writer import ArrowTablesWriter
 from clustering.shared.io.writers.base import FileWriter, Writer
 from clustering.shared.io.writers.blob_writer import BlobWriter
 from clustering.shared.io.writers.csv_writer import CSVWriter
@@ -12,6 +13,7 @@ from clustering.shared.io.writers.snowflake_writer import SnowflakeWriter
 __all__ = [
     "Writer",
     "FileWriter",
+    "ArrowTablesWriter",
     "BlobWriter",
     "CSVWriter",
     "ExcelWriter",
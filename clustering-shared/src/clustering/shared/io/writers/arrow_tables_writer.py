@@ -0,0 +1,49 @@
+"""Arrow table container writer implementation."""
+
+import polars as pl
+
+from clustering.shared.io.arrow_tables import write_tables
+from clustering.shared.io.writers.base import FileWriter
+
+
+class ArrowTablesWriter(FileWriter):
+    """Writer for containers of named Arrow IPC tables.
+
+    Writes a dictionary of DataFrames, such as sales by category, as one table
+    per key. Frames are converted to Arrow without a pandas round trip.
+    """
+
+    compression: str | None = None
+
+    def _validate_data(self, data: dict[str, pl.DataFrame]) -> None:
+        """Validate the dictionary of DataFrames.
+
+        Args:
+            data: Dictionary of DataFrames to validate
+
+        Raises:
+            TypeError: If the data is not a dictionary of DataFrames
+            ValueError: If the dictionary is empty
+        """
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"Unsupported data type: {type(data)}. Expected dictionary of DataFrames."
+            )
+        if not data:
+            raise ValueError("Cannot write empty dictionary")
+        for key, value in data.items():
+            if not isinstance(value, pl.DataFrame):
+                raise TypeError(f"Dictionary value for key '{key}' is not a DataFrame")
+
+    def _write_file(self, data: dict[str, pl.DataFrame], path: str) -> None:
+        """Write the DataFrames to the container.
+
+        Args:
+            data: Dictionary of DataFrames to write
+            path: File to write to
+        """
+        write_tables(
+            path,
+            {str(key): frame.to_arrow() for key, frame in data.items()},
+            compression=self.compression,
+        )
@@ -1,16 +1,53 @@
 """Base classes for data writers."""
 
+import asyncio
+import os
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any, ClassVar
 
 import polars as pl
 import pydantic as pdt
 
-from clustering.shared.common.filesystem import ensure_directory
+from clustering.shared.common.filesystem import ensure_directory, set_default_permissions
+from clustering.shared.io.compression import DEFAULT_BLOCK_SIZE, check_level, compress_stream
+from clustering.shared.io.manifest import (
+    file_checksum,
+    file_entry,
+    is_unchanged,
+    read_manifest,
+    write_manifest,
+)
 
 
 class Writer(pdt.BaseModel, ABC):
-    """Base class for data writers."""
+    """Base class for data writers.
+
+    Writers of byte-oriented formats accept a ``codec``, ``"gzip"``, ``"zstd"``
+    or ``"lz4"``, with an optional ``codec_level``. Their output is split into
+    blocks of ``codec_block_size`` bytes that are compressed in parallel by
+    ``codec_workers`` threads, and the matching readers detect the codec from
+    the data and decompress it transparently.
+    """
+
+    codec: str | None = None
+    codec_level: int | None = None
+    codec_block_size: int = pdt.Field(default=DEFAULT_BLOCK_SIZE, gt=0)
+    codec_workers: int | None = pdt.Field(default=None, gt=0)
+
+    # Whether the writer's output can be compressed with a codec
+    supports_codec: ClassVar[bool] = False
+
+    @pdt.model_validator(mode="after")
+    def _check_codec(self) -> "Writer":
+        """Reject codecs the writer does not support and invalid levels."""
+        if self.codec is None:
+            return self
+        if not self.supports_codec:
+            raise ValueError(f"{self.__class__.__name__} does not support a codec")
+        check_level(self.codec, self.codec_level)
+        return self
 
     def write(self, data: pl.DataFrame) -> None:
         """Template method defining the writing algorithm.
@@ -37,6 +74,17 @@ class Writer(pdt.BaseModel, ABC):
         # Step 5: Post-process
         self._post_process()
 
+    async def write_async(self, data: pl.DataFrame) -> None:
+        """Write data without blocking the event loop.
+
+        Writers with a native async client override this method. The default
+        implementation runs ``write`` in a worker thread.
+
+        Args:
+            data: DataFrame to write
+        """
+        await asyncio.to_thread(self.write, data)
+
     def _validate_data(self, data: pl.DataFrame) -> None:
         """Validate the data before writing.
 
@@ -96,10 +144,19 @@ class Writer(pdt.BaseModel, ABC):
 
 
 class FileWriter(Writer):
-    """Base class for file-based writers."""
+    """Base class for file-based writers.
+
+    Subclasses implement ``_write_file``. The data is written to a temporary
+    file next to the destination and renamed into place, so readers never see
+    a partially written file. The checksum of the new content is recorded in a
+    sidecar manifest, ``<path>.manifest.json``. With ``skip_unchanged``, a
+    write whose checksum matches the manifest leaves the destination and the
+    manifest untouched, so unchanged outputs keep their modification time.
+    """
 
     path: str
     create_parent_dirs: bool = True
+    skip_unchanged: bool = True
 
     def __str__(self) -> str:
         """Return string representation of the writer."""
@@ -109,3 +166,84 @@ class FileWriter(Writer):
         """Prepare the path by creating parent directories if needed."""
         if self.create_parent_dirs:
             ensure_directory(Path(self.path).parent)
+
+    def _write_to_destination(self, data: Any) -> None:
+        """Write data to the file atomically, skipping unchanged content.
+
+        Args:
+            data: Data to write
+        """
+        entry = read_manifest(self.path)
+        written = self._write_atomic(data, Path(self.path), entry)
+        if written is not entry:
+            write_manifest(self.path, written)
+
+    def _write_atomic(self, data: Any, path: Path, entry: dict[str, Any] | None) -> dict[str, Any]:
+        """Write data to a file through a temporary file.
+
+        Args:
+            data: Data to write
+            path: Destination file
+            entry: Manifest entry of the current file, if any
+
+        Returns:
+            The manifest entry of the new file, or ``entry`` itself if the
+            content was unchanged and the file was left untouched
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=f"{path.suffix}.tmp")
+        os.close(fd)
+        try:
+            if self.codec is None:
+                self._write_file(data, tmp_name)
+            else:
+                self._write_compressed(data, tmp_name)
+            checksum = file_checksum(tmp_name)
+            if self.skip_unchanged and is_unchanged(entry, path, checksum):
+                Path(tmp_name).unlink()
+                return entry
+            set_default_permissions(tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return file_entry(path, checksum)
+
+    def _write_compressed(self, data: Any, path: str) -> None:
+        """Write data to a file compressed with the codec.
+
+        The uncompressed output goes to a local temporary file, so only the
+        compressed bytes reach the destination's storage.
+
+        Args:
+            data: Data to write
+            path: File to write the compressed data to
+        """
+        fd, raw_name = tempfile.mkstemp(suffix=".raw.tmp")
+        os.close(fd)
+        try:
+            self._write_file(data, raw_name)
+            with open(raw_name, "rb") as source, open(path, "wb") as sink:
+                compress_stream(
+                    source,
+                    sink,
+                    self.codec,
+                    self.codec_level,
+                    self.codec_block_size,
+                    self.codec_workers,
+                )
+        finally:
+            Path(raw_name).unlink(missing_ok=True)
+
+    @abstractmethod
+    def _write_file(self, data: Any, path: str) -> None:
+        """Write data to a file.
+
+        This is an abstract hook method that must be implemented by subclasses
+        to define how their format is written; the base class writes to a
+        temporary file and moves it into place.
+
+        Args:
+            data: Data to write
+            path: File to write to
+        """
@@ -1,14 +1,26 @@
 """Azure Blob Storage writer implementation."""
 
+import asyncio
+import io
 import os
 import pickle
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from io import BytesIO
-from typing import Optional
+from typing import Any, ClassVar, Optional
 
 import polars as pl
+import pyarrow.parquet as pq
+import pydantic as pdt
+from azure.core import MatchConditions
 from azure.core.exceptions import AzureError, ServiceRequestError
-from azure.storage.blob import BlobClient, BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobClient
 
+from clustering.shared.io.blob_clients import (
+    async_blob_clients_available,
+    create_async_blob_client,
+    get_blob_service_client,
+)
+from clustering.shared.io.compression import CODEC_EXTENSIONS, compress_bytes
 from clustering.shared.io.writers.base import Writer
 
 
@@ -16,6 +28,13 @@ class BlobWriter(Writer):
     """Writer for Azure Blob Storage.
 
     Support writing CSV, Parquet, and Pickle files to Azure Blob Storage.
+
+    Large CSV and Parquet outputs are uploaded as a stream of blocks instead of
+    being serialized into memory first.
+
+    CSV, JSON, Excel and Pickle outputs can be compressed with a ``codec``;
+    streamed CSV is compressed chunk by chunk. Parquet blobs are compressed
+    internally and do not take a codec.
     """
 
     connection_string: Optional[str] = None
@@ -25,15 +44,27 @@ class BlobWriter(Writer):
     overwrite: bool = True
     max_concurrency: int = 8
 
+    # Streamed uploads: size of the staged blocks and rows serialized per chunk
+    block_size: int = pdt.Field(default=8 * 1024 * 1024, gt=0)
+    chunk_rows: int = pdt.Field(default=100_000, gt=0)
+
+    STREAMED_FORMATS: ClassVar[tuple[str, ...]] = ("csv", "parquet")
+
+    supports_codec = True
+
     def _validate_destination(self) -> None:
         """Validate the blob storage parameters.
 
         Raises:
-            ValueError: If the file format is not supported
+            ValueError: If the file format is not supported, or a codec is set
+                for Parquet
         """
         # If file_format is not specified, infer it from blob_name extension
         if self.file_format is None:
-            file_extension = os.path.splitext(self.blob_name)[1].lower()
+            name, file_extension = os.path.splitext(self.blob_name)
+            if file_extension.lower() in CODEC_EXTENSIONS:
+                file_extension = os.path.splitext(name)[1]
+            file_extension = file_extension.lower()
             if file_extension.startswith("."):
                 self.file_format = file_extension[1:]
 
@@ -44,12 +75,14 @@ class BlobWriter(Writer):
                 f"Unsupported file format: {self.file_format}. "
                 f"Supported formats are: {', '.join(valid_formats)}"
             )
+        if self.codec is not None and self.file_format == "parquet":
+            raise ValueError("Parquet blobs are compressed internally and do not take a codec")
 
-    def _create_blob_client(self) -> BlobClient:
-        """Create a blob client.
+    def _resolve_destination(self) -> tuple[str, str]:
+        """Resolve the connection string and container name.
 
         Returns:
-            BlobClient: The Azure Blob Client
+            The connection string and the container name
 
         Raises:
             ValueError: If required parameters are missing
@@ -72,14 +105,75 @@ class BlobWriter(Writer):
                     "Container name must be provided or set in AZURE_STORAGE_CONTAINER"
                 )
 
-        # Create blob client using connection string approach
-        blob_service = BlobServiceClient.from_connection_string(conn_string)
+        return conn_string, container
+
+    def _create_blob_client(self) -> BlobClient:
+        """Create a blob client.
+
+        Returns:
+            BlobClient: The Azure Blob Client
+
+        Raises:
+            ValueError: If required parameters are missing
+        """
+        conn_string, container = self._resolve_destination()
+
+        # Reuse the pooled service client of the connection string
+        blob_service = get_blob_service_client(conn_string)
         container_client = blob_service.get_container_client(container)
         return container_client.get_blob_client(self.blob_name)
 
+    async def write_async(self, data: pl.DataFrame) -> None:
+        """Write data to Azure Blob Storage without blocking the event loop.
+
+        Data serialized in memory is uploaded with the native async client.
+        Streamed uploads, and every upload when aiohttp is missing, run
+        ``write`` in a worker thread.
+
+        Args:
+            data: DataFrame to write
+
+        Raises:
+            ValueError: If the file format is not supported
+            RuntimeError: If there's an error uploading to blob storage
+        """
+        self._validate_destination()
+        if self._is_streamed(data) or not async_blob_clients_available():
+            await super().write_async(data)
+            return
+
+        self._validate_data(data)
+        self._prepare_for_writing()
+        buffer = await asyncio.to_thread(lambda: self._serialize(self._pre_process(data)))
+        conn_string, container = self._resolve_destination()
+
+        try:
+            async with create_async_blob_client(
+                conn_string, container, self.blob_name
+            ) as blob_client:
+                await blob_client.upload_blob(
+                    buffer,
+                    blob_type="BlockBlob",
+                    overwrite=self.overwrite,
+                    max_concurrency=self.max_concurrency,
+                )
+        except Exception as e:
+            raise _upload_error(e) from e
+
+        self._post_process()
+
+    def _is_streamed(self, data: pl.DataFrame) -> bool:
+        """Check whether the data is uploaded as staged blocks."""
+        return self.file_format in self.STREAMED_FORMATS and data.estimated_size() > self.block_size
+
     def _write_to_destination(self, data: pl.DataFrame) -> None:
         """Write data to Azure Blob Storage.
 
+        CSV and Parquet data larger than one block is streamed: it is
+        serialized in chunks of ``chunk_rows`` rows, staged as blocks in
+        parallel and committed as a block list, so memory stays bounded by a
+        few blocks. Other data is serialized in memory and uploaded at once.
+
         Args:
             data: DataFrame to write
 
@@ -90,6 +184,37 @@ class BlobWriter(Writer):
         # Validate destination before writing
         self._validate_destination()
 
+        buffer = None if self._is_streamed(data) else self._serialize(data)
+
+        # Create blob client
+        blob_client = self._create_blob_client()
+
+        # Upload to blob storage
+        try:
+            if buffer is None:
+                self._upload_blocks(blob_client, data)
+            else:
+                blob_client.upload_blob(
+                    buffer,
+                    blob_type="BlockBlob",
+                    overwrite=self.overwrite,
+                    max_concurrency=self.max_concurrency,
+                )
+        except Exception as e:
+            raise _upload_error(e) from e
+
+    def _serialize(self, data: pl.DataFrame) -> BytesIO:
+        """Serialize the whole DataFrame in memory.
+
+        Args:
+            data: DataFrame to serialize
+
+        Returns:
+            Buffer positioned at the start of the serialized data
+
+        Raises:
+            ValueError: If the file format is not supported
+        """
         # Create buffer to hold data
         buffer = BytesIO()
 
@@ -110,23 +235,160 @@ class BlobWriter(Writer):
             # This should never happen due to validation
             raise ValueError(f"Unsupported file format: {self.file_format}")
 
+        if self.codec is not None:
+            buffer = BytesIO(self._compress(buffer.getvalue()))
+
         # Reset buffer position
         buffer.seek(0)
+        return buffer
 
-        # Create blob client
-        blob_client = self._create_blob_client()
+    def _compress(self, data: bytes) -> bytes:
+        """Compress serialized data with the codec, in parallel blocks.
 
-        # Upload to blob storage
-        try:
-            blob_client.upload_blob(
-                buffer,
-                blob_type="BlockBlob",
-                overwrite=self.overwrite,
-                max_concurrency=self.max_concurrency,
-            )
-        except AzureError as e:
-            raise RuntimeError(f"Azure service error when uploading blob: {str(e)}") from e
-        except ServiceRequestError as e:
-            raise RuntimeError(f"Network error when uploading blob: {str(e)}") from e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error when uploading blob: {str(e)}") from e
+        Args:
+            data: Serialized data
+
+        Returns:
+            The compressed data
+        """
+        return compress_bytes(
+            data, self.codec, self.codec_level, self.codec_block_size, self.codec_workers
+        )
+
+    def _upload_blocks(self, blob_client: BlobClient, data: pl.DataFrame) -> None:
+        """Serialize data in chunks, stage them as blocks and commit the block list.
+
+        Parquet chunks become row groups; CSV chunks are written without
+        repeating the header.
+
+        Args:
+            blob_client: Client of the destination blob
+            data: DataFrame to upload
+        """
+        with _BlockStager(blob_client, self.block_size, self.max_concurrency) as stager:
+            chunks = data.iter_slices(self.chunk_rows)
+            if self.file_format == "parquet":
+                schema = data.head(0).to_arrow().schema
+                with pq.ParquetWriter(stager, schema, compression="zstd") as writer:
+                    for chunk in chunks:
+                        writer.write_table(chunk.to_arrow())
+            else:
+                for index, chunk in enumerate(chunks):
+                    content = chunk.write_csv(include_header=index == 0).encode()
+                    # Compressed chunks are independent frames of one valid stream
+                    stager.write(content if self.codec is None else self._compress(content))
+            block_list = stager.finish()
+
+        # Without overwrite the commit fails if the blob appeared meanwhile
+        conditions = {} if self.overwrite else {"match_condition": MatchConditions.IfMissing}
+        blob_client.commit_block_list(block_list, **conditions)
+
+
+def _upload_error(error: Exception) -> RuntimeError:
+    """Describe a failed upload.
+
+    Args:
+        error: Exception raised by the upload
+
+    Returns:
+        RuntimeError naming the kind of failure
+    """
+    if isinstance(error, AzureError):
+        return RuntimeError(f"Azure service error when uploading blob: {str(error)}")
+    if isinstance(error, ServiceRequestError):
+        return RuntimeError(f"Network error when uploading blob: {str(error)}")
+    return RuntimeError(f"Unexpected error when uploading blob: {str(error)}")
+
+
+class _BlockStager(io.RawIOBase):
+    """Write-only stream that stages fixed-size blocks of a blob in parallel.
+
+    At most ``max_concurrency`` blocks are in flight at a time; writes wait for
+    a slot, which bounds the memory held by pending blocks.
+    """
+
+    def __init__(self, blob_client: BlobClient, block_size: int, max_concurrency: int) -> None:
+        """Initialize the stream.
+
+        Args:
+            blob_client: Client of the destination blob
+            block_size: Size of the staged blocks in bytes
+            max_concurrency: Maximum number of blocks staged at once
+        """
+        self.blob_client = blob_client
+        self.block_size = block_size
+        self.max_concurrency = max_concurrency
+        self.buffer = bytearray()
+        self.position = 0
+        self.block_ids: list[str] = []
+        self.pending: set[Future] = set()
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def __exit__(self, *args: object) -> None:
+        """Stop the staging threads, cancelling blocks not yet started."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        super().__exit__(*args)
+
+    def writable(self) -> bool:
+        """Return whether the stream can be written."""
+        return True
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self.position
+
+    def write(self, data: Any) -> int:
+        """Buffer data, staging every full block.
+
+        Args:
+            data: Bytes-like data to write
+
+        Returns:
+            Number of bytes written
+        """
+        self.buffer += data
+        size = memoryview(data).nbytes
+        self.position += size
+        while len(self.buffer) >= self.block_size:
+            block = bytes(self.buffer[: self.block_size])
+            del self.buffer[: self.block_size]
+            self._stage(block)
+        return size
+
+    def finish(self) -> list[BlobBlock]:
+        """Stage the remaining data and wait for every block.
+
+        Returns:
+            Blocks to commit, in order
+        """
+        if self.buffer or not self.block_ids:
+            self._stage(bytes(self.buffer))
+            self.buffer.clear()
+        self._wait(0)
+        return [BlobBlock(block_id=block_id) for block_id in self.block_ids]
+
+    def _stage(self, block: bytes) -> None:
+        """Stage a block in the background once a slot is free.
+
+        Args:
+            block: Content of the block
+        """
+        self._wait(self.max_concurrency - 1)
+        # Block IDs of a blob must all have the same length
+        block_id = f"{len(self.block_ids):08d}"
+        self.block_ids.append(block_id)
+        self.pending.add(self.executor.submit(self.blob_client.stage_block, block_id, block))
+
+    def _wait(self, max_pending: int) -> None:
+        """Wait until at most ``max_pending`` blocks are in flight.
+
+        Args:
+            max_pending: Number of blocks allowed to stay in flight
+
+        Raises:
+            Exception: The first error raised while staging a block
+        """
+        while len(self.pending) > max_pending:
+            done, self.pending = wait(self.pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
@@ -12,14 +12,17 @@ class CSVWriter(FileWriter):
     include_header: bool = True
     include_bom: bool = False
 
-    def _write_to_destination(self, data: pl.DataFrame) -> None:
+    supports_codec = True
+
+    def _write_file(self, data: pl.DataFrame, path: str) -> None:
         """Write data to CSV file.
 
         Args:
             data: DataFrame to write
+            path: File to write to
         """
         data.write_csv(
-            file=self.path,
+            file=path,
             separator=self.delimiter,
             include_header=self.include_header,
             include_bom=self.include_bom,
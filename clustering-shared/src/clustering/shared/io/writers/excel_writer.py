@@ -12,20 +12,23 @@ class ExcelWriter(FileWriter):
     engine: str = "openpyxl"
     index: bool = False
 
-    def _write_to_destination(self, data: pl.DataFrame) -> None:
+    def _write_file(self, data: pl.DataFrame, path: str) -> None:
         """Write data to Excel file.
 
         Args:
             data: Data to write
+            path: File to write to
         """
         # Convert to pandas first as polars write_excel may not be fully implemented
         pandas_df = data.to_pandas()
-        pandas_df.to_excel(
-            self.path,
-            sheet_name=self.sheet_name,
-            engine=self.engine,
-            index=self.index,
-        )
+        # Write through a handle, since pandas rejects the temporary file's extension
+        with open(path, "wb") as file:
+            pandas_df.to_excel(
+                file,
+                sheet_name=self.sheet_name,
+                engine=self.engine,
+                index=self.index,
+            )
 
     def write(self, data: pl.DataFrame) -> None:
         """Write data to Excel file.
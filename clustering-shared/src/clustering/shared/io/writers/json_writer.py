@@ -14,18 +14,21 @@ class JSONWriter(FileWriter):
     lines: bool = True
     pretty: bool = False
 
-    def _write_to_destination(self, data: pl.DataFrame) -> None:
+    supports_codec = True
+
+    def _write_file(self, data: pl.DataFrame, path: str) -> None:
         """Write DataFrame to a JSON file.
 
         Args:
             data: DataFrame to write
+            path: File to write to
         """
         # Polars' JSON writer is limited in options
         # We need to handle options manually
         if self.lines:
             # Write as JSON lines (newline-delimited JSON)
             records = data.to_dicts()
-            with open(self.path, "w") as f:
+            with open(path, "w") as f:
                 for record in records:
                     if self.pretty:
                         json_str = json.dumps(record, indent=2)
@@ -36,7 +39,7 @@ class JSONWriter(FileWriter):
             # Write as a single JSON array
             if self.orient == "records":
                 records = data.to_dicts()
-                with open(self.path, "w") as f:
+                with open(path, "w") as f:
                     if self.pretty:
                         json.dump(records, f, indent=2)
                     else:
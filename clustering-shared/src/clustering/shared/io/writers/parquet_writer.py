@@ -1,24 +1,136 @@
 """Parquet writer implementation."""
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
 import polars as pl
+import pyarrow.parquet as pq
 
+from clustering.shared.io.manifest import read_manifest, write_manifest
 from clustering.shared.io.writers.base import FileWriter
 
+# Directory name Hive uses for null partition values
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
 
 class ParquetWriter(FileWriter):
-    """Writer for Parquet files."""
+    """Writer for Parquet files and partitioned datasets.
+
+    Without ``partition_by`` the data is written to a single file. With it,
+    ``path`` is the root of a Hive-style dataset such as
+    ``assignments/category=Snacks/part-0.parquet``. Only the partitions present
+    in the data are replaced, so a dataset can be rewritten one partition at a
+    time, and independent partitions are written in parallel.
+
+    Every file, including each partition file, is written atomically and
+    skipped when its content is unchanged, as described in ``FileWriter``. A
+    dataset's manifest, ``<path>.manifest.json``, lists its files by path
+    relative to the root.
+    """
 
     compression: str | None = "snappy"
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    use_dictionary: bool = True
+    statistics: bool = True
     use_pyarrow: bool = True
+    partition_by: list[str] | None = None
+    max_workers: int = 4
+
+    def _validate_data(self, data: pl.DataFrame) -> None:
+        """Validate the data and the partition columns.
+
+        Args:
+            data: DataFrame to validate
+
+        Raises:
+            ValueError: If the data is empty or a partition column is missing
+        """
+        super()._validate_data(data)
+        missing = [col for col in self.partition_by or [] if col not in data.columns]
+        if missing:
+            raise ValueError(f"Partition columns not found in data: {', '.join(missing)}")
 
     def _write_to_destination(self, data: pl.DataFrame) -> None:
-        """Write data to Parquet file.
+        """Write data to a Parquet file or partitioned dataset.
+
+        Args:
+            data: Data to write
+        """
+        if not self.partition_by:
+            super()._write_to_destination(data)
+            return
+
+        root = Path(self.path)
+        files = dict((read_manifest(root) or {}).get("files", {}))
+        partitions = data.partition_by(self.partition_by, as_dict=True, include_key=False)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for key, frame in partitions.items():
+                path = self._partition_path(key)
+                name = path.relative_to(root).as_posix()
+                futures[name] = executor.submit(self._write_partition, frame, path, files.get(name))
+
+            written = {name: future.result() for name, future in futures.items()}
+
+        if any(entry is not files.get(name) for name, entry in written.items()):
+            write_manifest(root, {"files": {**files, **written}})
+
+    def _partition_path(self, key: tuple) -> Path:
+        """Get the file path of a partition.
+
+        Args:
+            key: Values of the partition columns
+
+        Returns:
+            Path of the partition's data file
+        """
+        directory = Path(self.path)
+        for column, value in zip(self.partition_by, key):
+            value = NULL_PARTITION if value is None else quote(str(value), safe="")
+            directory = directory / f"{column}={value}"
+        return directory / "part-0.parquet"
+
+    def _write_partition(
+        self, data: pl.DataFrame, path: Path, entry: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Write one partition file atomically.
+
+        Args:
+            data: Data of the partition
+            path: Destination file
+            entry: Manifest entry of the current file, if any
+
+        Returns:
+            The manifest entry of the file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return self._write_atomic(data, path, entry)
+
+    def _write_file(self, data: pl.DataFrame, path: str) -> None:
+        """Write one Parquet file.
 
         Args:
             data: Data to write
+            path: File to write to
         """
-        data.write_parquet(
-            self.path,
-            compression=self.compression,
-            use_pyarrow=self.use_pyarrow,
-        )
+        if self.use_pyarrow:
+            pq.write_table(
+                data.to_arrow(),
+                path,
+                compression=self.compression or "none",
+                compression_level=self.compression_level,
+                row_group_size=self.row_group_size,
+                use_dictionary=self.use_dictionary,
+                write_statistics=self.statistics,
+            )
+        else:
+            data.write_parquet(
+                path,
+                compression=self.compression or "uncompressed",
+                compression_level=self.compression_level,
+                row_group_size=self.row_group_size,
+                statistics=self.statistics,
+            )
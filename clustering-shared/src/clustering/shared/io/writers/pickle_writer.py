@@ -16,6 +16,8 @@ class PickleWriter(FileWriter):
 
     protocol: int = pickle.HIGHEST_PROTOCOL
 
+    supports_codec = True
+
     def _validate_data(self, data: pl.DataFrame | dict[str, pl.DataFrame]) -> None:
         """Validate the data before writing.
 
@@ -48,14 +50,14 @@ class PickleWriter(FileWriter):
                 f"Unsupported data type: {type(data)}. Expected DataFrame or dictionary of DataFrames."
             )
 
-    def _write_to_destination(self, data: pl.DataFrame | dict[str, pl.DataFrame]) -> None:
+    def _write_file(self, data: pl.DataFrame | dict[str, pl.DataFrame], path: str) -> None:
         """Write data to Pickle file.
 
-        This implements the abstract method required by the Writer base class.
         Supports both DataFrames and dictionaries of DataFrames.
 
         Args:
             data: DataFrame or dictionary of DataFrames to write
+            path: File to write to
         """
         # Convert polars DataFrame(s) to pandas before pickling for better compatibility
         if isinstance(data, pl.DataFrame):
@@ -66,5 +68,5 @@ class PickleWriter(FileWriter):
             # This shouldn't happen as validation should catch it, but just in case
             raise ValueError(f"Unsupported data type: {type(data)}")
 
-        with open(self.path, "wb") as file:
+        with open(path, "wb") as file:
             pickle.dump(data_to_pickle, file, protocol=self.protocol)
@@ -1,16 +1,38 @@
 """Snowflake writer implementation."""
 
-import json
-import pickle
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
 
 import polars as pl
+import pydantic as pdt
 import snowflake.connector
 
+from clustering.shared.io.snowflake_connections import connect, pooled_connection
+from clustering.shared.io.snowflake_local import LocalSnowflakeConnection
 from clustering.shared.io.writers.base import Writer
 
+# Parquet files are read with their logical types, so dates and timestamps load as such
+_FILE_FORMAT = "(TYPE = PARQUET USE_LOGICAL_TYPE = TRUE)"
+
 
 class SnowflakeWriter(Writer):
-    """Writer for Snowflake database."""
+    """Writer for Snowflake database.
+
+    Data is bulk loaded: the frame is written as compressed Parquet chunks in
+    parallel, the chunks are uploaded to a temporary stage and loaded with a
+    single ``COPY INTO``. With ``overwrite`` the rows are copied into a
+    separate table first and only then replace the table's rows, so a failed
+    upload or copy leaves the previous data in place. Otherwise the rows are
+    appended.
+
+    With ``merge_keys`` the rows are upserted instead: they are loaded into a
+    temporary table and merged into the target on the key columns, updating
+    matching rows and inserting the others, so incremental updates do not
+    rewrite the whole table. ``overwrite`` does not apply in that mode.
+    """
 
     # Required parameters
     table: str
@@ -20,33 +42,54 @@ class SnowflakeWriter(Writer):
     # Options
     auto_create_table: bool = True
     overwrite: bool = True
+    merge_keys: list[str] | None = None
+
+    # Bulk load
+    chunk_rows: int = pdt.Field(default=500_000, gt=0)
+    compression: str = "snappy"
+    max_workers: int = 4
 
     # Credentials paths
     pkb_path: str = "creds/pkb.pkl"
     creds_path: str = "creds/sf_creds.json"
 
+    # DuckDB file written through the local stand-in connector instead of Snowflake
+    local_database: str | None = None
+
+    def _validate_data(self, data: pl.DataFrame) -> None:
+        """Validate the data and the merge keys.
+
+        Args:
+            data: DataFrame to validate
+
+        Raises:
+            ValueError: If the data is empty, a merge key is missing, or the
+                keys do not identify rows uniquely
+        """
+        super()._validate_data(data)
+        if self.merge_keys is None:
+            return
+
+        if not self.merge_keys:
+            raise ValueError("merge_keys must name at least one column")
+        missing = [col for col in self.merge_keys if col not in data.columns]
+        if missing:
+            raise ValueError(f"Merge keys not found in data: {', '.join(missing)}")
+        # Snowflake rejects a MERGE in which several source rows match a target row
+        if data.select(self.merge_keys).is_duplicated().any():
+            raise ValueError(f"Merge keys are not unique: {', '.join(self.merge_keys)}")
+
     def _create_connection(self) -> snowflake.connector.SnowflakeConnection:
         """Create a Snowflake connection.
 
+        With ``local_database`` set, a local stand-in connection is created instead.
+
         Returns:
             SnowflakeConnection: A connection to Snowflake
         """
-        with open(self.pkb_path, "rb") as file:
-            pkb = pickle.load(file)
-
-        with open(self.creds_path) as file:
-            sf_params = json.loads(file.read())
-
-        conn = snowflake.connector.connect(
-            user=sf_params["SF_USER_NAME"],
-            private_key=pkb,
-            account=sf_params["SF_ACCOUNT"],
-            database=sf_params["SF_DB"],
-            warehouse=sf_params["SF_WAREHOUSE"],
-            role=sf_params["SF_USER_ROLE"],
-            insecure_mode=sf_params.get("SF_INSECURE_MODE") == "True",
-        )
-        return conn
+        if self.local_database is not None:
+            return LocalSnowflakeConnection(self.local_database)
+        return connect(self.pkb_path, self.creds_path)
 
     def _write_to_destination(self, data: pl.DataFrame) -> None:
         """Write data to Snowflake.
@@ -54,22 +97,184 @@ class SnowflakeWriter(Writer):
         Args:
             data: DataFrame to write
         """
-        conn = self._create_connection()
-
-        # Convert to pandas first since Snowflake connector expects pandas
-        pandas_df = data.to_pandas()
-
-        # Use Snowflake's pandas_tools to write the DataFrame
-        from snowflake.connector.pandas_tools import write_pandas
-
-        write_pandas(
-            conn=conn,
-            df=pandas_df,
-            table_name=self.table,
-            database=self.database,
-            schema=self.sf_schema,
-            auto_create_table=self.auto_create_table,
-            overwrite=self.overwrite,
+        key = (
+            ("local", self.local_database)
+            if self.local_database
+            else (self.pkb_path, self.creds_path)
+        )
+        with (
+            pooled_connection(key, self._create_connection) as conn,
+            tempfile.TemporaryDirectory() as tmp_dir,
+        ):
+            self._write_chunks(data, Path(tmp_dir))
+            cursor = conn.cursor()
+            try:
+                self._load(cursor, data.schema, Path(tmp_dir))
+            finally:
+                cursor.close()
+
+    def _write_chunks(self, data: pl.DataFrame, directory: Path) -> None:
+        """Write the data as compressed Parquet chunks in parallel.
+
+        Args:
+            data: DataFrame to write
+            directory: Directory receiving the chunks
+        """
+
+        def write(index: int, chunk: pl.DataFrame) -> None:
+            chunk.write_parquet(
+                directory / f"part-{index:05d}.parquet", compression=self.compression
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(write, index, chunk)
+                for index, chunk in enumerate(data.iter_slices(self.chunk_rows))
+            ]
+            for future in futures:
+                future.result()
+
+    def _load(self, cursor: Any, schema: pl.Schema, directory: Path) -> None:
+        """Stage the chunks and load them into the table.
+
+        Args:
+            cursor: Cursor of the connection
+            schema: Schema of the data
+            directory: Directory holding the chunks
+        """
+        target = self._qualified(self.table)
+        load_id = uuid.uuid4().hex[:12].upper()
+        stage = self._qualified(f"CLUSTERING_LOAD_{load_id}")
+        columns = ", ".join(
+            f"{_identifier(name)} {_column_type(dtype)}" for name, dtype in schema.items()
         )
 
-        conn.close()
+        cursor.execute(f"CREATE TEMPORARY STAGE {stage} FILE_FORMAT = {_FILE_FORMAT}")
+        try:
+            cursor.execute(
+                f"PUT 'file://{directory.as_posix()}/part-*.parquet' @{stage} "
+                f"PARALLEL = {self.max_workers} AUTO_COMPRESS = FALSE"
+            )
+
+            if self.merge_keys:
+                if self.auto_create_table:
+                    cursor.execute(f"CREATE TABLE IF NOT EXISTS {target} ({columns})")
+                updates = self._qualified(f"{self.table.split('.')[-1]}_UPDATES_{load_id}")
+                cursor.execute(f"CREATE TEMPORARY TABLE {updates} ({columns})")
+                try:
+                    cursor.execute(_copy(updates, stage))
+                    cursor.execute(_merge(target, updates, list(schema), self.merge_keys))
+                finally:
+                    cursor.execute(f"DROP TABLE IF EXISTS {updates}")
+                return
+
+            if self.overwrite:
+                self._replace(cursor, target, columns, list(schema), stage, load_id)
+                return
+
+            if self.auto_create_table:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {target} ({columns})")
+            cursor.execute(_copy(target, stage))
+        finally:
+            cursor.execute(f"DROP STAGE IF EXISTS {stage}")
+
+    def _replace(
+        self, cursor: Any, target: str, columns: str, names: list[str], stage: str, load_id: str
+    ) -> None:
+        """Load the staged chunks into a new table and replace the target's rows with it.
+
+        With ``auto_create_table`` the loaded table is swapped with the target,
+        which takes the frame's columns like a ``CREATE OR REPLACE``. Otherwise
+        the target keeps its definition and its rows are replaced with a single
+        ``INSERT OVERWRITE``. The target is untouched until the load succeeded.
+
+        Args:
+            cursor: Cursor of the connection
+            target: Qualified name of the target table
+            columns: Column definitions of the data
+            names: Column names of the data
+            stage: Qualified name of the stage holding the chunks
+            load_id: Suffix identifying this load
+        """
+        loaded = self._qualified(f"{self.table.split('.')[-1]}_LOAD_{load_id}")
+        # A swapped table must be permanent, or the target would become temporary
+        kind = "TABLE" if self.auto_create_table else "TEMPORARY TABLE"
+        cursor.execute(f"CREATE {kind} {loaded} ({columns})")
+        try:
+            cursor.execute(_copy(loaded, stage))
+            if self.auto_create_table:
+                cursor.execute(f"CREATE TABLE IF NOT EXISTS {target} ({columns})")
+                cursor.execute(f"ALTER TABLE {target} SWAP WITH {loaded}")
+            else:
+                quoted = ", ".join(_identifier(name) for name in names)
+                cursor.execute(
+                    f"INSERT OVERWRITE INTO {target} ({quoted}) SELECT {quoted} FROM {loaded}"
+                )
+        finally:
+            cursor.execute(f"DROP TABLE IF EXISTS {loaded}")
+
+    def _qualified(self, name: str) -> str:
+        """Qualify an object name with the database and schema.
+
+        Names that already contain a schema are kept as written. The local
+        stand-in has a single schema, so its names are not qualified.
+
+        Args:
+            name: Object name
+
+        Returns:
+            The name to use in statements
+        """
+        if self.local_database is not None:
+            return name.split(".")[-1]
+        if "." in name:
+            return name
+        return f"{self.database}.{self.sf_schema}.{name}"
+
+
+def _identifier(name: str) -> str:
+    """Quote a column name as a case-sensitive SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_type(dtype: pl.DataType) -> str:
+    """Map a Polars type to a column type understood by Snowflake and DuckDB."""
+    if dtype.is_integer():
+        return "BIGINT"
+    if dtype.is_float():
+        return "DOUBLE"
+    if isinstance(dtype, pl.Decimal):
+        return f"DECIMAL({dtype.precision or 38}, {dtype.scale})"
+    if isinstance(dtype, pl.Datetime):
+        return "TIMESTAMP" if dtype.time_zone is None else "TIMESTAMPTZ"
+    simple = {
+        pl.Boolean: "BOOLEAN",
+        pl.String: "VARCHAR",
+        pl.Categorical: "VARCHAR",
+        pl.Enum: "VARCHAR",
+        pl.Date: "DATE",
+        pl.Time: "TIME",
+        pl.Binary: "BINARY",
+    }
+    return simple.get(dtype.base_type(), "VARIANT")
+
+
+def _copy(table: str, stage: str) -> str:
+    """Build the statement loading the staged chunks into a table."""
+    return (
+        f"COPY INTO {table} FROM @{stage} FILE_FORMAT = {_FILE_FORMAT} "
+        "MATCH_BY_COLUMN_NAME = CASE_SENSITIVE PURGE = TRUE"
+    )
+
+
+def _merge(target: str, source: str, columns: list[str], keys: list[str]) -> str:
+    """Build the statement upserting the source rows into the target on the keys."""
+    condition = " AND ".join(f"t.{_identifier(key)} = s.{_identifier(key)}" for key in keys)
+    names = ", ".join(_identifier(col) for col in columns)
+    values = ", ".join(f"s.{_identifier(col)}" for col in columns)
+    sql = f"MERGE INTO {target} AS t USING {source} AS s ON {condition}"
+    updates = [col for col in columns if col not in keys]
+    if updates:
+        assignments = ", ".join(f"{_identifier(col)} = s.{_identifier(col)}" for col in updates)
+        sql += f" WHEN MATCHED THEN UPDATE SET {assignments}"
+    return sql + f" WHEN NOT MATCHED THEN INSERT ({names}) VALUES ({values})"
@@ -9,8 +9,8 @@ import pandas as pd
 import pytest
 from dagster import (
     Definitions,
+    ExecuteInProcessResult,
 )
-from dagster._core.test_utils import InProcessExecutionResult
 
 
 @pytest.fixture
@@ -69,14 +69,14 @@ def mock_pipeline_context() -> dict[str, Any]:
 
 
 @pytest.fixture
-def run_dagster_job() -> Callable[..., InProcessExecutionResult]:
+def run_dagster_job() -> Callable[..., ExecuteInProcessResult]:
     """Create a fixture for running a Dagster job.
 
     Returns:
         Callable: A function to run a Dagster job.
     """
 
-    def _run_job(defs: Definitions, job_name: str, **kwargs: Any) -> InProcessExecutionResult:
+    def _run_job(defs: Definitions, job_name: str, **kwargs: Any) -> ExecuteInProcessResult:
         """Run a Dagster job.
 
         Args:
@@ -85,7 +85,7 @@ def run_dagster_job() -> Callable[..., InProcessExecutionResult]:
             **kwargs: Additional keyword arguments to pass to execute_job.
 
         Returns:
-            InProcessExecutionResult: The result of executing the job.
+            ExecuteInProcessResult: The result of executing the job.
         """
         job = defs.get_job_def(job_name)
         return job.execute_in_process(**kwargs)
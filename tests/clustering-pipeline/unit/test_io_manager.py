@@ -0,0 +1,77 @@
+"""Tests for the columnar IO manager."""
+
+import os
+import stat
+
+import dagster as dg
+import polars as pl
+import pytest
+
+from clustering.pipeline.resources.io_manager import ColumnarIOManager
+
+
+class TestColumnarIOManager:
+    """Tests for ColumnarIOManager."""
+
+    def test_dataframe_round_trip(self, tmp_path) -> None:
+        """A single DataFrame is stored as one Arrow file and read back."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+        data = pl.DataFrame({"STORE_NBR": [1, 2], "Cluster": ["a", "b"]})
+
+        manager.handle_output(dg.build_output_context(asset_key="assignments"), data)
+        loaded = manager.load_input(dg.build_input_context(asset_key="assignments"))
+
+        assert (tmp_path / "assignments.arrow").exists()
+        assert loaded.equals(data)
+
+    def test_dict_round_trip_preserves_keys_and_order(self, tmp_path) -> None:
+        """Dictionaries keep their original keys, including unsafe file names."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+        data = {
+            "Health/Beauty": pl.DataFrame({"x": [1]}),
+            "Baby Care": pl.DataFrame({"y": [2.0, 3.0]}),
+        }
+
+        manager.handle_output(dg.build_output_context(asset_key="by_category"), data)
+        loaded = manager.load_input(dg.build_input_context(asset_key="by_category"))
+
+        assert list(loaded) == ["Health/Beauty", "Baby Care"]
+        assert all(loaded[key].equals(frame) for key, frame in data.items())
+
+    def test_output_replaces_previous_layout(self, tmp_path) -> None:
+        """Switching an asset from a dict to a DataFrame removes the old directory."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+        manager.handle_output(
+            dg.build_output_context(asset_key="asset"), {"a": pl.DataFrame({"x": [1]})}
+        )
+        manager.handle_output(dg.build_output_context(asset_key="asset"), pl.DataFrame({"x": [2]}))
+
+        assert not (tmp_path / "asset").exists()
+        assert manager.load_input(dg.build_input_context(asset_key="asset"))["x"].to_list() == [2]
+
+    def test_outputs_are_not_owner_only(self, tmp_path) -> None:
+        """Files and directories get the umask's mode, not the temporary one."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+        frame = pl.DataFrame({"x": [1]})
+
+        manager.handle_output(dg.build_output_context(asset_key="single"), frame)
+        manager.handle_output(dg.build_output_context(asset_key="many"), {"a": frame})
+
+        mask = os.umask(0)
+        os.umask(mask)
+        assert stat.S_IMODE((tmp_path / "single.arrow").stat().st_mode) == 0o666 & ~mask
+        assert stat.S_IMODE((tmp_path / "many").stat().st_mode) == 0o777 & ~mask
+
+    def test_non_columnar_output_raises(self, tmp_path) -> None:
+        """Objects that are not DataFrames are rejected."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+
+        with pytest.raises(TypeError):
+            manager.handle_output(dg.build_output_context(asset_key="asset"), {"a": 1})
+
+    def test_missing_input_raises(self, tmp_path) -> None:
+        """Loading an asset that was never materialized fails clearly."""
+        manager = ColumnarIOManager(base_dir=str(tmp_path))
+
+        with pytest.raises(FileNotFoundError):
+            manager.load_input(dg.build_input_context(asset_key="missing"))
@@ -0,0 +1,206 @@
+"""Tests for the cluster merging assets and rebalancing engine."""
+
+from types import SimpleNamespace
+
+import dagster as dg
+import numpy as np
+import polars as pl
+
+from clustering.pipeline.assets.merging.merge import (
+    cluster_reassignment,
+    merged_cluster_assignments,
+    merged_clusters,
+    pack_cluster_ids,
+    unpack_cluster_ids,
+)
+from clustering.pipeline.assets.merging.rebalance import (
+    feature_columns,
+    rebalance_clusters,
+    standardize_features,
+)
+
+
+class TestRebalanceClusters:
+    """Tests for the rebalance_clusters engine."""
+
+    def test_small_cluster_moves_to_nearest_large_cluster(self) -> None:
+        """Rows of an undersized cluster join the closest viable centroid."""
+        features = np.array([[0.0], [0.1], [0.2], [10.0], [10.1], [10.2], [9.0]])
+        codes = np.array([0, 0, 0, 1, 1, 1, 2])
+
+        result, passes = rebalance_clusters(codes, features, min_cluster_size=3)
+
+        assert result.tolist() == [0, 0, 0, 1, 1, 1, 1]
+        assert passes == 1
+
+    def test_no_small_clusters_is_a_no_op(self) -> None:
+        """Codes are returned unchanged when every cluster meets the floor."""
+        features = np.arange(6, dtype=float).reshape(-1, 1)
+        codes = np.array([0, 0, 0, 1, 1, 1])
+
+        result, passes = rebalance_clusters(codes, features, min_cluster_size=3)
+
+        assert result.tolist() == codes.tolist()
+        assert passes == 0
+
+    def test_fragmented_clusters_converge(self) -> None:
+        """Many singleton clusters are folded until every cluster meets the floor."""
+        rng = np.random.default_rng(0)
+        features = np.vstack([rng.normal(0, 1, (50, 2)), rng.normal(20, 1, (50, 2))])
+        codes = np.arange(100)
+
+        result, passes = rebalance_clusters(codes, features, min_cluster_size=10)
+
+        sizes = np.bincount(result)
+        assert sizes[sizes > 0].min() >= 10
+        assert passes <= 10
+        # Stores from the two well-separated blobs never share a cluster
+        assert not set(result[:50]) & set(result[50:])
+
+    def test_not_enough_rows_collapses_to_single_cluster(self) -> None:
+        """When the floor is unreachable, all rows end up in one cluster."""
+        features = np.arange(4, dtype=float).reshape(-1, 1)
+        codes = np.array([0, 1, 2, 3])
+
+        result, _ = rebalance_clusters(codes, features, min_cluster_size=10)
+
+        assert len(set(result.tolist())) == 1
+
+
+class TestFeaturePreparation:
+    """Tests for feature selection and standardization."""
+
+    def test_feature_columns_excludes_identifiers(self) -> None:
+        """Store numbers, cluster labels and strings are not features."""
+        data = pl.DataFrame(
+            {
+                "STORE_NBR": [1, 2],
+                "Cluster": [0, 1],
+                "Cluster_external": [1, 0],
+                "sales": [1.0, 2.0],
+                "visits": [3, 4],
+                "merged_cluster": ["0_1", "1_0"],
+            }
+        )
+
+        assert feature_columns(data) == ["sales", "visits"]
+
+    def test_standardize_features_fills_missing_values(self) -> None:
+        """Nulls are imputed with the column mean before scaling."""
+        data = pl.DataFrame({"a": [1.0, None, 3.0], "b": [5.0, 5.0, 5.0]})
+
+        matrix = standardize_features(data, ["a", "b"])
+
+        assert not np.isnan(matrix).any()
+        assert matrix[1, 0] == 0.0
+        assert (matrix[:, 1] == 0.0).all()
+
+
+def test_cluster_reassignment_asset() -> None:
+    """Each category is rebalanced independently and the results are stacked."""
+    merged = pl.DataFrame(
+        {
+            "STORE_NBR": [1, 2, 3, 4, 5, 6, 7, 1, 2, 3],
+            "category": ["Beauty"] * 7 + ["Health"] * 3,
+            "Cluster": [0, 0, 0, 1, 1, 1, 1, 0, 0, 0],
+            "Cluster_external": [0, 0, 0, 0, 0, 0, 1, 0, 0, 1],
+            "sales": [0.0, 0.1, 0.2, 10.0, 10.1, 10.2, 9.5, None, None, None],
+            "visits": [None] * 7 + [1.0, 1.1, 5.0],
+            "merged_cluster_label": [
+                "0_0",
+                "0_0",
+                "0_0",
+                "1_0",
+                "1_0",
+                "1_0",
+                "1_1",
+                "0_0",
+                "0_0",
+                "0_1",
+            ],
+        },
+        schema_overrides={"merged_cluster_label": pl.Categorical},
+    ).with_columns(pack_cluster_ids("Cluster", "Cluster_external").alias("merged_cluster"))
+    context = dg.build_asset_context(resources={"job_params": SimpleNamespace(min_cluster_size=2)})
+
+    result = cluster_reassignment(
+        context,
+        {
+            "small_clusters": pl.DataFrame(
+                {
+                    "category": ["Beauty", "Health"],
+                    "merged_cluster": [(1 << 32) + 1, 1],
+                    "count": [1, 1],
+                }
+            ),
+            "large_clusters": pl.DataFrame(
+                {
+                    "category": ["Beauty", "Beauty"],
+                    "merged_cluster": [0, 1 << 32],
+                    "count": [3, 3],
+                }
+            ),
+            "merged_data": merged,
+        },
+    )
+
+    assert result.columns == [
+        "STORE_NBR",
+        "category",
+        "merged_cluster",
+        "merged_cluster_label",
+        "final_cluster",
+        "final_cluster_label",
+    ]
+    beauty = result.filter(pl.col("category") == "Beauty")
+    health = result.filter(pl.col("category") == "Health")
+    assert beauty.filter(pl.col("STORE_NBR") == 7)["final_cluster"].item() == 1 << 32
+    assert beauty.filter(pl.col("STORE_NBR") == 7)["final_cluster_label"].item() == "1_0"
+    assert health["final_cluster"].to_list() == [0, 0, 0]
+    assert health["final_cluster_label"].to_list() == ["0_0", "0_0", "0_0"]
+
+
+def test_merged_clusters_merges_every_category() -> None:
+    """All internal categories are joined with the shared external clusters."""
+    internal = {
+        "Beauty": pl.DataFrame({"STORE_NBR": [1, 2], "% Sales A": [0.5, 0.7], "Cluster": [0, 1]}),
+        "Health": pl.DataFrame({"STORE_NBR": [1, 2], "% Sales B": [0.1, 0.9], "Cluster": [1, 1]}),
+    }
+    external = pl.DataFrame({"STORE_NBR": [1, 2], "visits": [10, 20], "Cluster": [3, 4]})
+    context = dg.build_asset_context(resources={"job_params": SimpleNamespace()})
+
+    result = merged_clusters(context, internal, external).sort(["category", "STORE_NBR"])
+
+    assert result["category"].to_list() == ["Beauty", "Beauty", "Health", "Health"]
+    assert result["merged_cluster"].dtype == pl.Int64
+    assert result["merged_cluster"].to_list() == [0, (1 << 32) + 1, 0, 1]
+    assert result["merged_cluster_label"].cast(pl.Utf8).to_list() == ["0_3", "1_4", "1_3", "1_4"]
+    assert result.filter(pl.col("category") == "Beauty")["% Sales B"].null_count() == 2
+
+
+def test_merged_cluster_assignments_are_arrow_tables() -> None:
+    """Counts and store mappings keep integer ids and label dictionaries."""
+    merged = pl.DataFrame(
+        {
+            "STORE_NBR": [1, 2, 3],
+            "category": ["Beauty"] * 3,
+            "internal": ["b", "a", "b"],
+            "external": ["x", "x", "x"],
+        }
+    ).with_columns(
+        pack_cluster_ids("internal", "external").alias("merged_cluster"),
+        pl.concat_str(["internal", "external"], separator="_")
+        .cast(pl.Categorical)
+        .alias("merged_cluster_label"),
+    )
+    context = dg.build_asset_context()
+
+    result = merged_cluster_assignments(context, merged)
+
+    counts = pl.from_arrow(result["clusters"])
+    assert counts["merged_cluster_label"].cast(pl.Utf8).to_list() == ["b_x", "a_x"]
+    assert counts["count"].to_list() == [2, 1]
+    assert result["store_mappings"].num_rows == 3
+    internal_code, external_code = unpack_cluster_ids("merged_cluster")
+    assert counts.select(internal_code)["merged_cluster"].to_list() == [1, 0]
+    assert counts.select(external_code)["merged_cluster"].to_list() == [0, 0]
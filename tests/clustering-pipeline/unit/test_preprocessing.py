@@ -0,0 +1,260 @@
+"""Tests for the internal preprocessing assets."""
+
+import os
+import stat
+from types import SimpleNamespace
+
+import dagster as dg
+import polars as pl
+import pytest
+
+from clustering.pipeline.assets.preprocessing import internal
+from clustering.pipeline.assets.preprocessing.category_store import (
+    CategoryStore,
+    dirty_categories,
+    fingerprint_categories,
+)
+from clustering.pipeline.assets.preprocessing.external import external_features_data
+from clustering.shared.io.readers import CSVReader
+
+
+@pytest.fixture
+def source_files(tmp_path, monkeypatch) -> None:
+    """Write small sales and need state sources and point the assets at them."""
+    sales_path = tmp_path / "ns_sales.csv"
+    map_path = tmp_path / "ns_map.csv"
+    pl.DataFrame(
+        {
+            "SKU_NBR": [101, 101, 102, 103, 104],
+            "STORE_NBR": [1, 2, 1, 2, 1],
+            "CAT_DSC": ["Health", "Health", "Health", "Beauty", "Beauty"],
+            "TOTAL_SALES": [100.0, 50.0, 300.0, 80.0, 20.0],
+        }
+    ).write_csv(sales_path)
+    pl.DataFrame(
+        {
+            "PRODUCT_ID": [101, 101, 102, 103, 104, None],
+            "NEED_STATE": ["a", "b", "a", "c", "d", "e"],
+        }
+    ).write_csv(map_path)
+    monkeypatch.setattr(internal, "NS_SALES_PATH", str(sales_path))
+    monkeypatch.setattr(internal, "NS_MAP_PATH", str(map_path))
+
+
+def _run_internal_preprocessing(**job_params) -> dict[str, pl.DataFrame]:
+    """Chain the internal preprocessing assets the way the job does."""
+    context = dg.build_asset_context(resources={"job_params": SimpleNamespace(**job_params)})
+    sales = internal.internal_raw_sales_data(context)
+    mapping = internal.internal_product_category_mapping(context)
+    merged = internal.internal_sales_with_categories(context, sales, mapping)
+    normalized = internal.internal_normalized_sales_data(context, merged)
+    return internal.internal_sales_by_category(context, normalized)
+
+
+@pytest.mark.usefixtures("source_files")
+class TestLazyPreprocessing:
+    """Tests for the lazy preprocessing mode."""
+
+    def test_lazy_mode_returns_query_plans(self) -> None:
+        """Source assets scan instead of reading when lazy mode is enabled."""
+        context = dg.build_asset_context(
+            resources={"job_params": SimpleNamespace(lazy_preprocessing=True)}
+        )
+
+        assert isinstance(internal.internal_raw_sales_data(context), pl.LazyFrame)
+        assert isinstance(internal.internal_product_category_mapping(context), pl.LazyFrame)
+
+    def test_lazy_mode_matches_eager_mode(self) -> None:
+        """The streaming plan produces the same category tables as eager mode."""
+        eager = _run_internal_preprocessing(lazy_preprocessing=False)
+        lazy = _run_internal_preprocessing(lazy_preprocessing=True)
+
+        assert set(lazy) == set(eager) == {"Health", "Beauty"}
+        for category, frame in eager.items():
+            expected = frame.sort("STORE_NBR")
+            actual = lazy[category].select(expected.columns).sort("STORE_NBR")
+            assert actual.equals(expected)
+
+        # SKU 101 is split evenly across need states a and b
+        health = lazy["Health"].sort("STORE_NBR")
+        assert health["% Sales A"].to_list() == [87.5, 50.0]
+        assert health["% Sales B"].to_list() == [12.5, 50.0]
+
+
+class TestSalesByCategory:
+    """Tests for the partitioned pivot in internal_sales_by_category."""
+
+    def test_percentages_are_pivoted_per_category(self) -> None:
+        """Each category gets its own need state columns and store percentages."""
+        normalized = pl.DataFrame(
+            {
+                "SKU_NBR": [1, 2, 3, 4, 5, 6],
+                "STORE_NBR": [1, 1, 2, 1, 2, 2],
+                "CAT_DSC": ["Health", "Health", "Health", "Beauty", "Beauty", "Beauty"],
+                "NEED_STATE": ["A", "B", "A", "C", "C", "D"],
+                "TOTAL_SALES": [30.0, 10.0, 5.0, 7.0, 1.0, 3.0],
+            }
+        )
+
+        context = dg.build_asset_context(resources={"job_params": SimpleNamespace()})
+
+        result = internal.internal_sales_by_category(context, normalized)
+
+        health = result["Health"].sort("STORE_NBR")
+        beauty = result["Beauty"].sort("STORE_NBR")
+        assert sorted(health.columns) == ["% Sales A", "% Sales B", "STORE_NBR"]
+        assert health["% Sales A"].to_list() == [75.0, 100.0]
+        assert health["% Sales B"].to_list() == [25.0, 0.0]
+        assert sorted(beauty.columns) == ["% Sales C", "% Sales D", "STORE_NBR"]
+        assert beauty["% Sales C"].to_list() == [100.0, 25.0]
+        assert beauty["% Sales D"].to_list() == [0.0, 75.0]
+
+
+class TestExternalFeaturesData:
+    """Tests for the concurrent external ingest."""
+
+    def test_sources_are_joined_once_without_duplicate_columns(self, tmp_path) -> None:
+        """All sources are outer-joined on STORE_NBR and repeated columns are dropped."""
+        placer = tmp_path / "placer.csv"
+        template = tmp_path / "template.csv"
+        experiment = tmp_path / "experiment.csv"
+        pl.DataFrame({"STORE_NBR": [3, 1], "visits": [30, 10]}).write_csv(placer)
+        pl.DataFrame({"STORE_NBR": [1, 2], "density": [0.1, 0.2]}).write_csv(template)
+        pl.DataFrame({"STORE_NBR": [2, 4], "density": [9.0, 9.0], "drive": [5, 6]}).write_csv(
+            experiment
+        )
+        context = dg.build_asset_context(
+            resources={
+                "input_external_placerai_reader": CSVReader(path=str(placer)),
+                "input_external_urbanicity_template_reader": CSVReader(path=str(template)),
+                "input_external_urbanicity_experiment_reader": CSVReader(path=str(experiment)),
+            }
+        )
+
+        result = external_features_data(context)
+
+        assert result.columns == ["STORE_NBR", "visits", "density", "drive"]
+        assert result["STORE_NBR"].to_list() == [1, 2, 3, 4]
+        assert result["visits"].to_list() == [10, None, 30, None]
+        assert result["density"].to_list() == [0.1, 0.2, None, None]
+        assert result["drive"].to_list() == [None, 5, None, 6]
+
+
+class TestIncrementalSalesByCategory:
+    """Tests for incremental recomputation with the category store."""
+
+    @staticmethod
+    def _sales(beauty_sales: float) -> pl.DataFrame:
+        """Build normalized sales where only the Beauty total varies."""
+        return pl.DataFrame(
+            {
+                "STORE_NBR": [1, 1, 2, 1],
+                "CAT_DSC": ["Health", "Health", "Health", "Beauty"],
+                "NEED_STATE": ["A", "B", "A", "C"],
+                "TOTAL_SALES": [30.0, 10.0, 5.0, beauty_sales],
+            }
+        )
+
+    def test_only_changed_categories_are_recomputed(self, tmp_path, monkeypatch) -> None:
+        """Unchanged categories are loaded from the store instead of pivoted."""
+        store_dir = str(tmp_path / "store")
+        context = dg.build_asset_context(
+            resources={"job_params": SimpleNamespace(incremental_store_dir=store_dir)}
+        )
+        pivoted = []
+        pivot = internal._pivot_category
+
+        def tracking_pivot(ctx, cat, frame):
+            pivoted.append(cat)
+            return pivot(ctx, cat, frame)
+
+        monkeypatch.setattr(internal, "_pivot_category", tracking_pivot)
+
+        first = internal.internal_sales_by_category(context, self._sales(7.0))
+        assert sorted(pivoted) == ["Beauty", "Health"]
+        assert sorted(dirty_categories(store_dir)) == ["Beauty", "Health"]
+
+        pivoted.clear()
+        unchanged = internal.internal_sales_by_category(context, self._sales(7.0))
+        assert pivoted == []
+        assert dirty_categories(store_dir) == []
+        assert all(unchanged[cat].equals(first[cat]) for cat in first)
+
+        changed = internal.internal_sales_by_category(context, self._sales(9.0))
+        assert pivoted == ["Beauty"]
+        assert dirty_categories(store_dir) == ["Beauty"]
+        assert set(changed) == {"Health", "Beauty"}
+        assert changed["Health"].equals(first["Health"])
+
+    def test_clean_categories_are_not_aggregated(self, tmp_path, monkeypatch) -> None:
+        """Only the rows of changed categories reach the aggregation."""
+        store_dir = str(tmp_path / "store")
+        context = dg.build_asset_context(
+            resources={"job_params": SimpleNamespace(incremental_store_dir=store_dir)}
+        )
+        aggregated = []
+        aggregate = internal._aggregate_by_category
+
+        def tracking_aggregate(ctx, sales, streaming):
+            aggregated.append(sorted(sales.collect()["CAT_DSC"].unique()))
+            return aggregate(ctx, sales, streaming)
+
+        monkeypatch.setattr(internal, "_aggregate_by_category", tracking_aggregate)
+
+        internal.internal_sales_by_category(context, self._sales(7.0))
+        internal.internal_sales_by_category(context, self._sales(7.0))
+        internal.internal_sales_by_category(context, self._sales(9.0).lazy())
+
+        assert aggregated == [["Beauty", "Health"], ["Beauty"]]
+
+    def test_fingerprints_ignore_row_order(self) -> None:
+        """Fingerprints depend on the rows of a category, not on their order."""
+        sales = self._sales(7.0)
+
+        fingerprints = fingerprint_categories(sales)
+
+        assert fingerprint_categories(sales.reverse().lazy()) == fingerprints
+        changed = fingerprint_categories(self._sales(7.5))
+        assert changed["Health"] == fingerprints["Health"]
+        assert changed["Beauty"] != fingerprints["Beauty"]
+
+    def test_store_files_are_not_owner_only(self, tmp_path) -> None:
+        """Category tables and the manifest get the umask's mode."""
+        frame = pl.DataFrame({"STORE_NBR": [1], "% Sales A": [100.0]})
+        CategoryStore(str(tmp_path)).update({"Health": frame}, {"Health": "h1"})
+
+        mask = os.umask(0)
+        os.umask(mask)
+        modes = {stat.S_IMODE(file.stat().st_mode) for file in tmp_path.iterdir()}
+        assert modes == {0o666 & ~mask}
+
+    def test_removed_categories_leave_the_store(self, tmp_path) -> None:
+        """Categories missing from new sales data are dropped from the store."""
+        store = CategoryStore(str(tmp_path))
+        frame = pl.DataFrame({"STORE_NBR": [1], "% Sales A": [100.0]})
+        store.update({"Health": frame, "Beauty": frame}, {"Health": "h1", "Beauty": "b1"})
+
+        result = CategoryStore(str(tmp_path)).update({}, {"Health": "h1"})
+
+        assert list(result) == ["Health"]
+        assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+
+@pytest.mark.usefixtures("source_files")
+class TestDuckDBEngine:
+    """Tests for the DuckDB preprocessing engine."""
+
+    def test_duckdb_engine_matches_polars_engine(self, tmp_path) -> None:
+        """SQL preprocessing produces the same category tables as Polars."""
+        result = _run_internal_preprocessing(
+            preprocessing_engine="duckdb",
+            duckdb_temp_dir=str(tmp_path / "spill"),
+            duckdb_memory_limit="256MB",
+        )
+        expected = _run_internal_preprocessing(lazy_preprocessing=False)
+
+        assert set(result) == set(expected)
+        for category, frame in expected.items():
+            frame = frame.sort("STORE_NBR")
+            actual = result[category].select(frame.columns).sort("STORE_NBR")
+            assert actual.equals(frame)
@@ -9,6 +9,9 @@ import pandas as pd
 import polars as pl
 import pytest
 
+from clustering.shared.io.blob_clients import close_blob_clients
+from clustering.shared.io.snowflake_connections import close_snowflake_connections
+
 
 @pytest.fixture
 def sample_data() -> pd.DataFrame:
@@ -52,6 +55,16 @@ def sample_polars_data() -> pl.DataFrame:
     )
 
 
+@pytest.fixture(autouse=True)
+def connection_pools() -> Generator[None, None, None]:
+    """Keep pooled clients and connections, possibly mocked, from leaking between tests."""
+    close_blob_clients()
+    close_snowflake_connections()
+    yield
+    close_blob_clients()
+    close_snowflake_connections()
+
+
 @pytest.fixture
 def temp_csv_file() -> Generator[Path, None, None]:
     """Create a temporary CSV file for testing.
@@ -0,0 +1,94 @@
+"""Tests for the Arrow table container reader and writer."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from clustering.shared.io.arrow_tables import read_table, write_tables
+from clustering.shared.io.readers import ArrowTablesReader
+from clustering.shared.io.writers import ArrowTablesWriter
+
+
+@pytest.fixture
+def sales_by_category() -> dict[str, pl.DataFrame]:
+    """Create pivoted sales for a few categories with different schemas."""
+    return {
+        "Snacks": pl.DataFrame({"STORE_NBR": [1, 2, 3], "% Sales A": [10.0, 20.0, 30.0]}),
+        "Drinks/Cold": pl.DataFrame({"STORE_NBR": [1, 2], "% Sales B": [5.0, 6.0]}),
+        "Bakery": pl.DataFrame({"STORE_NBR": [4], "% Sales C": [1.5], "% Sales D": [98.5]}),
+    }
+
+
+class TestArrowTables:
+    """Tests for round trips through the table container."""
+
+    @pytest.mark.parametrize("compression", [None, "zstd"])
+    def test_round_trip(
+        self, tmp_path: Path, sales_by_category: dict[str, pl.DataFrame], compression: str | None
+    ) -> None:
+        """Test that every table comes back in order, with or without compression."""
+        path = tmp_path / "sales_by_category.tables"
+        ArrowTablesWriter(path=str(path), compression=compression).write(sales_by_category)
+
+        result = ArrowTablesReader(path=str(path)).read()
+
+        assert list(result) == list(sales_by_category)
+        for key, frame in sales_by_category.items():
+            assert result[key].equals(frame)
+
+    def test_read_selected_keys(
+        self, tmp_path: Path, sales_by_category: dict[str, pl.DataFrame]
+    ) -> None:
+        """Test that selecting a key reads only that table."""
+        path = tmp_path / "sales_by_category.tables"
+        ArrowTablesWriter(path=str(path)).write(sales_by_category)
+
+        with patch(
+            "clustering.shared.io.readers.arrow_tables_reader.read_table", wraps=read_table
+        ) as spy:
+            result = ArrowTablesReader(path=str(path), keys=["Drinks/Cold"]).read()
+
+        assert spy.call_count == 1
+        assert list(result) == ["Drinks/Cold"]
+        assert result["Drinks/Cold"].equals(sales_by_category["Drinks/Cold"])
+
+        with pytest.raises(KeyError, match="Dairy"):
+            ArrowTablesReader(path=str(path), keys=["Dairy"]).read()
+
+    def test_pushdown_applies_per_table(
+        self, tmp_path: Path, sales_by_category: dict[str, pl.DataFrame]
+    ) -> None:
+        """Test that limits and filters apply to each table."""
+        path = tmp_path / "sales_by_category.tables"
+        ArrowTablesWriter(path=str(path)).write(sales_by_category)
+
+        result = ArrowTablesReader(path=str(path), filters=[("STORE_NBR", ">", 1)], limit=1).read()
+
+        assert result["Snacks"]["STORE_NBR"].to_list() == [2]
+        assert result["Bakery"]["STORE_NBR"].to_list() == [4]
+
+    def test_container_is_not_owner_only(self, tmp_path: Path) -> None:
+        """Test that containers get the umask's mode, not the temporary file's."""
+        path = tmp_path / "sales.tables"
+        write_tables(str(path), {"Snacks": pa.table({"STORE_NBR": [1]})})
+
+        mask = os.umask(0)
+        os.umask(mask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~mask
+
+    def test_invalid_input(self, tmp_path: Path) -> None:
+        """Test that non-containers and non-dictionaries are rejected."""
+        path = tmp_path / "plain.tables"
+        path.write_bytes(b"not a container")
+        with pytest.raises(ValueError, match="Not a table container"):
+            ArrowTablesReader(path=str(path)).read()
+
+        with pytest.raises(TypeError, match="dictionary"):
+            ArrowTablesWriter(path=str(path)).write(pl.DataFrame({"a": [1]}))
+        with pytest.raises(TypeError, match="not a DataFrame"):
+            ArrowTablesWriter(path=str(path)).write({"Snacks": [1, 2]})
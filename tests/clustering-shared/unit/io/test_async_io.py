@@ -0,0 +1,210 @@
+"""Tests for concurrent reads and writes."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import polars as pl
+import pytest
+
+from clustering.shared.io import read_many, write_many
+from clustering.shared.io.readers import BlobReader, ParquetReader, Reader
+from clustering.shared.io.writers import BlobWriter, ParquetWriter
+
+
+class SlowReader(Reader):
+    """Reader that blocks like a slow source."""
+
+    delay: float
+    fail: bool = False
+
+    def _read_from_source(self) -> pl.DataFrame:
+        time.sleep(self.delay)
+        if self.fail:
+            raise OSError("source unavailable")
+        return pl.DataFrame({"delay": [self.delay]})
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create store sales."""
+    return pl.DataFrame({"STORE_NBR": [1, 2, 3], "TOTAL_SALES": [10.5, 20.0, 7.25]})
+
+
+def _async_blob_client() -> MagicMock:
+    """Create a mock async blob client usable as an async context manager."""
+    client = MagicMock()
+    client.__aenter__.return_value = client
+    client.upload_blob = AsyncMock()
+    client.download_blob = AsyncMock()
+    return client
+
+
+class TestReadMany:
+    """Tests for concurrent reads."""
+
+    def test_results_by_key(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that every reader's data and latency is returned under its key."""
+        for name in ("a", "b"):
+            sales.write_parquet(tmp_path / f"{name}.parquet")
+        readers = {
+            name: ParquetReader(path=str(tmp_path / f"{name}.parquet"), columns=["STORE_NBR"])
+            for name in ("a", "b")
+        }
+
+        results = asyncio.run(read_many(readers))
+
+        assert list(results) == ["a", "b"]
+        for result in results.values():
+            assert result.value.equals(sales.select("STORE_NBR"))
+            assert result.seconds >= 0
+
+    def test_bounded_by_slowest_source(self) -> None:
+        """Test that the reads overlap instead of running one after another."""
+        readers = {index: SlowReader(delay=0.2) for index in range(4)}
+
+        start = time.perf_counter()
+        results = asyncio.run(read_many(readers))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.6
+        assert all(result.seconds >= 0.2 for result in results.values())
+
+    def test_concurrency_limit(self) -> None:
+        """Test that no more than max_concurrency reads run at once."""
+        readers = {index: SlowReader(delay=0.1) for index in range(4)}
+
+        start = time.perf_counter()
+        asyncio.run(read_many(readers, max_concurrency=2))
+
+        assert time.perf_counter() - start >= 0.2
+
+    def test_failure_is_raised(self) -> None:
+        """Test that the first failure propagates."""
+        readers = {"ok": SlowReader(delay=0.0), "bad": SlowReader(delay=0.0, fail=True)}
+
+        with pytest.raises(OSError, match="source unavailable"):
+            asyncio.run(read_many(readers))
+
+    def test_rejects_invalid_limit(self) -> None:
+        """Test that the concurrency limit must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            asyncio.run(read_many({}, max_concurrency=0))
+
+
+class TestWriteMany:
+    """Tests for concurrent writes."""
+
+    def test_writes_every_destination(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that every frame is written to its writer."""
+        writes = {
+            name: (ParquetWriter(path=str(tmp_path / f"{name}.parquet")), sales.head(index + 1))
+            for index, name in enumerate(("first", "second"))
+        }
+
+        results = asyncio.run(write_many(writes))
+
+        assert set(results) == {"first", "second"}
+        assert all(result.value is None for result in results.values())
+        assert pl.read_parquet(tmp_path / "second.parquet").height == 2
+
+
+class TestNativeBlobClients:
+    """Tests for the async paths of the blob reader and writer."""
+
+    def test_reader_downloads_with_async_client(self, sales: pl.DataFrame) -> None:
+        """Test that whole-blob reads use the async client and apply the pushdown."""
+        client = _async_blob_client()
+        client.download_blob.return_value.readall = AsyncMock(
+            return_value=sales.write_csv().encode()
+        )
+        reader = BlobReader(
+            connection_string="conn",
+            container_name="container",
+            blob_path="sales.csv",
+            file_format="csv",
+            columns=["STORE_NBR"],
+        )
+
+        with (
+            patch(
+                "clustering.shared.io.readers.blob_reader.async_blob_clients_available",
+                return_value=True,
+            ),
+            patch(
+                "clustering.shared.io.readers.blob_reader.create_async_blob_client",
+                return_value=client,
+            ) as create,
+        ):
+            result = asyncio.run(reader.read_async())
+
+        create.assert_called_once_with("conn", "container", "sales.csv")
+        client.download_blob.assert_awaited_once_with(max_concurrency=8)
+        assert result.equals(sales.select("STORE_NBR"))
+
+    def test_reader_falls_back_to_thread(self, sales: pl.DataFrame) -> None:
+        """Test that reads run the synchronous client without aiohttp."""
+        reader = BlobReader(
+            connection_string="conn",
+            container_name="container",
+            blob_path="sales.parquet",
+            file_format="parquet",
+        )
+
+        with (
+            patch(
+                "clustering.shared.io.readers.blob_reader.async_blob_clients_available",
+                return_value=False,
+            ),
+            patch.object(BlobReader, "_read_from_source", return_value=sales) as read,
+        ):
+            result = asyncio.run(reader.read_async())
+
+        read.assert_called_once()
+        assert result.equals(sales)
+
+    def test_writer_uploads_with_async_client(self, sales: pl.DataFrame) -> None:
+        """Test that in-memory uploads use the async client."""
+        client = _async_blob_client()
+        writer = BlobWriter(
+            connection_string="conn", container_name="container", blob_name="sales.parquet"
+        )
+
+        with (
+            patch(
+                "clustering.shared.io.writers.blob_writer.async_blob_clients_available",
+                return_value=True,
+            ),
+            patch(
+                "clustering.shared.io.writers.blob_writer.create_async_blob_client",
+                return_value=client,
+            ) as create,
+        ):
+            asyncio.run(writer.write_async(sales))
+
+        create.assert_called_once_with("conn", "container", "sales.parquet")
+        uploaded = client.upload_blob.await_args.args[0]
+        assert pl.read_parquet(uploaded).equals(sales)
+        assert client.upload_blob.await_args.kwargs["overwrite"] is True
+
+    def test_writer_wraps_upload_errors(self, sales: pl.DataFrame) -> None:
+        """Test that async upload failures are reported like synchronous ones."""
+        client = _async_blob_client()
+        client.upload_blob.side_effect = ValueError("boom")
+        writer = BlobWriter(
+            connection_string="conn", container_name="container", blob_name="sales.csv"
+        )
+
+        with (
+            patch(
+                "clustering.shared.io.writers.blob_writer.async_blob_clients_available",
+                return_value=True,
+            ),
+            patch(
+                "clustering.shared.io.writers.blob_writer.create_async_blob_client",
+                return_value=client,
+            ),
+            pytest.raises(RuntimeError, match="Unexpected error when uploading blob: boom"),
+        ):
+            asyncio.run(writer.write_async(sales))
@@ -0,0 +1,120 @@
+"""Tests for streamed block uploads of the BlobWriter."""
+
+import threading
+import time
+from io import BytesIO
+from typing import Any
+
+import numpy as np
+import polars as pl
+import pytest
+from azure.core import MatchConditions
+
+from clustering.shared.io.writers import BlobWriter
+
+
+class FakeBlockBlobClient:
+    """In-memory block blob client tracking staged blocks."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        """Initialize the client, optionally failing to stage one block."""
+        self.fail_on = fail_on
+        self.staged: dict[str, bytes] = {}
+        self.committed: bytes | None = None
+        self.commit_kwargs: dict[str, Any] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def stage_block(self, block_id: str, data: bytes) -> None:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.001)
+        with self.lock:
+            self.in_flight -= 1
+        if block_id == self.fail_on:
+            raise ConnectionError("connection reset")
+        self.staged[block_id] = data
+
+    def commit_block_list(self, blocks: list, **kwargs: Any) -> None:
+        self.committed = b"".join(self.staged[block.id] for block in blocks)
+        self.commit_kwargs = kwargs
+
+    def upload_blob(self, data: BytesIO, **kwargs: Any) -> None:
+        self.committed = data.read()
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create store sales of a few megabytes."""
+    rng = np.random.default_rng(0)
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(200_000)),
+            "CAT_DSC": ["Snacks", "Drinks"] * 100_000,
+            "TOTAL_SALES": rng.random(200_000),
+        }
+    )
+
+
+def _writer(client: FakeBlockBlobClient, blob_name: str, **options: Any) -> BlobWriter:
+    """Create a BlobWriter wired to a fake client."""
+    writer = BlobWriter(
+        connection_string="test-connection",
+        container_name="container",
+        blob_name=blob_name,
+        block_size=256 * 1024,
+        chunk_rows=20_000,
+        max_concurrency=3,
+        **options,
+    )
+    writer._create_blob_client = lambda: client
+    return writer
+
+
+class TestBlockUpload:
+    """Tests for chunked serialization and parallel block staging."""
+
+    def test_parquet_round_trip(self, sales: pl.DataFrame) -> None:
+        """Test that Parquet row groups are streamed as blocks."""
+        client = FakeBlockBlobClient()
+        _writer(client, "sales.parquet").write(sales)
+
+        assert len(client.staged) > 3
+        assert all(len(block) == 256 * 1024 for block in list(client.staged.values())[:-1])
+        assert 1 < client.max_in_flight <= 3
+        assert pl.read_parquet(BytesIO(client.committed)).equals(sales)
+
+    def test_csv_round_trip(self, sales: pl.DataFrame) -> None:
+        """Test that CSV chunks form one document with a single header."""
+        client = FakeBlockBlobClient()
+        _writer(client, "sales.csv").write(sales)
+
+        assert client.committed.count(b"STORE_NBR") == 1
+        assert pl.read_csv(BytesIO(client.committed)).equals(sales)
+        assert client.commit_kwargs == {}
+
+    def test_no_overwrite_condition(self, sales: pl.DataFrame) -> None:
+        """Test that the commit requires a missing blob without overwrite."""
+        client = FakeBlockBlobClient()
+        _writer(client, "sales.csv", overwrite=False).write(sales)
+
+        assert client.commit_kwargs == {"match_condition": MatchConditions.IfMissing}
+
+    def test_small_data_uploads_at_once(self, sales: pl.DataFrame) -> None:
+        """Test that data smaller than a block skips block staging."""
+        client = FakeBlockBlobClient()
+        _writer(client, "sales.csv").write(sales.head(10))
+
+        assert not client.staged
+        assert pl.read_csv(BytesIO(client.committed)).equals(sales.head(10))
+
+    def test_failed_block_aborts_commit(self, sales: pl.DataFrame) -> None:
+        """Test that a failed block surfaces and nothing is committed."""
+        client = FakeBlockBlobClient(fail_on="00000002")
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            _writer(client, "sales.parquet").write(sales)
+
+        assert client.committed is None
@@ -0,0 +1,86 @@
+"""Tests for the pooled blob client registry."""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from clustering.shared.io import blob_clients
+from clustering.shared.io.blob_clients import (
+    configure_blob_clients,
+    get_blob_service_client,
+)
+from clustering.shared.io.readers import BlobReader
+from clustering.shared.io.writers import BlobWriter
+
+CONNECTION_STRING = (
+    "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;"
+    "AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;"
+    "BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+)
+
+
+@pytest.fixture(autouse=True)
+def default_settings() -> Iterator[None]:
+    """Restore the default connection settings after every test."""
+    yield
+    configure_blob_clients(**blob_clients.BlobClientSettings().model_dump())
+
+
+class TestRegistry:
+    """Tests for sharing clients per connection string."""
+
+    def test_reuses_client(self) -> None:
+        """Test that one client is created per connection string, across threads."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(
+                pool.map(lambda _: get_blob_service_client(CONNECTION_STRING), range(32))
+            )
+
+        assert all(client is clients[0] for client in clients)
+        assert get_blob_service_client(CONNECTION_STRING.rstrip(";")) is not clients[0]
+
+    def test_readers_and_writers_share_client(self) -> None:
+        """Test that blob readers and writers resolve the same pooled client."""
+        reader = BlobReader(
+            connection_string=CONNECTION_STRING,
+            container_name="container",
+            blob_path="sales.parquet",
+            file_format="parquet",
+        )
+        writer = BlobWriter(
+            connection_string=CONNECTION_STRING,
+            container_name="container",
+            blob_name="sales.parquet",
+        )
+
+        shared = reader._get_blob_service_client()
+
+        assert shared is get_blob_service_client(CONNECTION_STRING)
+        assert (
+            writer._create_blob_client().url
+            == shared.get_container_client("container").get_blob_client("sales.parquet").url
+        )
+
+    def test_connection_limits(self) -> None:
+        """Test that the transport pools the configured number of connections."""
+        configure_blob_clients(max_connections=5, read_timeout=10)
+        client = get_blob_service_client(CONNECTION_STRING)
+        session = blob_clients._clients[CONNECTION_STRING][1]
+
+        assert session.get_adapter("http://127.0.0.1")._pool_maxsize == 5
+        assert client._config.transport.connection_config.read_timeout == 10
+
+    def test_reconfigure_replaces_clients(self) -> None:
+        """Test that changed settings replace existing clients and same ones keep them."""
+        first = get_blob_service_client(CONNECTION_STRING)
+        configure_blob_clients(max_connections=32)
+        assert get_blob_service_client(CONNECTION_STRING) is first
+
+        configure_blob_clients(max_connections=4)
+        assert get_blob_service_client(CONNECTION_STRING) is not first
+
+    def test_invalid_settings(self) -> None:
+        """Test that invalid connection limits are rejected."""
+        with pytest.raises(ValueError, match="max_connections"):
+            configure_blob_clients(max_connections=0)
@@ -0,0 +1,184 @@
+"""Tests for ranged Parquet reads and the local cache of the BlobReader."""
+
+import datetime as dt
+import os
+import uuid
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import polars as pl
+import pytest
+
+from clustering.shared.io.readers import BlobReader
+
+# Connection string of a running Azurite emulator, e.g. from docker-compose
+AZURITE_CONNECTION_STRING = os.environ.get("AZURITE_CONNECTION_STRING")
+
+
+class FakeBlobClient:
+    """In-memory blob client recording every download."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the client with the blob content."""
+        self.data = data
+        self.etag = '"0x1"'
+        self.last_modified = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+        self.url = "https://account.blob.core.windows.net/container/blob"
+        self.downloads: list[dict[str, Any]] = []
+
+    def get_blob_properties(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            size=len(self.data), etag=self.etag, last_modified=self.last_modified
+        )
+
+    def download_blob(self, offset: int | None = None, length: int | None = None, **kwargs: Any):
+        self.downloads.append({"offset": offset, "length": length, **kwargs})
+        start = offset or 0
+        end = len(self.data) if length is None else start + length
+        chunk = self.data[start:end]
+        return SimpleNamespace(readall=lambda: chunk, readinto=lambda stream: stream.write(chunk))
+
+    def replace(self, data: bytes) -> None:
+        self.data = data
+        self.etag = f'"0x{len(self.downloads) + 2}"'
+        self.last_modified += dt.timedelta(minutes=1)
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create wide store sales with many row groups."""
+    rng = np.random.default_rng(0)
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(100_000)),
+            "CAT_DSC": ["Snacks", "Drinks"] * 50_000,
+            **{f"FEATURE_{i}": rng.random(100_000) for i in range(10)},
+        }
+    )
+
+
+def _reader(client: FakeBlobClient, **options: Any) -> BlobReader:
+    """Create a BlobReader wired to a fake client."""
+    reader = BlobReader(
+        connection_string="test-connection",
+        container_name="container",
+        blob_path="blob",
+        **options,
+    )
+    service = MagicMock()
+    service.get_container_client.return_value.get_blob_client.return_value = client
+    reader._get_blob_service_client = lambda: service
+    return reader
+
+
+class TestRangedParquetReads:
+    """Tests for column- and row-group-selective Parquet reads."""
+
+    @pytest.fixture
+    def client(self, sales: pl.DataFrame) -> FakeBlobClient:
+        buffer = BytesIO()
+        sales.write_parquet(buffer, row_group_size=10_000, statistics=True)
+        return FakeBlobClient(buffer.getvalue())
+
+    def test_fetches_only_needed_bytes(self, client: FakeBlobClient) -> None:
+        """Test that a filtered projection downloads a fraction of the blob."""
+        reader = _reader(
+            client,
+            file_format="parquet",
+            columns=["STORE_NBR", "FEATURE_0"],
+            filters=[("STORE_NBR", ">=", 99_990)],
+        )
+        result = reader.read()
+
+        assert result.columns == ["STORE_NBR", "FEATURE_0"]
+        assert result["STORE_NBR"].to_list() == list(range(99_990, 100_000))
+        assert all(download["length"] is not None for download in client.downloads)
+        fetched = sum(download["length"] for download in client.downloads)
+        assert fetched < len(client.data) / 10
+
+    def test_limit_stops_after_first_row_groups(self, client: FakeBlobClient) -> None:
+        """Test that an unfiltered limit reads only the leading row groups."""
+        result = _reader(client, file_format="parquet", limit=10).read()
+
+        assert result.height == 10
+        assert result.width == 12
+        fetched = sum(download["length"] for download in client.downloads)
+        assert fetched < len(client.data) / 5
+
+    def test_full_read_downloads_whole_blob(
+        self, client: FakeBlobClient, sales: pl.DataFrame
+    ) -> None:
+        """Test that reads without pushdown options use a single download."""
+        result = _reader(client, file_format="parquet").read()
+
+        assert result.equals(sales)
+        assert len(client.downloads) == 1
+        assert client.downloads[0]["offset"] is None
+
+
+class TestBlobCache:
+    """Tests for the ETag-validated download cache."""
+
+    def test_reuses_unchanged_blob(self, tmp_path: Path) -> None:
+        """Test that an unchanged blob is downloaded once and a changed one again."""
+        client = FakeBlobClient(b"id,value\n1,10.5\n2,20.5\n")
+        options = {"file_format": "csv", "use_cache": True, "cache_dir": str(tmp_path)}
+
+        first = _reader(client, **options).read()
+        second = _reader(client, **options).read()
+
+        assert first.equals(second)
+        assert len(client.downloads) == 1
+        assert client.downloads[0]["etag"] == '"0x1"'
+
+        client.replace(b"id,value\n3,30.5\n")
+        third = _reader(client, **options).read()
+
+        assert third["id"].to_list() == [3]
+        assert len(client.downloads) == 2
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.skipif(
+    AZURITE_CONNECTION_STRING is None,
+    reason="set AZURITE_CONNECTION_STRING to run against the Azurite emulator",
+)
+class TestBlobReaderAzurite:
+    """Tests against the Azurite storage emulator."""
+
+    @pytest.fixture
+    def container(self):
+        from azure.storage.blob import BlobServiceClient
+
+        service = BlobServiceClient.from_connection_string(AZURITE_CONNECTION_STRING)
+        container = service.create_container(f"test-{uuid.uuid4().hex[:12]}")
+        yield container
+        container.delete_container()
+
+    def test_ranged_parquet_and_cache(
+        self, container: Any, sales: pl.DataFrame, tmp_path: Path
+    ) -> None:
+        """Test ranged reads and cache revalidation with the real SDK."""
+        buffer = BytesIO()
+        sales.write_parquet(buffer, row_group_size=10_000)
+        container.upload_blob("sales.parquet", buffer.getvalue())
+        options = {
+            "connection_string": AZURITE_CONNECTION_STRING,
+            "container_name": container.container_name,
+            "blob_path": "sales.parquet",
+            "file_format": "parquet",
+        }
+
+        selected = BlobReader(**options, columns=["STORE_NBR"], filters=[("STORE_NBR", "<", 5)])
+        assert selected.read()["STORE_NBR"].to_list() == [0, 1, 2, 3, 4]
+
+        cached = BlobReader(**options, use_cache=True, cache_dir=str(tmp_path))
+        assert cached.read().equals(sales)
+        copies = list(tmp_path.glob("*.blob"))
+        modified = copies[0].stat().st_mtime_ns
+        assert cached.read().equals(sales)
+        assert copies[0].stat().st_mtime_ns == modified
@@ -2,11 +2,12 @@
 
 import pickle
 from io import BytesIO
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pandas as pd
 import polars as pl
 import pytest
+from azure.core.exceptions import ServiceRequestError
 from azure.storage.blob import BlobServiceClient
 
 from clustering.shared.io.readers.blob_reader import BlobReader
@@ -83,7 +84,7 @@ class TestBlobReader:
             result = reader._get_blob_service_client()
             
             # Verify client was created with connection string
-            mock_create.assert_called_once_with("test-connection")
+            mock_create.assert_called_once_with("test-connection", transport=ANY)
             assert result == mock_client
     
     def test_read_from_source_csv(self, mock_blob_service):
@@ -270,7 +271,7 @@ class TestBlobReader:
     def test_blob_download_error(self, mock_blob_service):
         """Test error handling when downloading blob fails."""
         # Make the download blob method raise an exception
-        mock_blob_service["blob"].download_blob.side_effect = Exception("Connection error")
+        mock_blob_service["blob"].download_blob.side_effect = ServiceRequestError("Connection error")
         
         reader = BlobReader(
             connection_string="test-connection",
@@ -288,6 +289,21 @@ class TestBlobReader:
         
         assert "Failed to download blob" in str(excinfo.value)
     
+    def test_programming_errors_are_not_wrapped(self, mock_blob_service):
+        """Test that errors other than storage and Arrow errors propagate unchanged."""
+        mock_blob_service["blob"].download_blob.side_effect = TypeError("bad argument")
+
+        reader = BlobReader(
+            connection_string="test-connection",
+            container_name="test-container",
+            blob_path="test.csv",
+            file_format="csv"
+        )
+        reader._get_blob_service_client = lambda: mock_blob_service["service"]
+
+        with pytest.raises(TypeError, match="bad argument"):
+            reader._read_from_source()
+
     def test_max_concurrency_parameter(self, mock_blob_service):
         """Test that max_concurrency parameter is passed correctly."""
         reader = BlobReader(
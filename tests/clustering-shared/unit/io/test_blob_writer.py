@@ -2,7 +2,7 @@
 
 import pickle
 from io import BytesIO
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import ANY, MagicMock, patch, call
 
 import pandas as pd
 import polars as pl
@@ -110,7 +110,7 @@ class TestBlobWriter:
             result = writer._create_blob_client()
             
             # Verify proper method calls
-            mock_create.assert_called_once_with("test-connection")
+            mock_create.assert_called_once_with("test-connection", transport=ANY)
             mock_service.get_container_client.assert_called_once_with("test-container")
             mock_container.get_blob_client.assert_called_once_with("test.csv")
             assert result == mock_blob
@@ -379,7 +379,7 @@ class TestBlobWriter:
             result = writer._create_blob_client()
             
             # Verify proper method calls
-            mock_create.assert_called_once_with("env-connection-string")
+            mock_create.assert_called_once_with("env-connection-string", transport=ANY)
             assert result == mock_blob_service["blob"]
             
     @patch('os.getenv')
@@ -423,7 +423,7 @@ class TestBlobWriter:
             result = writer._create_blob_client()
             
             # Verify proper method calls
-            mock_create.assert_called_once_with("env-connection-string")
+            mock_create.assert_called_once_with("env-connection-string", transport=ANY)
             mock_blob_service["service"].get_container_client.assert_called_once_with("env-container")
             assert result == mock_blob_service["blob"]
             
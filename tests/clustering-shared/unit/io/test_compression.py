@@ -0,0 +1,191 @@
+"""Tests for compressed writer output and its transparent decompression."""
+
+import gzip
+import io
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+
+from clustering.shared.io.compression import (
+    CODECS,
+    compress_bytes,
+    decompress_bytes,
+    file_codec,
+    open_decompressed,
+)
+from clustering.shared.io.readers import BlobReader, CSVReader, JSONReader, PickleReader
+from clustering.shared.io.writers import (
+    BlobWriter,
+    CSVWriter,
+    ExcelWriter,
+    JSONWriter,
+    ParquetWriter,
+    PickleWriter,
+)
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create store sales."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(1, 201)),
+            "category": ["Snacks", "Drinks"] * 100,
+            "TOTAL_SALES": [float(index) * 1.5 for index in range(200)],
+        }
+    )
+
+
+class TestCodecs:
+    """Tests for block compression and decompression."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_multi_block_round_trip(self, codec: str) -> None:
+        """Test that concatenated blocks decompress to the original data."""
+        data = b"".join(f"line {index}\n".encode() for index in range(5000))
+
+        compressed = compress_bytes(data, codec, block_size=1000, max_workers=4)
+
+        assert len(compressed) < len(data)
+        assert decompress_bytes(compressed) == data
+        with open_decompressed(io.BytesIO(compressed)) as file:
+            assert file.readline() == b"line 0\n"
+
+    def test_uncompressed_data_is_unchanged(self) -> None:
+        """Test that plain data passes through decompression."""
+        assert decompress_bytes(b"STORE_NBR\n1\n") == b"STORE_NBR\n1\n"
+
+    def test_unsupported_codec(self) -> None:
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported codec: brotli"):
+            CSVWriter(path="sales.csv", codec="brotli")
+
+    @pytest.mark.parametrize(("codec", "level"), [("gzip", 10), ("zstd", 100), ("gzip", -1)])
+    def test_invalid_level(self, codec: str, level: int) -> None:
+        """Test that levels outside the codec's range are rejected."""
+        with pytest.raises(ValueError, match=f"Compression level for {codec} must be between"):
+            PickleWriter(path="sales.pkl", codec=codec, codec_level=level)
+
+    @pytest.mark.parametrize("writer_class", [ParquetWriter, ExcelWriter])
+    def test_writer_without_codec_support(self, writer_class: type) -> None:
+        """Test that internally compressed formats reject a codec."""
+        with pytest.raises(ValueError, match="does not support a codec"):
+            writer_class(path="sales.out", codec="zstd")
+
+
+class TestFileRoundTrip:
+    """Tests for compressed files read back by the matching readers."""
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_pickle(self, tmp_path: Path, sales: pl.DataFrame, codec: str) -> None:
+        """Test that compressed pickles are unpickled transparently."""
+        path = tmp_path / "sales.pkl"
+        PickleWriter(path=str(path), codec=codec, codec_block_size=512).write(sales)
+
+        assert file_codec(path) == codec
+        assert PickleReader(path=str(path)).read().equals(sales)
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_csv(self, tmp_path: Path, sales: pl.DataFrame, codec: str) -> None:
+        """Test that compressed CSV files are read, with pushdown and in batches."""
+        path = tmp_path / "sales.csv"
+        CSVWriter(path=str(path), codec=codec, codec_level=1).write(sales)
+
+        assert file_codec(path) == codec
+        assert CSVReader(path=str(path)).read().equals(sales)
+        limited = CSVReader(path=str(path), columns=["STORE_NBR"], limit=3).read()
+        assert limited.equals(sales.select("STORE_NBR").head(3))
+        batches = list(CSVReader(path=str(path)).read_batches(batch_size=64))
+        assert pl.concat(batches).equals(sales)
+
+    @pytest.mark.parametrize("lines", [True, False])
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_json(self, tmp_path: Path, sales: pl.DataFrame, codec: str, lines: bool) -> None:
+        """Test that compressed JSON and JSON lines files are read."""
+        path = tmp_path / "sales.json"
+        JSONWriter(path=str(path), lines=lines, codec=codec).write(sales)
+
+        assert file_codec(path) == codec
+        assert JSONReader(path=str(path), lines=lines).read().equals(sales)
+
+    def test_json_lines_batches(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that compressed JSON lines are read incrementally."""
+        path = tmp_path / "sales.jsonl"
+        JSONWriter(path=str(path), codec="zstd", codec_block_size=256).write(sales)
+
+        batches = list(JSONReader(path=str(path)).read_batches(batch_size=50))
+
+        assert [batch.height for batch in batches] == [50, 50, 50, 50]
+        assert pl.concat(batches).equals(sales)
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_identical_write_is_skipped(
+        self, tmp_path: Path, sales: pl.DataFrame, codec: str
+    ) -> None:
+        """Test that compressed output is deterministic, so unchanged writes are skipped."""
+        path = tmp_path / "sales.csv"
+        CSVWriter(path=str(path), codec=codec).write(sales)
+        before = path.stat().st_ino
+
+        # A later clock must not leak into the output, as gzip header timestamps would
+        with patch.object(gzip, "time", MagicMock(time=lambda: time.time() + 3600)):
+            CSVWriter(path=str(path), codec=codec).write(sales)
+
+        assert path.stat().st_ino == before
+
+    def test_no_raw_output_left(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that only the compressed file and its manifest remain."""
+        path = tmp_path / "sales.pkl"
+        PickleWriter(path=str(path), codec="lz4").write(sales)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "sales.pkl",
+            "sales.pkl.manifest.json",
+        ]
+
+
+class TestBlobCompression:
+    """Tests for compressed blobs."""
+
+    def test_writer_compresses_serialized_data(self, sales: pl.DataFrame) -> None:
+        """Test that in-memory uploads are compressed and the format is inferred."""
+        writer = BlobWriter(
+            connection_string="conn",
+            container_name="container",
+            blob_name="sales.csv.zst",
+            codec="zstd",
+        )
+        writer._validate_destination()
+
+        content = writer._serialize(sales).getvalue()
+
+        assert writer.file_format == "csv"
+        assert pl.read_csv(decompress_bytes(content)).equals(sales)
+
+    def test_writer_rejects_parquet_codec(self) -> None:
+        """Test that Parquet blobs do not take a codec."""
+        writer = BlobWriter(
+            connection_string="conn",
+            container_name="container",
+            blob_name="sales.parquet",
+            codec="gzip",
+        )
+
+        with pytest.raises(ValueError, match="compressed internally"):
+            writer._validate_destination()
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_reader_decompresses(self, sales: pl.DataFrame, codec: str) -> None:
+        """Test that downloaded compressed blobs are parsed."""
+        reader = BlobReader(
+            connection_string="conn",
+            container_name="container",
+            blob_path="sales.csv.gz",
+            file_format="csv",
+        )
+        content = compress_bytes(sales.write_csv().encode(), codec)
+
+        assert reader._parse(io.BytesIO(content)).equals(sales)
@@ -0,0 +1,115 @@
+"""Tests for the columnar ingest cache."""
+
+import os
+import stat
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from clustering.shared.io import IngestCache
+from clustering.shared.io.readers import CSVReader
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    """Write a small CSV source."""
+    path = tmp_path / "sales.csv"
+    path.write_text("STORE_NBR,SALES,REGION\n1,10.5,east\n2,20.0,west\n3,30.0,east\n")
+    return path
+
+
+class TestIngestCache:
+    """Tests for IngestCache."""
+
+    def test_first_scan_converts_and_later_scans_reuse(
+        self, tmp_path: Path, csv_path: Path
+    ) -> None:
+        """The source is parsed once and then served from Parquet."""
+        cache = IngestCache(cache_dir=str(tmp_path / "cache"))
+        calls = []
+
+        def load() -> pl.DataFrame:
+            calls.append(1)
+            return pl.read_csv(csv_path)
+
+        first = cache.scan(str(csv_path), load).collect()
+        second = cache.scan(str(csv_path), load).filter(pl.col("REGION") == "east").collect()
+
+        assert len(calls) == 1
+        assert first.height == 3
+        assert second["STORE_NBR"].to_list() == [1, 3]
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+    def test_entries_are_not_owner_only(self, tmp_path: Path, csv_path: Path) -> None:
+        """Cached Parquet files and manifests get the umask's mode."""
+        cache_dir = tmp_path / "cache"
+        IngestCache(cache_dir=str(cache_dir)).scan(str(csv_path), lambda: pl.read_csv(csv_path))
+
+        mask = os.umask(0)
+        os.umask(mask)
+        modes = {stat.S_IMODE(file.stat().st_mode) for file in cache_dir.iterdir()}
+        assert modes == {0o666 & ~mask}
+
+    def test_changed_source_is_reconverted(self, tmp_path: Path, csv_path: Path) -> None:
+        """Editing the source invalidates the entry."""
+        cache = IngestCache(cache_dir=str(tmp_path / "cache"))
+        cache.scan(str(csv_path), lambda: pl.read_csv(csv_path)).collect()
+
+        csv_path.write_text("STORE_NBR,SALES,REGION\n4,40.0,north\n")
+        result = cache.scan(str(csv_path), lambda: pl.read_csv(csv_path)).collect()
+
+        assert result["STORE_NBR"].to_list() == [4]
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+    def test_touched_source_with_same_content_is_reused(
+        self, tmp_path: Path, csv_path: Path
+    ) -> None:
+        """A new modification time alone does not force a re-parse."""
+        cache = IngestCache(cache_dir=str(tmp_path / "cache"))
+        cache.scan(str(csv_path), lambda: pl.read_csv(csv_path)).collect()
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        def fail() -> pl.DataFrame:
+            raise AssertionError("source should not be parsed again")
+
+        assert cache.scan(str(csv_path), fail).collect().height == 3
+
+    def test_evict_stale_removes_entries_of_deleted_sources(
+        self, tmp_path: Path, csv_path: Path
+    ) -> None:
+        """Entries whose source no longer exists are evicted."""
+        cache = IngestCache(cache_dir=str(tmp_path / "cache"))
+        cache.scan(str(csv_path), lambda: pl.read_csv(csv_path)).collect()
+        csv_path.unlink()
+
+        assert cache.evict_stale() == 1
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_parse_options_are_part_of_the_key(self, tmp_path: Path, csv_path: Path) -> None:
+        """Different parse options of the same file get separate entries."""
+        cache = IngestCache(cache_dir=str(tmp_path / "cache"))
+        cache.scan(str(csv_path), lambda: pl.read_csv(csv_path), {"delimiter": ","}).collect()
+        cache.scan(str(csv_path), lambda: pl.read_csv(csv_path), {"delimiter": ";"}).collect()
+
+        assert len(list((tmp_path / "cache").glob("*.parquet"))) == 2
+
+
+class TestCSVReaderIngestCache:
+    """Tests for CSVReader reading through the ingest cache."""
+
+    def test_cached_read_matches_direct_read(self, tmp_path: Path, csv_path: Path) -> None:
+        """Cached reads return the same data and honour projection and limit."""
+        cache_dir = str(tmp_path / "cache")
+        direct = CSVReader(path=str(csv_path), columns=["SALES", "STORE_NBR"], limit=2).read()
+        cached = CSVReader(
+            path=str(csv_path),
+            columns=["SALES", "STORE_NBR"],
+            limit=2,
+            use_cache=True,
+            cache_dir=cache_dir,
+        ).read()
+
+        assert cached.equals(direct)
+        assert len(list(Path(cache_dir).glob("*.parquet"))) == 1
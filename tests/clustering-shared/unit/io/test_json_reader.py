@@ -0,0 +1,79 @@
+"""Tests for native JSON and JSON lines reading."""
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from clustering.shared.io.readers import JSONReader
+
+
+@pytest.fixture
+def events() -> list[dict]:
+    """Create events whose last record adds a field."""
+    records = [{"STORE_NBR": i, "event": "visit", "value": float(i)} for i in range(300)]
+    records[-1]["channel"] = "app"
+    return records
+
+
+class TestJSONLines:
+    """Tests for the NDJSON scan."""
+
+    def test_pushdown(self, tmp_path: Path, events: list[dict]) -> None:
+        """Test that filters, projection and limit apply to the scan."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("\n".join(json.dumps(record) for record in events) + "\n\n")
+
+        result = JSONReader(
+            path=str(path),
+            columns=["STORE_NBR"],
+            filters=[("value", ">=", 100.0)],
+            limit=3,
+        ).read()
+
+        assert result.columns == ["STORE_NBR"]
+        assert result["STORE_NBR"].to_list() == [100, 101, 102]
+
+    def test_lazy(self, tmp_path: Path, events: list[dict]) -> None:
+        """Test that the lazy mode returns the scan."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("\n".join(json.dumps(record) for record in events))
+
+        result = JSONReader(path=str(path), lazy=True).read()
+
+        assert isinstance(result, pl.LazyFrame)
+        assert result.select(pl.len()).collect().item() == 300
+
+    def test_schema_inference_length(self, tmp_path: Path, events: list[dict]) -> None:
+        """Test that a full inference picks up fields that appear late."""
+        path = tmp_path / "events.jsonl"
+        path.write_text("\n".join(json.dumps(record) for record in events))
+
+        assert "channel" not in JSONReader(path=str(path)).read().columns
+        result = JSONReader(path=str(path), infer_schema_length=None).read()
+        assert result["channel"].drop_nulls().to_list() == ["app"]
+
+
+class TestJSONArray:
+    """Tests for regular JSON documents."""
+
+    def test_array_of_objects(self, tmp_path: Path, events: list[dict]) -> None:
+        """Test that an array of objects is parsed natively with the pushdown."""
+        path = tmp_path / "events.json"
+        path.write_text(json.dumps(events[:10]))
+
+        result = JSONReader(path=str(path), lines=False, filters=[("STORE_NBR", "<", 2)]).read()
+
+        assert result["STORE_NBR"].to_list() == [0, 1]
+        assert result["event"].to_list() == ["visit", "visit"]
+
+    def test_object_of_columns(self, tmp_path: Path) -> None:
+        """Test that an object mapping columns to values is read column-wise."""
+        path = tmp_path / "columns.json"
+        path.write_text(json.dumps({"STORE_NBR": [1, 2], "TOTAL_SALES": [3.5, 4.0]}))
+
+        result = JSONReader(path=str(path), lines=False).read()
+
+        assert result.shape == (2, 2)
+        assert result["STORE_NBR"].to_list() == [1, 2]
@@ -0,0 +1,154 @@
+"""Tests for checksummed, skip-if-unchanged file writes."""
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from clustering.shared.io.manifest import manifest_path, read_manifest
+from clustering.shared.io.writers import CSVWriter, ParquetWriter, PickleWriter
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create sales by category."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": [1, 2, 3, 4],
+            "category": ["Snacks", "Snacks", "Drinks", "Drinks"],
+            "TOTAL_SALES": [10.5, 20.0, 7.25, 3.0],
+        }
+    )
+
+
+def _umask() -> int:
+    """Read the process umask."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _inode(path: Path) -> int:
+    """Identify a file; a replaced file gets a new inode."""
+    return path.stat().st_ino
+
+
+class TestSkipUnchanged:
+    """Tests for skipping writes of unchanged content."""
+
+    @pytest.mark.parametrize("writer_class", [CSVWriter, ParquetWriter, PickleWriter])
+    def test_identical_write_is_skipped(
+        self, tmp_path: Path, sales: pl.DataFrame, writer_class: type
+    ) -> None:
+        """Test that rewriting the same data leaves the file untouched."""
+        path = tmp_path / "sales.out"
+        writer_class(path=str(path)).write(sales)
+        before = _inode(path)
+        manifest = read_manifest(path)
+
+        writer_class(path=str(path)).write(sales)
+
+        assert _inode(path) == before
+        assert read_manifest(path) == manifest
+        assert manifest["checksum"] == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_changed_write_replaces_file(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that new content is written and recorded."""
+        path = tmp_path / "sales.csv"
+        CSVWriter(path=str(path)).write(sales)
+        checksum = read_manifest(path)["checksum"]
+
+        CSVWriter(path=str(path)).write(sales.head(2))
+
+        assert pl.read_csv(path).height == 2
+        assert read_manifest(path)["checksum"] != checksum
+
+    def test_disabled(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that every write replaces the file without skip_unchanged."""
+        path = tmp_path / "sales.csv"
+        CSVWriter(path=str(path)).write(sales)
+        before = _inode(path)
+
+        CSVWriter(path=str(path), skip_unchanged=False).write(sales)
+
+        assert _inode(path) != before
+
+    def test_file_changed_elsewhere_is_rewritten(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that a file edited outside the writer is not trusted."""
+        path = tmp_path / "sales.csv"
+        CSVWriter(path=str(path)).write(sales)
+        expected = path.read_bytes()
+        path.write_bytes(expected.replace(b"Snacks", b"snacks"))
+
+        CSVWriter(path=str(path)).write(sales)
+
+        assert path.read_bytes() == expected
+
+    @pytest.mark.parametrize("writer_class", [CSVWriter, ParquetWriter, PickleWriter])
+    def test_outputs_are_not_owner_only(
+        self, tmp_path: Path, sales: pl.DataFrame, writer_class: type
+    ) -> None:
+        """Test that outputs and manifests get the umask's mode, not the temp file's."""
+        path = tmp_path / "sales.out"
+        writer_class(path=str(path)).write(sales)
+
+        expected = 0o666 & ~_umask()
+        assert stat.S_IMODE(path.stat().st_mode) == expected
+        assert stat.S_IMODE(manifest_path(path).stat().st_mode) == expected
+
+    def test_no_temporary_files_left(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that only the file and its manifest remain after writes and skips."""
+        path = tmp_path / "sales.pkl"
+        for _ in range(2):
+            PickleWriter(path=str(path)).write(sales)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "sales.pkl",
+            "sales.pkl.manifest.json",
+        ]
+
+
+class TestPartitionedManifest:
+    """Tests for the manifest of partitioned Parquet datasets."""
+
+    def test_only_changed_partitions_are_rewritten(
+        self, tmp_path: Path, sales: pl.DataFrame
+    ) -> None:
+        """Test that unchanged partition files are skipped and all are listed."""
+        root = tmp_path / "sales"
+        writer = ParquetWriter(path=str(root), partition_by=["category"])
+        writer.write(sales)
+        snacks = root / "category=Snacks" / "part-0.parquet"
+        drinks = root / "category=Drinks" / "part-0.parquet"
+        snacks_inode, drinks_inode = _inode(snacks), _inode(drinks)
+
+        changed = sales.with_columns(
+            pl.when(pl.col("category") == "Drinks")
+            .then(pl.col("TOTAL_SALES") * 2)
+            .otherwise(pl.col("TOTAL_SALES"))
+        )
+        writer.write(changed)
+
+        assert _inode(snacks) == snacks_inode
+        assert _inode(drinks) != drinks_inode
+        files = read_manifest(root)["files"]
+        assert set(files) == {"category=Snacks/part-0.parquet", "category=Drinks/part-0.parquet"}
+        assert files["category=Drinks/part-0.parquet"]["checksum"] == (
+            hashlib.sha256(drinks.read_bytes()).hexdigest()
+        )
+
+    def test_manifest_is_outside_dataset(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that the dataset still reads as a directory of Parquet files."""
+        root = tmp_path / "sales"
+        ParquetWriter(path=str(root), partition_by=["category"]).write(sales)
+
+        assert manifest_path(root) == tmp_path / "sales.manifest.json"
+        assert manifest_path(root).exists()
+        assert pl.read_parquet(root, hive_partitioning=True).height == 4
+
+    def test_missing_manifest(self, tmp_path: Path) -> None:
+        """Test that a file without a manifest has none."""
+        assert read_manifest(tmp_path / "missing.parquet") is None
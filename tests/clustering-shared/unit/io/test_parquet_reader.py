@@ -0,0 +1,68 @@
+"""Tests for reading Parquet files and partitioned datasets."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from clustering.shared.io.readers import ParquetReader
+
+
+@pytest.fixture
+def sales_dataset(tmp_path: Path) -> Path:
+    """Create a dataset partitioned by category."""
+    data = pl.DataFrame(
+        {
+            "STORE_NBR": list(range(1, 601)),
+            "CAT_DSC": ["Drinks", "Snacks", "Bakery"] * 200,
+            "TOTAL_SALES": [float(i) for i in range(600)],
+        }
+    )
+    root = tmp_path / "sales"
+    for (category,), frame in data.partition_by("CAT_DSC", as_dict=True).items():
+        partition = root / f"CAT_DSC={category}"
+        partition.mkdir(parents=True)
+        frame.drop("CAT_DSC").write_parquet(partition / "0.parquet", row_group_size=50)
+    return root
+
+
+class TestParquetReader:
+    """Tests for the ParquetReader on datasets."""
+
+    def test_directory_exposes_partition_columns(self, sales_dataset: Path) -> None:
+        """Test that a hive-partitioned directory reads as one table."""
+        result = ParquetReader(path=str(sales_dataset)).read()
+
+        assert result.height == 600
+        assert set(result["CAT_DSC"].unique()) == {"Drinks", "Snacks", "Bakery"}
+
+    def test_partition_filter_skips_other_partitions(self, sales_dataset: Path) -> None:
+        """Test that a category filter never opens the other partitions."""
+        (sales_dataset / "CAT_DSC=Snacks" / "0.parquet").write_bytes(b"not parquet")
+
+        result = ParquetReader(
+            path=str(sales_dataset), filters=[("CAT_DSC", "==", "Drinks")]
+        ).read()
+
+        assert result.height == 200
+        assert result["CAT_DSC"].unique().to_list() == ["Drinks"]
+
+    def test_glob(self, sales_dataset: Path) -> None:
+        """Test reading the files matched by a glob pattern."""
+        reader = ParquetReader(path=str(sales_dataset / "CAT_DSC=*" / "*.parquet"))
+        assert reader.read().height == 600
+
+        with pytest.raises(FileNotFoundError):
+            ParquetReader(path=str(sales_dataset / "missing=*" / "*.parquet")).read()
+
+    def test_lazy(self, sales_dataset: Path) -> None:
+        """Test that the lazy mode returns a LazyFrame with the pushdown applied."""
+        result = ParquetReader(
+            path=str(sales_dataset),
+            lazy=True,
+            columns=["STORE_NBR"],
+            filters=[("TOTAL_SALES", "<", 10.0)],
+        ).read()
+
+        assert isinstance(result, pl.LazyFrame)
+        assert sorted(result.collect()["STORE_NBR"].to_list()) == list(range(1, 11))
@@ -0,0 +1,116 @@
+"""Tests for writing tuned and partitioned Parquet output."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from clustering.shared.io.manifest import manifest_path
+from clustering.shared.io.readers import ParquetReader
+from clustering.shared.io.writers import ParquetWriter
+
+
+@pytest.fixture
+def assignments() -> pl.DataFrame:
+    """Create cluster assignments for several categories."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(1, 301)),
+            "category": ["Snacks & Chips", "Drinks/Cold", None] * 100,
+            "cluster": [i % 5 for i in range(300)],
+        }
+    )
+
+
+class TestParquetWriterOptions:
+    """Tests for the file-level Parquet options."""
+
+    def test_tuning_options(self, tmp_path: Path, assignments: pl.DataFrame) -> None:
+        """Test that codec, level, row groups and dictionary encoding are applied."""
+        path = tmp_path / "assignments.parquet"
+        ParquetWriter(
+            path=str(path),
+            compression="zstd",
+            compression_level=9,
+            row_group_size=100,
+            use_dictionary=False,
+        ).write(assignments)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == 3
+        column = metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+        assert "PLAIN_DICTIONARY" not in column.encodings
+        assert "RLE_DICTIONARY" not in column.encodings
+        assert column.statistics is not None
+        assert pl.read_parquet(path).equals(assignments)
+
+    def test_failed_write_keeps_previous_file(
+        self, tmp_path: Path, assignments: pl.DataFrame
+    ) -> None:
+        """Test that a failed write leaves neither a partial file nor a temp file."""
+        path = tmp_path / "assignments.parquet"
+        ParquetWriter(path=str(path)).write(assignments)
+
+        with (
+            patch("pyarrow.parquet.write_table", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            ParquetWriter(path=str(path)).write(assignments.head(1))
+
+        assert pl.read_parquet(path).height == 300
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "assignments.parquet",
+            "assignments.parquet.manifest.json",
+        ]
+
+
+class TestPartitionedParquetWriter:
+    """Tests for Hive-partitioned output."""
+
+    def test_round_trip(self, tmp_path: Path, assignments: pl.DataFrame) -> None:
+        """Test that partitions read back with their keys, including unsafe values."""
+        root = tmp_path / "assignments"
+        ParquetWriter(path=str(root), partition_by=["category"]).write(assignments)
+
+        assert len(list(root.glob("category=*/part-0.parquet"))) == 3
+        result = ParquetReader(path=str(root)).read()
+        assert result.sort("STORE_NBR").equals(assignments.select(result.columns))
+
+    def test_rewrite_single_partition(self, tmp_path: Path, assignments: pl.DataFrame) -> None:
+        """Test that rewriting one partition leaves the others untouched."""
+        root = tmp_path / "assignments"
+        ParquetWriter(path=str(root), partition_by=["category"]).write(assignments)
+
+        update = assignments.filter(pl.col("category") == "Drinks/Cold").with_columns(
+            pl.lit(99, pl.Int64).alias("cluster")
+        )
+        ParquetWriter(path=str(root), partition_by=["category"]).write(update)
+
+        result = ParquetReader(path=str(root)).read()
+        assert result.height == 300
+        changed = result.filter(pl.col("category") == "Drinks/Cold")
+        assert changed["cluster"].unique().to_list() == [99]
+        assert result.filter(pl.col("category") == "Snacks & Chips")["cluster"].max() == 4
+
+    def test_partition_files_are_not_owner_only(
+        self, tmp_path: Path, assignments: pl.DataFrame
+    ) -> None:
+        """Test that partition files and the dataset manifest get the umask's mode."""
+        root = tmp_path / "assignments"
+        ParquetWriter(path=str(root), partition_by=["category"]).write(assignments)
+
+        mask = os.umask(0)
+        os.umask(mask)
+        files = [*root.glob("category=*/part-0.parquet"), manifest_path(root)]
+        assert {stat.S_IMODE(file.stat().st_mode) for file in files} == {0o666 & ~mask}
+
+    def test_missing_partition_column(self, tmp_path: Path, assignments: pl.DataFrame) -> None:
+        """Test that unknown partition columns are rejected."""
+        writer = ParquetWriter(path=str(tmp_path / "out"), partition_by=["region"])
+        with pytest.raises(ValueError, match="region"):
+            writer.write(assignments)
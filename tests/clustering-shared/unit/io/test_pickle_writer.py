@@ -86,13 +86,13 @@ class TestPickleWriter:
 
     @patch("builtins.open", new_callable=mock_open)
     @patch("pickle.dump")
-    def test_write_to_destination_dataframe(self, mock_pickle_dump, mock_file):
+    def test_write_file_dataframe(self, mock_pickle_dump, mock_file):
         """Test writing DataFrame to pickle file."""
         # Setup
         writer = PickleWriter(path="test.pkl")
         
         # Execute
-        writer._write_to_destination(self.test_df)
+        writer._write_file(self.test_df, "test.pkl")
         
         # Verify
         mock_file.assert_called_once_with("test.pkl", "wb")
@@ -109,13 +109,13 @@ class TestPickleWriter:
 
     @patch("builtins.open", new_callable=mock_open)
     @patch("pickle.dump")
-    def test_write_to_destination_dictionary(self, mock_pickle_dump, mock_file):
+    def test_write_file_dictionary(self, mock_pickle_dump, mock_file):
         """Test writing dictionary of DataFrames to pickle file."""
         # Setup
         writer = PickleWriter(path="test.pkl")
         
         # Execute
-        writer._write_to_destination(self.test_dict)
+        writer._write_file(self.test_dict, "test.pkl")
         
         # Verify
         mock_file.assert_called_once_with("test.pkl", "wb")
@@ -140,7 +140,7 @@ class TestPickleWriter:
         writer = PickleWriter(path="test.pkl", protocol=4)
         
         # Execute
-        writer._write_to_destination(self.test_df)
+        writer._write_file(self.test_df, "test.pkl")
         
         # Verify
         mock_file.assert_called_once_with("test.pkl", "wb")
@@ -0,0 +1,140 @@
+"""Tests for the reader pushdown contract."""
+
+from pathlib import Path
+
+import polars as pl
+import pydantic as pdt
+import pytest
+
+from clustering.shared.io.readers import CSVReader, ParquetReader, Reader, SnowflakeReader
+
+
+class InMemoryReader(Reader):
+    """Reader without native pushdown, returning a fixed DataFrame."""
+
+    def _read_from_source(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "id": list(range(1000)),
+                "category": ["a", "b", "c", None] * 250,
+                "value": [float(i) for i in range(1000)],
+            }
+        )
+
+
+@pytest.fixture
+def sales_frame() -> pl.DataFrame:
+    """Create a frame with several categories."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(1, 10001)),
+            "CAT_DSC": ["Snacks", "Drinks"] * 5000,
+            "TOTAL_SALES": [float(i) for i in range(10000)],
+        }
+    )
+
+
+class TestBasePushdown:
+    """Tests for the pushdown applied by the base Reader."""
+
+    def test_filters_columns_and_limit(self) -> None:
+        """Test that filters apply before the projection and the limit."""
+        reader = InMemoryReader(
+            filters=[("category", "==", "b"), ("id", ">=", 100)],
+            columns=["id", "value"],
+            limit=3,
+        )
+        result = reader.read()
+
+        assert result.columns == ["id", "value"]
+        assert result["id"].to_list() == [101, 105, 109]
+
+    def test_membership_and_null_filters(self) -> None:
+        """Test in, not in and null predicates."""
+        assert InMemoryReader(filters=[("category", "==", None)]).read().height == 250
+        assert InMemoryReader(filters=[("category", "!=", None)]).read().height == 750
+        assert InMemoryReader(filters=[("category", "in", ["a", "c"])]).read().height == 500
+        result = InMemoryReader(filters=[("category", "not in", ["a"])]).read()
+        assert set(result["category"].drop_nulls()) == {"b", "c"}
+
+    def test_sample_is_seeded(self) -> None:
+        """Test that sampling keeps roughly the fraction and is reproducible."""
+        first = InMemoryReader(sample_fraction=0.2, sample_seed=7).read()
+        second = InMemoryReader(sample_fraction=0.2, sample_seed=7).read()
+        other = InMemoryReader(sample_fraction=0.2, sample_seed=8).read()
+
+        assert 120 < first.height < 280
+        assert first.equals(second)
+        assert not first.equals(other)
+        assert first.columns == ["id", "category", "value"]
+
+    def test_invalid_options(self) -> None:
+        """Test that unknown operators and fractions out of range are rejected."""
+        with pytest.raises(pdt.ValidationError, match="Unsupported filter operator"):
+            InMemoryReader(filters=[("id", "like", "1%")])
+        with pytest.raises(pdt.ValidationError):
+            InMemoryReader(sample_fraction=1.5)
+
+
+class TestNativePushdown:
+    """Tests for readers that push the options into the source."""
+
+    def test_csv_reader(self, tmp_path: Path, sales_frame: pl.DataFrame) -> None:
+        """Test filters, projection and limit on a CSV scan."""
+        path = tmp_path / "sales.csv"
+        sales_frame.write_csv(path)
+
+        reader = CSVReader(
+            path=str(path),
+            columns=["STORE_NBR", "TOTAL_SALES", "MISSING"],
+            filters=[("CAT_DSC", "==", "Drinks")],
+            limit=2,
+        )
+        result = reader.read()
+
+        assert result.columns == ["STORE_NBR", "TOTAL_SALES"]
+        assert result["STORE_NBR"].to_list() == [2, 4]
+
+    def test_parquet_reader(self, tmp_path: Path, sales_frame: pl.DataFrame) -> None:
+        """Test filters and projection on a Parquet scan with row groups."""
+        path = tmp_path / "sales.parquet"
+        sales_frame.write_parquet(path, row_group_size=1000, statistics=True)
+
+        reader = ParquetReader(
+            path=str(path),
+            columns=["STORE_NBR"],
+            filters=[("STORE_NBR", ">", 9995)],
+        )
+        result = reader.read()
+
+        assert result.columns == ["STORE_NBR"]
+        assert result["STORE_NBR"].to_list() == [9996, 9997, 9998, 9999, 10000]
+        assert ParquetReader(path=str(path), limit=5).read().height == 5
+
+    def test_snowflake_query_without_pushdown(self) -> None:
+        """Test that the query is sent unchanged without pushdown options."""
+        reader = SnowflakeReader(query="SELECT * FROM SALES")
+        assert reader._build_query() == "SELECT * FROM SALES"
+
+    def test_snowflake_query_rewrite(self) -> None:
+        """Test that pushdown options are compiled into the query."""
+        reader = SnowflakeReader(
+            query="SELECT * FROM SALES;",
+            columns=["STORE_NBR", "CAT_DSC"],
+            filters=[
+                ("CAT_DSC", "in", ["Snacks", "Kid's"]),
+                ("TOTAL_SALES", ">=", 10.5),
+                ("REGION", "==", None),
+            ],
+            sample_fraction=0.25,
+            limit=1000,
+        )
+
+        assert reader._build_query() == (
+            'SELECT "STORE_NBR", "CAT_DSC" FROM (SELECT * FROM SALES) AS src'
+            " SAMPLE ROW (25)"
+            """ WHERE "CAT_DSC" IN ('Snacks', 'Kid''s')"""
+            ' AND "TOTAL_SALES" >= 10.5'
+            ' AND "REGION" IS NULL'
+            " LIMIT 1000"
+        )
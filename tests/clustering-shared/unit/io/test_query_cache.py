@@ -0,0 +1,114 @@
+"""Tests for the DuckDB query result cache."""
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import numpy as np
+import polars as pl
+import pytest
+
+from clustering.shared.io import QueryCache
+from clustering.shared.io.query_cache import normalize_sql
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create store sales."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": [1, 2, 3],
+            "CAT_DSC": ["Snacks", "Drinks", "Snacks"],
+            "TOTAL_SALES": [10.5, 20.0, 7.25],
+        }
+    )
+
+
+class TestNormalizeSQL:
+    """Tests for query normalization."""
+
+    def test_equivalent_spellings(self) -> None:
+        """Test that layout, comments and keyword case do not matter."""
+        query = "SELECT *\n  FROM sales -- all rows\nWHERE x = 1;"
+
+        assert normalize_sql(query) == normalize_sql("select * /* all */ from SALES where x=1")
+        assert normalize_sql(query) == "select*from sales where x=1"
+
+    def test_literals_keep_case(self) -> None:
+        """Test that string literals and quoted identifiers are kept as written."""
+        query = """SELECT "Store"  FROM t WHERE c = 'Snacks  --  Chips'"""
+
+        assert normalize_sql(query) == """select "Store" from t where c='Snacks  --  Chips'"""
+        assert normalize_sql(query) != normalize_sql(query.replace("Snacks", "snacks"))
+
+
+class TestQueryCache:
+    """Tests for storing, expiring and evicting results."""
+
+    def test_round_trip_and_metrics(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that results round-trip as native tables and lookups are counted."""
+        cache = QueryCache(cache_file=str(tmp_path / "cache.duckdb"))
+
+        assert cache.get("SELECT * FROM sales") is None
+        cache.put("SELECT * FROM sales", sales)
+        result = cache.get("select * from SALES;")
+
+        assert result.equals(sales)
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] > 0
+        with duckdb.connect(str(tmp_path / "cache.duckdb")) as conn:
+            tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+        assert f"result_{QueryCache.key('SELECT * FROM sales')[:32]}" in tables
+
+    def test_ttl(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that expired entries are misses and are removed."""
+        cache = QueryCache(cache_file=str(tmp_path / "cache.duckdb"), ttl_seconds=60)
+        cache.put("SELECT * FROM sales", sales)
+
+        with patch("time.time", return_value=time.time() + 3600):
+            assert cache.get("SELECT * FROM sales") is None
+
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that the least recently used entries are evicted over the budget."""
+        rng = np.random.default_rng(0)
+        frame = pl.DataFrame({"value": rng.random(200_000)})
+        cache = QueryCache(cache_file=str(tmp_path / "cache.duckdb"))
+        cache.put("SELECT 1", frame)
+        size = cache.stats()["size_bytes"]
+        budget = QueryCache(cache_file=cache.cache_file, max_bytes=int(size * 2.5))
+
+        budget.put("SELECT 2", frame)
+        assert budget.get("SELECT 1") is not None
+        budget.put("SELECT 3", frame)
+
+        assert budget.get("SELECT 2") is None
+        assert budget.get("SELECT 1") is not None
+        assert budget.get("SELECT 3") is not None
+        stats = budget.stats()
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] <= budget.max_bytes
+
+    def test_locked_file_is_bypassed(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that a cache held by another process is skipped instead of failing."""
+        cache = QueryCache(cache_file=str(tmp_path / "cache.duckdb"), lock_retries=2)
+        cache.put("SELECT * FROM sales", sales)
+
+        with patch("duckdb.connect", side_effect=duckdb.IOException("Could not set lock")):
+            assert cache.get("SELECT * FROM sales") is None
+            cache.put("SELECT * FROM sales", sales)
+
+    def test_clear(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that clearing removes every entry."""
+        cache = QueryCache(cache_file=str(tmp_path / "cache.duckdb"))
+        cache.put("SELECT * FROM sales", sales)
+        cache.clear()
+
+        assert cache.stats()["entries"] == 0
+        assert cache.get("SELECT * FROM sales") is None
@@ -0,0 +1,137 @@
+"""Tests for batched reads."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+import pytest
+
+from clustering.shared.io.readers import (
+    CSVReader,
+    JSONReader,
+    ParquetReader,
+    Reader,
+    SnowflakeReader,
+)
+
+
+class InMemoryReader(Reader):
+    """Reader without a native batched path."""
+
+    def _read_from_source(self) -> pl.DataFrame:
+        return pl.DataFrame({"id": list(range(25))})
+
+
+@pytest.fixture
+def sales() -> pl.DataFrame:
+    """Create store sales with a few thousand rows."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": list(range(5000)),
+            "CAT_DSC": ["Snacks", "Drinks"] * 2500,
+            "TOTAL_SALES": [float(i % 97) for i in range(5000)],
+        }
+    )
+
+
+class TestDefaultBatches:
+    """Tests for the fallback that slices a full read."""
+
+    def test_slices_full_read(self) -> None:
+        """Test that batches cover the data in order."""
+        batches = list(InMemoryReader(limit=22).read_batches(10))
+
+        assert [batch.height for batch in batches] == [10, 10, 2]
+        assert pl.concat(batches)["id"].to_list() == list(range(22))
+
+    def test_invalid_batch_size(self) -> None:
+        """Test that non-positive batch sizes are rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            next(InMemoryReader().read_batches(0))
+
+
+class TestNativeBatches:
+    """Tests for readers that read their source incrementally."""
+
+    def test_csv(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that CSV batches match a full read with the same options."""
+        path = tmp_path / "sales.csv"
+        sales.write_csv(path)
+        options = {
+            "path": str(path),
+            "filters": [("CAT_DSC", "==", "Drinks")],
+            "sample_fraction": 0.5,
+            "columns": ["STORE_NBR", "TOTAL_SALES"],
+            "limit": 700,
+        }
+
+        batches = list(CSVReader(**options).read_batches(300))
+
+        assert [batch.height for batch in batches] == [300, 300, 100]
+        assert pl.concat(batches).equals(CSVReader(**options).read())
+
+    def test_csv_limit_stops_parsing(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that a plain limit is handed to the batched reader."""
+        path = tmp_path / "sales.csv"
+        sales.write_csv(path)
+
+        with patch("polars.read_csv_batched", wraps=pl.read_csv_batched) as batched:
+            batches = list(CSVReader(path=str(path), limit=10).read_batches(1000))
+
+        assert batched.call_args.kwargs["n_rows"] == 10
+        assert pl.concat(batches)["STORE_NBR"].to_list() == list(range(10))
+
+    def test_parquet_row_groups(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that Parquet batches span row groups and honour the pushdown."""
+        path = tmp_path / "sales.parquet"
+        sales.write_parquet(path, row_group_size=1000)
+        options = {
+            "path": str(path),
+            "columns": ["STORE_NBR"],
+            "filters": [("TOTAL_SALES", "<", 10.0)],
+        }
+
+        batches = list(ParquetReader(**options).read_batches(128))
+
+        assert all(batch.height <= 128 for batch in batches)
+        assert pl.concat(batches).equals(ParquetReader(**options).read())
+
+    def test_parquet_dataset(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test batches over a hive-partitioned dataset."""
+        root = tmp_path / "sales"
+        for (category,), frame in sales.partition_by("CAT_DSC", as_dict=True).items():
+            (root / f"CAT_DSC={category}").mkdir(parents=True)
+            frame.drop("CAT_DSC").write_parquet(root / f"CAT_DSC={category}" / "0.parquet")
+
+        reader = ParquetReader(path=str(root), filters=[("CAT_DSC", "==", "Snacks")])
+        result = pl.concat(list(reader.read_batches(1000)))
+
+        assert result.height == 2500
+        assert result["CAT_DSC"].unique().to_list() == ["Snacks"]
+
+    def test_json_lines(self, tmp_path: Path, sales: pl.DataFrame) -> None:
+        """Test that JSON lines are parsed in chunks."""
+        path = tmp_path / "sales.jsonl"
+        sales.write_ndjson(path)
+
+        batches = list(JSONReader(path=str(path), limit=2100).read_batches(1000))
+
+        assert [batch.height for batch in batches] == [1000, 1000, 100]
+        assert pl.concat(batches).equals(sales.head(2100))
+
+    def test_snowflake_arrow_batches(self, sales: pl.DataFrame) -> None:
+        """Test that Snowflake results are streamed and regrouped."""
+        cursor = MagicMock()
+        cursor.fetch_arrow_batches.return_value = iter(
+            [sales.slice(0, 1500).to_arrow(), sales.slice(1500, 700).to_arrow()]
+        )
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        reader = SnowflakeReader(query="SELECT * FROM SALES", use_cache=False, limit=2200)
+
+        with patch.object(SnowflakeReader, "_create_connection", return_value=conn):
+            batches = list(reader.read_batches(1000))
+
+        cursor.execute.assert_called_once_with(reader._build_query())
+        assert [batch.height for batch in batches] == [1000, 1000, 200]
+        conn.close.assert_called_once()
@@ -603,12 +603,14 @@ class TestSnowflakeReader:
         )
         mock_pl_df = pl.from_pandas(mock_df)
         
-        # Create mock connection
+        # Create mock connection whose cursor returns the result as Arrow
         mock_conn = MagicMock()
-        
-        # Mock both pl.read_database and the _create_connection method
-        with patch('polars.read_database', return_value=mock_pl_df) as mock_read_db, \
-             patch('clustering.shared.io.readers.snowflake_reader.SnowflakeReader._create_connection', return_value=mock_conn):
+        mock_conn.is_closed.return_value = False
+        mock_cursor = mock_conn.cursor.return_value
+        mock_cursor.fetch_arrow_all.return_value = mock_pl_df.to_arrow()
+
+        # Mock the _create_connection method
+        with patch('clustering.shared.io.readers.snowflake_reader.SnowflakeReader._create_connection', return_value=mock_conn):
             
             reader = SnowflakeReader(
                 query="SELECT * FROM test_table",
@@ -625,5 +627,5 @@ class TestSnowflakeReader:
             assert "name" in result.columns
             assert "value" in result.columns
             
-            # Verify the polars.read_database was called with correct parameters
-            mock_read_db.assert_called_once_with(query="SELECT * FROM test_table", connection=mock_conn)
+            # Verify the query ran on the connection's cursor
+            mock_cursor.execute.assert_called_once_with("SELECT * FROM test_table")
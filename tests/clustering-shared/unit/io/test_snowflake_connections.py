@@ -0,0 +1,202 @@
+"""Tests for pooled Snowflake connections and the local stand-in connector."""
+
+import json
+import pickle
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import duckdb
+import polars as pl
+import pytest
+
+from clustering.shared.io import snowflake_connections
+from clustering.shared.io.readers import SnowflakeReader
+from clustering.shared.io.snowflake_connections import (
+    configure_snowflake_pool,
+    connect,
+    pooled_connection,
+)
+from clustering.shared.io.snowflake_local import LocalSnowflakeConnection
+
+
+@pytest.fixture
+def warehouse(tmp_path: Path) -> str:
+    """Create a local database holding store sales."""
+    path = str(tmp_path / "warehouse.duckdb")
+    with duckdb.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE SALES AS SELECT i AS STORE_NBR, "
+            "CASE WHEN i % 2 = 0 THEN 'Snacks' ELSE 'Drinks' END AS CAT_DSC, "
+            "i * 1.5 AS TOTAL_SALES FROM range(25000) t(i)"
+        )
+    return path
+
+
+def _connection() -> MagicMock:
+    """Create an open mock connection."""
+    conn = MagicMock()
+    conn.is_closed.return_value = False
+    return conn
+
+
+class TestPool:
+    """Tests for borrowing and returning connections."""
+
+    def test_reuses_idle_connection(self) -> None:
+        """Test that a returned connection is handed out again."""
+        factory = MagicMock(side_effect=_connection)
+
+        with pooled_connection("key", factory) as first:
+            pass
+        with pooled_connection("key", factory) as second:
+            pass
+
+        assert first is second
+        factory.assert_called_once()
+        first.close.assert_not_called()
+
+    def test_concurrent_borrowers_get_distinct_connections(self) -> None:
+        """Test that a borrowed connection is not shared."""
+        factory = MagicMock(side_effect=_connection)
+
+        with (
+            pooled_connection("key", factory) as first,
+            pooled_connection("key", factory) as second,
+        ):
+            assert first is not second
+
+    def test_failure_discards_connection(self) -> None:
+        """Test that a connection is closed, not pooled, when its block raises."""
+        factory = MagicMock(side_effect=_connection)
+
+        with pytest.raises(RuntimeError), pooled_connection("key", factory) as conn:
+            raise RuntimeError("query failed")
+
+        conn.close.assert_called_once()
+        with pooled_connection("key", factory) as other:
+            assert other is not conn
+
+    def test_skips_closed_and_limits_idle(self) -> None:
+        """Test that closed connections are dropped and idle ones are capped."""
+        configure_snowflake_pool(max_idle=1)
+        try:
+            factory = MagicMock(side_effect=_connection)
+            with (
+                pooled_connection("key", factory) as first,
+                pooled_connection("key", factory) as second,
+            ):
+                pass
+            # The second connection is returned first and fills the pool
+            first.close.assert_called_once()
+            second.close.assert_not_called()
+
+            second.is_closed.return_value = True
+            with pooled_connection("key", factory) as third:
+                assert third is not second
+        finally:
+            configure_snowflake_pool(max_idle=4)
+
+    def test_credentials_read_once(self, tmp_path: Path) -> None:
+        """Test that the key and parameters are loaded once per process."""
+        pkb_path = tmp_path / "pkb.pkl"
+        pkb_path.write_bytes(pickle.dumps(b"key"))
+        creds_path = tmp_path / "creds.json"
+        creds_path.write_text(
+            json.dumps(
+                {
+                    "SF_USER_NAME": "user",
+                    "SF_ACCOUNT": "account",
+                    "SF_DB": "db",
+                    "SF_WAREHOUSE": "wh",
+                    "SF_USER_ROLE": "role",
+                }
+            )
+        )
+
+        with patch("snowflake.connector.connect") as mock_connect:
+            connect(str(pkb_path), str(creds_path))
+            pkb_path.unlink()
+            connect(str(pkb_path), str(creds_path))
+
+        assert mock_connect.call_count == 2
+        assert mock_connect.call_args.kwargs["private_key"] == b"key"
+        assert snowflake_connections.load_credentials.cache_info().hits == 1
+
+
+class TestLocalConnector:
+    """Tests for reading through the DuckDB stand-in connector."""
+
+    def test_read(self, warehouse: str) -> None:
+        """Test that a read fetches Arrow results with the pushdown applied."""
+        reader = SnowflakeReader(
+            query="SELECT * FROM SALES",
+            local_database=warehouse,
+            use_cache=False,
+            columns=["STORE_NBR", "TOTAL_SALES"],
+            filters=[("CAT_DSC", "==", "Snacks"), ("STORE_NBR", "<", 10)],
+        )
+
+        result = reader.read()
+
+        assert result.columns == ["STORE_NBR", "TOTAL_SALES"]
+        assert result["STORE_NBR"].to_list() == [0, 2, 4, 6, 8]
+
+    def test_empty_result_keeps_columns(self, warehouse: str) -> None:
+        """Test that an empty result still has the queried columns."""
+        reader = SnowflakeReader(
+            query="SELECT STORE_NBR FROM SALES WHERE STORE_NBR < 0",
+            local_database=warehouse,
+            use_cache=False,
+        )
+
+        result = reader.read()
+
+        assert result.height == 0
+        assert result.columns == ["STORE_NBR"]
+
+    def test_batches_are_incremental(self, warehouse: str) -> None:
+        """Test that batches arrive one at a time over a pooled connection."""
+        options = {"query": "SELECT * FROM SALES", "local_database": warehouse, "use_cache": False}
+
+        with patch.object(
+            SnowflakeReader,
+            "_create_connection",
+            autospec=True,
+            side_effect=lambda self: LocalSnowflakeConnection(self.local_database, arraysize=4096),
+        ) as create:
+            batches = SnowflakeReader(**options).read_batches(5000)
+            first = next(batches)
+            assert first.height == 5000
+            assert sum(batch.height for batch in batches) == 20000
+
+            assert SnowflakeReader(**options).read().height == 25000
+
+        create.assert_called_once()
+
+    def test_readers_share_connection(self, warehouse: str) -> None:
+        """Test that readers of the same database reuse one connection."""
+        with patch(
+            "clustering.shared.io.readers.snowflake_reader.LocalSnowflakeConnection",
+            wraps=LocalSnowflakeConnection,
+        ) as local:
+            for category in ("Snacks", "Drinks"):
+                result = SnowflakeReader(
+                    query=f"SELECT * FROM SALES WHERE CAT_DSC = '{category}'",
+                    local_database=warehouse,
+                    use_cache=False,
+                ).read()
+                assert result.height == 12500
+
+        local.assert_called_once()
+
+    def test_matches_full_frame(self, warehouse: str) -> None:
+        """Test that the fetched result equals the table."""
+        with duckdb.connect(warehouse) as conn:
+            expected = conn.execute("SELECT * FROM SALES").pl()
+
+        result = SnowflakeReader(
+            query="SELECT * FROM SALES", local_database=warehouse, use_cache=False
+        ).read()
+
+        assert result.equals(expected)
+        assert isinstance(result, pl.DataFrame)
@@ -0,0 +1,198 @@
+"""Tests for bulk loading and merging with the SnowflakeWriter."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import duckdb
+import polars as pl
+import pytest
+
+from clustering.shared.io.snowflake_local import LocalSnowflakeConnection, LocalSnowflakeCursor
+from clustering.shared.io.writers import SnowflakeWriter
+
+
+@pytest.fixture
+def clusters() -> pl.DataFrame:
+    """Create merged cluster assignments."""
+    return pl.DataFrame(
+        {
+            "STORE_NBR": [1, 2, 3, 1],
+            "category": ["Snacks", "Snacks", "Snacks", "Drinks"],
+            "merged_cluster": [0, 1, 1, 2],
+            "merged_cluster_label": ["A", "B", "B", "C"],
+        }
+    )
+
+
+def _table(database: str, table: str = "CLUSTERS") -> pl.DataFrame:
+    """Read a table of the local database sorted by its keys."""
+    with duckdb.connect(database) as conn:
+        return conn.execute(f"SELECT * FROM {table} ORDER BY category, STORE_NBR").pl()
+
+
+@pytest.fixture
+def connections() -> Iterator[list[LocalSnowflakeConnection]]:
+    """Keep the local connections opened by writers for inspection."""
+    opened: list[LocalSnowflakeConnection] = []
+
+    def create(self: SnowflakeWriter) -> LocalSnowflakeConnection:
+        conn = LocalSnowflakeConnection(self.local_database)
+        opened.append(conn)
+        return conn
+
+    with patch.object(SnowflakeWriter, "_create_connection", autospec=True, side_effect=create):
+        yield opened
+
+
+class TestBulkLoad:
+    """Tests for loading through a stage."""
+
+    def test_overwrite_round_trip(self, tmp_path: Path, clusters: pl.DataFrame) -> None:
+        """Test that an overwrite replaces the table with the frame."""
+        database = str(tmp_path / "warehouse.duckdb")
+        writer = SnowflakeWriter(table="CLUSTERS", local_database=database)
+
+        writer.write(clusters.head(1))
+        writer.write(clusters)
+
+        expected = clusters.sort("category", "STORE_NBR")
+        assert _table(database).equals(expected)
+
+    def test_append(self, tmp_path: Path, clusters: pl.DataFrame) -> None:
+        """Test that rows are appended without overwrite."""
+        database = str(tmp_path / "warehouse.duckdb")
+        options = {"table": "CLUSTERS", "local_database": database, "overwrite": False}
+
+        SnowflakeWriter(**options).write(clusters.head(2))
+        SnowflakeWriter(**options).write(clusters.tail(2))
+
+        assert _table(database).height == 4
+
+    def test_chunks_are_staged_and_purged(
+        self,
+        tmp_path: Path,
+        clusters: pl.DataFrame,
+        connections: list[LocalSnowflakeConnection],
+    ) -> None:
+        """Test that the frame is uploaded in chunks and loaded with one COPY."""
+        database = str(tmp_path / "warehouse.duckdb")
+
+        SnowflakeWriter(table="CLUSTERS", local_database=database, chunk_rows=1).write(clusters)
+
+        conn = connections[0]
+        assert [name for _, name in conn.staged_files] == [
+            f"part-{i:05d}.parquet" for i in range(4)
+        ]
+        verbs = [statement.split()[0] for statement in conn.statements]
+        assert verbs == ["CREATE", "PUT", "CREATE", "COPY", "CREATE", "ALTER", "DROP", "DROP"]
+        assert conn.stages == {}
+        assert _table(database).height == 4
+
+    @pytest.mark.parametrize("auto_create_table", [True, False])
+    def test_failed_copy_keeps_previous_rows(
+        self, tmp_path: Path, clusters: pl.DataFrame, auto_create_table: bool
+    ) -> None:
+        """Test that an overwrite whose COPY fails leaves the table as it was."""
+        database = str(tmp_path / "warehouse.duckdb")
+        SnowflakeWriter(table="CLUSTERS", local_database=database).write(clusters.head(2))
+        writer = SnowflakeWriter(
+            table="CLUSTERS", local_database=database, auto_create_table=auto_create_table
+        )
+
+        with (
+            patch.object(LocalSnowflakeCursor, "_copy", side_effect=RuntimeError("COPY failed")),
+            pytest.raises(RuntimeError, match="COPY failed"),
+        ):
+            writer.write(clusters)
+
+        assert _table(database).equals(clusters.head(2).sort("category", "STORE_NBR"))
+        with duckdb.connect(database) as conn:
+            assert [row[0] for row in conn.execute("SHOW TABLES").fetchall()] == ["CLUSTERS"]
+
+    def test_overwrite_keeps_table_definition(self, tmp_path: Path, clusters: pl.DataFrame) -> None:
+        """Test that without auto_create_table the rows are replaced in the existing table."""
+        database = str(tmp_path / "warehouse.duckdb")
+        with duckdb.connect(database) as conn:
+            conn.execute(
+                'CREATE TABLE CLUSTERS ("STORE_NBR" BIGINT, "category" VARCHAR, '
+                '"merged_cluster" BIGINT, "merged_cluster_label" VARCHAR, "note" VARCHAR)'
+            )
+            conn.execute("INSERT INTO CLUSTERS VALUES (9, 'Old', 0, 'Z', 'stale')")
+
+        SnowflakeWriter(table="CLUSTERS", local_database=database, auto_create_table=False).write(
+            clusters
+        )
+
+        result = _table(database)
+        assert result.columns[-1] == "note"
+        assert result.drop("note").equals(clusters.sort("category", "STORE_NBR"))
+
+
+class TestMerge:
+    """Tests for upserting on merge keys."""
+
+    def test_upsert(self, tmp_path: Path, clusters: pl.DataFrame) -> None:
+        """Test that matching rows are updated and new rows inserted."""
+        database = str(tmp_path / "warehouse.duckdb")
+        writer = SnowflakeWriter(
+            table="CLUSTERS", local_database=database, merge_keys=["STORE_NBR", "category"]
+        )
+        writer.write(clusters.head(3))
+
+        updates = pl.DataFrame(
+            {
+                "STORE_NBR": [2, 1],
+                "category": ["Snacks", "Drinks"],
+                "merged_cluster": [5, 2],
+                "merged_cluster_label": ["E", "C"],
+            }
+        )
+        writer.write(updates)
+
+        result = _table(database)
+        assert result.height == 4
+        row = result.filter((pl.col("STORE_NBR") == 2) & (pl.col("category") == "Snacks"))
+        assert row["merged_cluster"].item() == 5
+        assert row["merged_cluster_label"].item() == "E"
+        assert result.filter(pl.col("STORE_NBR") == 3)["merged_cluster"].item() == 1
+
+    def test_updates_table_is_dropped(
+        self,
+        tmp_path: Path,
+        clusters: pl.DataFrame,
+        connections: list[LocalSnowflakeConnection],
+    ) -> None:
+        """Test that the merge goes through a temporary table that is removed."""
+        database = str(tmp_path / "warehouse.duckdb")
+        writer = SnowflakeWriter(
+            table="CLUSTERS", local_database=database, merge_keys=["STORE_NBR", "category"]
+        )
+
+        writer.write(clusters)
+
+        statements = connections[0].statements
+        assert any(statement.startswith("MERGE INTO CLUSTERS") for statement in statements)
+        assert statements[-2].startswith("DROP TABLE IF EXISTS CLUSTERS_UPDATES_")
+        with duckdb.connect(database) as conn:
+            tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+        assert tables == {"CLUSTERS"}
+
+    @pytest.mark.parametrize(
+        ("keys", "message"),
+        [
+            ([], "at least one column"),
+            (["STORE_NBR", "missing"], "not found"),
+            (["STORE_NBR"], "not unique"),
+        ],
+    )
+    def test_invalid_keys(
+        self, tmp_path: Path, clusters: pl.DataFrame, keys: list[str], message: str
+    ) -> None:
+        """Test that unusable merge keys are rejected before loading."""
+        writer = SnowflakeWriter(
+            table="CLUSTERS", local_database=str(tmp_path / "warehouse.duckdb"), merge_keys=keys
+        )
+
+        with pytest.raises(ValueError, match=message):
+            writer.write(clusters)
@@ -114,13 +114,22 @@ class TestFileWriter:
 
         # Create a concrete subclass for testing
         class ConcreteFileWriter(FileWriter):
-            def _write_to_destination(self, data: pl.DataFrame) -> None:
+            def _write_file(self, data: pl.DataFrame, path: str) -> None:
                 pass
 
         writer = ConcreteFileWriter(path="/path/to/output.txt")
         assert "ConcreteFileWriter" in str(writer)
         assert "/path/to/output.txt" in str(writer)
 
+    def test_file_writer_requires_write_file(self) -> None:
+        """Test that a FileWriter without _write_file cannot be instantiated."""
+
+        class IncompleteFileWriter(FileWriter):
+            pass
+
+        with pytest.raises(TypeError, match="_write_file"):
+            IncompleteFileWriter(path="/path/to/output.txt")
+
     def test_file_writer_directory_creation(self) -> None:
         """Test that FileWriter creates parent directories."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -132,9 +141,9 @@ class TestFileWriter:
 
             # Create a concrete subclass for testing
             class ConcreteFileWriter(FileWriter):
-                def _write_to_destination(self, data: pl.DataFrame) -> None:
+                def _write_file(self, data: pl.DataFrame, path: str) -> None:
                     # Just create an empty file
-                    with open(self.path, "w") as f:
+                    with open(path, "w") as f:
                         f.write("")
 
             # Create writer and manually ensure directories exist
@@ -600,10 +609,8 @@ class TestSnowflakeWriter:
         return pkb_path, creds_path
 
     @patch("snowflake.connector.connect")
-    @patch("snowflake.connector.pandas_tools.write_pandas")
     def test_snowflake_writer_basic(
         self, 
-        mock_write_pandas: MagicMock, 
         mock_connect: MagicMock, 
         mock_credentials: tuple[Path, Path],
         sample_dataframe: pl.DataFrame
@@ -614,6 +621,7 @@ class TestSnowflakeWriter:
         
         # Setup mock connection
         mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
         mock_connect.return_value = mock_conn
         
         # Create and use writer
@@ -636,23 +644,28 @@ class TestSnowflakeWriter:
         assert call_kwargs["role"] == "test_role"
         assert call_kwargs["insecure_mode"] is True
         
-        # Verify write_pandas was called with correct parameters
-        mock_write_pandas.assert_called_once()
-        write_kwargs = mock_write_pandas.call_args.kwargs
-        assert write_kwargs["table_name"] == "test_table"
-        assert write_kwargs["database"] == "test_database"
-        assert write_kwargs["schema"] == "test_schema"
-        assert write_kwargs["auto_create_table"] is True
-        assert write_kwargs["overwrite"] is True
+        # Verify the data was staged, loaded into a new table and swapped in
+        statements = [c.args[0] for c in mock_conn.cursor.return_value.execute.call_args_list]
+        loaded = statements[2].split()[2]
+        assert statements[0].startswith("CREATE TEMPORARY STAGE test_database.test_schema.")
+        assert statements[1].startswith("PUT 'file://")
+        assert loaded.startswith("test_database.test_schema.test_table_LOAD_")
+        assert statements[3].startswith(f"COPY INTO {loaded}")
+        assert statements[4].startswith(
+            "CREATE TABLE IF NOT EXISTS test_database.test_schema.test_table"
+        )
+        assert statements[5] == (
+            f"ALTER TABLE test_database.test_schema.test_table SWAP WITH {loaded}"
+        )
+        assert statements[6] == f"DROP TABLE IF EXISTS {loaded}"
+        assert statements[7].startswith("DROP STAGE IF EXISTS")
         
-        # Verify connection was closed
-        mock_conn.close.assert_called_once()
+        # Verify the connection was returned to the pool, not closed
+        mock_conn.close.assert_not_called()
         
     @patch("snowflake.connector.connect")
-    @patch("snowflake.connector.pandas_tools.write_pandas")
     def test_snowflake_writer_options(
         self, 
-        mock_write_pandas: MagicMock, 
         mock_connect: MagicMock, 
         mock_credentials: tuple[Path, Path],
         sample_dataframe: pl.DataFrame
@@ -663,6 +676,7 @@ class TestSnowflakeWriter:
         
         # Setup mock connection
         mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
         mock_connect.return_value = mock_conn
         
         # Create and use writer with custom options
@@ -677,10 +691,10 @@ class TestSnowflakeWriter:
         )
         writer.write(sample_dataframe)
         
-        # Verify write_pandas was called with custom parameters
-        mock_write_pandas.assert_called_once()
-        write_kwargs = mock_write_pandas.call_args.kwargs
-        assert write_kwargs["database"] == "custom_database"
-        assert write_kwargs["schema"] == "custom_schema"
-        assert write_kwargs["auto_create_table"] is False
-        assert write_kwargs["overwrite"] is False
+        # Verify the rows were appended without creating or truncating the table
+        statements = [c.args[0] for c in mock_conn.cursor.return_value.execute.call_args_list]
+        assert not any(s.startswith(("CREATE TABLE", "CREATE OR REPLACE")) for s in statements)
+        assert not any(s.startswith("TRUNCATE") for s in statements)
+        assert any(
+            s.startswith("COPY INTO custom_database.custom_schema.test_table") for s in statements
+        )